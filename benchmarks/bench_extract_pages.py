@@ -0,0 +1,96 @@
+# Büyük PDF'ten sayfa aralığı çıkarma kıyaslaması.
+# Kullanım: python benchmarks/bench_extract_pages.py [--pages 40000] [--range 10-12] [--repeat 3] [--json sonuc.json]
+#
+# pdf_core.extract_pages (dosyanın tamamı belleğe okunur, sayfa ağacı düzleştirilir) ile
+# pdf_lazy.extract_pages (mmap, /Count ile sayfa arama, yalnızca ulaşılabilen nesneler) karşılaştırılır.
+# Her ölçüm ayrı bir süreçte yapılır; böylece tepe bellek değerleri birbirini etkilemez.
+
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from pdf_fixtures import make_large_pdf  # noqa: E402
+
+SCENARIOS = ("eager", "lazy")
+
+
+def _run(scenario, source, start_page, end_page, output, queue):
+    sys.path.insert(0, ROOT)
+    import pdf_core
+    import pdf_lazy
+    import pdf_stream
+
+    baseline = pdf_stream.current_rss()
+    started = time.perf_counter()
+    if scenario == "eager":
+        pdf_core.extract_pages(source, start_page, end_page, output)
+    else:
+        pdf_lazy.extract_pages(source, start_page, end_page, output)
+    seconds = time.perf_counter() - started
+    queue.put({"seconds": seconds, "peak_rss": pdf_stream.peak_rss(), "baseline_rss": baseline})
+
+
+def measure(scenario, source, start_page, end_page, output):
+    context = multiprocessing.get_context("spawn")
+    queue = context.Queue()
+    process = context.Process(target=_run, args=(scenario, source, start_page, end_page, output, queue))
+    process.start()
+    result = queue.get()
+    process.join()
+    result["output_bytes"] = os.path.getsize(output)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Page-range extraction benchmark")
+    parser.add_argument("--pages", type=int, default=40000, help="pages in the synthetic source PDF")
+    parser.add_argument("--range", default="10-12", help="1-based inclusive page range to extract")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--source", help="use an existing PDF instead of generating one")
+    parser.add_argument("--json", help="write measurements to this file")
+    args = parser.parse_args()
+    start_page, end_page = (int(part) for part in args.range.split("-"))
+
+    with tempfile.TemporaryDirectory() as directory:
+        source = args.source
+        if source is None:
+            source = os.path.join(directory, "source.pdf")
+            started = time.perf_counter()
+            size = make_large_pdf(source, pages=args.pages)
+            print(f"generated {args.pages} pages ({size / 1024 / 1024:.1f} MB) in {time.perf_counter() - started:.1f}s")
+
+        report = []
+        print(f"{'path':<8}{'best s':>10}{'peak RSS MB':>14}{'delta MB':>11}{'output KB':>11}")
+        for scenario in SCENARIOS:
+            runs = [
+                measure(scenario, source, start_page, end_page, os.path.join(directory, f"{scenario}.pdf"))
+                for _ in range(args.repeat)
+            ]
+            best = min(runs, key=lambda run: run["seconds"])
+            peak = max(run["peak_rss"] or 0 for run in runs)
+            delta = max((run["peak_rss"] or 0) - (run["baseline_rss"] or 0) for run in runs)
+            report.append({
+                "scenario": scenario, "pages": args.pages, "range": args.range,
+                "seconds": best["seconds"], "peak_rss": peak, "delta_rss": delta,
+                "output_bytes": best["output_bytes"],
+            })
+            print(f"{scenario:<8}{best['seconds']:10.3f}{peak / 1024 / 1024:14.1f}"
+                  f"{delta / 1024 / 1024:11.1f}{best['output_bytes'] / 1024:11.1f}")
+
+        eager, lazy = report
+        print(f"lazy is {eager['seconds'] / lazy['seconds']:.1f}x faster")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as output:
+            json.dump(report, output, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,362 @@
+# Bölme, birleştirme ve görsel -> PDF işlemleri için kıyaslama paketi.
+# Kullanım: python benchmarks/bench_pdf_ops.py [--scale 1.0] [--repeat 3] [--scenarios merge,merge_fonts]
+#           [--corpus klasör] [--json sonuc.json] [--compare onceki.json]
+#           [--time-threshold 0.15] [--memory-threshold 0.25]
+#
+# Sentetik bir derlem (çok sayfalı, derin sayfa ağaçlı, büyük görselli, çok fontlu ve derin nesne zincirli
+# PDF'ler ile JPEG/PNG görsel kümeleri) üretilir ve --corpus verilirse sonraki çalıştırmalar için saklanır.
+# Her senaryo her tekrarda ayrı bir süreçte çalışır; süre ve tepe bellek (ana süreç ve alt süreçler ayrı) ölçülür.
+# --json sonuçları yazar, --compare önceki bir sonuç dosyasıyla karşılaştırır ve eşiği aşan yavaşlama veya
+# bellek artışı varsa 1 ile çıkar.
+
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import pdf_fixtures  # noqa: E402
+
+try:
+    import resource
+    RSS_AVAILABLE = True
+except ImportError:
+    RSS_AVAILABLE = False
+
+DEFAULT_TIME_THRESHOLD = 0.15     # %15'ten fazla yavaşlama gerileme sayılır
+DEFAULT_MEMORY_THRESHOLD = 0.25   # Tepe bellekte %25'ten fazla artış gerileme sayılır
+TIME_SLACK = 0.01                 # Bundan küçük süre farkları (saniye) gürültü kabul edilir
+MEMORY_SLACK = 8 * 1024 * 1024    # Bundan küçük bellek farkları (bayt) gürültü kabul edilir
+
+
+def corpus_spec(scale):
+    """Derlemdeki her dosyanın üreticisini ve parametrelerini döndürür: {ad: (üretici, parametreler)}."""
+    def n(value, minimum=1):
+        return max(minimum, int(value * scale))
+
+    return {
+        "pages": ("make_large_pdf", {"pages": n(4000, 20), "fanout": 32}),
+        "large": ("make_large_pdf", {"pages": n(40000, 200), "fanout": 32}),
+        "deep_tree": ("make_large_pdf", {"pages": n(4000, 20), "fanout": 2, "seed": 1}),
+        "images": ("make_image_pdf", {"pages": n(20, 2)}),
+        # Aynı tohum aynı fontları üretir; iki dosyanın birleştirilmesi tekilleştirmeyi ölçer
+        "fonts_a": ("make_font_pdf", {"pages": n(200, 4), "fonts": 100}),
+        "fonts_b": ("make_font_pdf", {"pages": n(150, 3), "fonts": 100}),
+        "deep_graph": ("make_deep_pdf", {"pages": n(200, 4), "depth": 200}),
+        # Sayfaya sığan görseller doğrudan aktarılır, büyük fotoğraflar küçültülüp yeniden kodlanır
+        "jpeg_set": ("make_image_set", {"count": n(20, 2), "size": [1200, 900], "kind": "jpeg"}),
+        "png_set": ("make_image_set", {"count": n(20, 2), "size": [1200, 900], "kind": "png"}),
+        "photo_set": ("make_image_set", {"count": n(20, 2), "size": [3200, 2400], "kind": "jpeg", "seed": 1}),
+    }
+
+
+def build_corpus(directory, spec):
+    """
+    Derlemi directory'de üretir ve {ad: yol} döndürür. Parametreleri değişmemiş ve dosyası duran girdiler
+    yeniden üretilmez (corpus.json'da saklanır).
+    """
+    os.makedirs(directory, exist_ok=True)
+    manifest_path = os.path.join(directory, "corpus.json")
+    try:
+        with open(manifest_path, encoding="utf-8") as manifest:
+            built = json.load(manifest)
+    except (OSError, ValueError):
+        built = {}
+
+    paths = {}
+    for name, (generator, params) in spec.items():
+        is_image_set = generator == "make_image_set"
+        path = os.path.join(directory, name if is_image_set else f"{name}.pdf")
+        if built.get(name) != [generator, params] or not os.path.exists(path):
+            started = time.perf_counter()
+            if is_image_set:
+                shutil.rmtree(path, ignore_errors=True)
+                pdf_fixtures.make_image_set(path, **dict(params, size=tuple(params["size"])))
+            else:
+                getattr(pdf_fixtures, generator)(path, **params)
+            print(f"generated {name} in {time.perf_counter() - started:.1f}s", file=sys.stderr)
+            built[name] = [generator, params]
+            with open(manifest_path, "w", encoding="utf-8") as manifest:
+                json.dump(built, manifest, indent=2)
+        paths[name] = sorted(os.path.join(path, entry) for entry in os.listdir(path)) if is_image_set else path
+    return paths
+
+
+# --- Senaryolar ---
+# Her senaryo (derlem yolları, çıktı klasörü) alır ve ayrı bir süreçte çalışır; modüller içeride yüklenir
+# ki yükleme süresi ölçüme girmesin.
+
+def _split(source, chunk, output_dir, workers=1):
+    import pdf_core
+    reader = pdf_core.open_pdf(source)
+    ranges = pdf_core.every_n_pages(chunk, len(reader.pages))
+    outputs = pdf_core.range_output_names(ranges, output_dir, "part")
+    return lambda: pdf_core.split_pdf(reader, ranges, outputs, workers=workers)
+
+
+def _prepare(name, corpus, output_dir):
+    """Senaryonun ölçülecek çağrısını hazırlar; dosya açma gibi hazırlık adımları ölçüme dahil değildir."""
+    import pdf_core
+    import pdf_lazy
+    import pdf_stream
+    output = os.path.join(output_dir, "output.pdf")
+    cpus = os.cpu_count() or 1
+
+    if name == "split":
+        return _split(corpus["pages"], 10, output_dir)
+    if name == "split_parallel":
+        return _split(corpus["pages"], 10, output_dir, workers=cpus)
+    if name == "split_deep_tree":
+        return _split(corpus["deep_tree"], 100, output_dir)
+    if name == "split_deep_graph":
+        return _split(corpus["deep_graph"], 10, output_dir)
+    if name == "extract_eager":
+        return lambda: pdf_core.extract_pages(corpus["large"], 100, 120, output)
+    if name == "extract_lazy":
+        return lambda: pdf_lazy.extract_pages(corpus["large"], 100, 120, output)
+    if name == "merge":
+        return lambda: pdf_core.merge_pdfs([corpus["pages"], corpus["deep_tree"], corpus["deep_graph"]], output)
+    if name == "merge_parallel":
+        sources = [corpus["pages"], corpus["deep_tree"], corpus["deep_graph"]] * 4
+        return lambda: pdf_core.parallel_merge_pdfs(sources, output, workers=cpus)
+    if name == "merge_stream":
+        sources = [corpus["pages"], corpus["deep_tree"], corpus["deep_graph"]] * 4
+        return lambda: pdf_stream.stream_merge_pdfs(sources, output)
+    if name == "merge_fonts":
+        return lambda: pdf_core.merge_pdfs([corpus["fonts_a"], corpus["fonts_b"]], output)
+    if name == "merge_fonts_dedup":
+        return lambda: pdf_stream.stream_merge_pdfs([corpus["fonts_a"], corpus["fonts_b"]], output, dedup=True)
+    if name == "merge_images":
+        return lambda: pdf_core.merge_pdfs([corpus["images"], corpus["images"]], output)
+
+    import image_core
+    image_sets = {"images_jpeg": "jpeg_set", "images_png": "png_set", "images_resample": "photo_set"}
+    return lambda: image_core.convert_images_to_pdf(corpus[image_sets[name]], output, workers=cpus)
+
+
+SCENARIOS = {
+    "split": "split_pdf, every 10 pages",
+    "split_parallel": "split_pdf, every 10 pages, one writer thread per CPU",
+    "split_deep_tree": "split_pdf, every 100 pages of a binary page tree",
+    "split_deep_graph": "split_pdf, pages with 200-deep object chains",
+    "extract_eager": "pdf_core.extract_pages, 21 pages from the large PDF",
+    "extract_lazy": "pdf_lazy.extract_pages, 21 pages from the large PDF",
+    "merge": "merge_pdfs, three PDFs",
+    "merge_parallel": "parallel_merge_pdfs, 12 PDFs",
+    "merge_stream": "stream_merge_pdfs, 12 PDFs",
+    "merge_fonts": "merge_pdfs, two PDFs sharing 100 embedded fonts",
+    "merge_fonts_dedup": "stream_merge_pdfs with dedup, same inputs",
+    "merge_images": "merge_pdfs, large embedded images",
+    "images_jpeg": "convert_images_to_pdf, JPEGs embedded as-is",
+    "images_png": "convert_images_to_pdf, PNGs embedded as-is",
+    "images_resample": "convert_images_to_pdf, large photos downscaled and re-encoded",
+}
+IMAGE_SCENARIOS = ("images_jpeg", "images_png", "images_resample")
+
+
+def _max_rss(who):
+    if not RSS_AVAILABLE:
+        return None
+    peak = resource.getrusage(who).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _peak_rss():
+    # Linux'ta ru_maxrss fork/exec boyunca üst süreçten devralınır (derlemi üreten süreç büyükse tüm ölçümler
+    # onun değerini gösterir); VmHWM ise exec ile sıfırlanır
+    try:
+        with open("/proc/self/status") as status:
+            for line in status:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError):
+        pass
+    return _max_rss(resource.RUSAGE_SELF) if RSS_AVAILABLE else None
+
+
+def _run(name, corpus, output_dir, queue):
+    sys.path.insert(0, ROOT)
+    import pdf_stream
+    try:
+        call = _prepare(name, corpus, output_dir)
+        baseline = pdf_stream.current_rss()
+        started = time.perf_counter()
+        call()
+        seconds = time.perf_counter() - started
+        queue.put({
+            "seconds": seconds,
+            "peak_rss": _peak_rss(),
+            "baseline_rss": baseline,
+            "children_peak_rss": _max_rss(resource.RUSAGE_CHILDREN) if RSS_AVAILABLE else None,
+        })
+    except Exception as e:
+        queue.put({"error": f"{type(e).__name__}: {e}"})
+
+
+def _directory_size(directory):
+    return sum(entry.stat().st_size for entry in os.scandir(directory) if entry.is_file())
+
+
+def measure(name, corpus, work_dir):
+    """Senaryoyu yeni bir süreçte bir kez çalıştırır ve ölçümleri döndürür."""
+    output_dir = tempfile.mkdtemp(dir=work_dir)
+    try:
+        context = multiprocessing.get_context("spawn")
+        queue = context.Queue()
+        process = context.Process(target=_run, args=(name, corpus, output_dir, queue))
+        process.start()
+        result = queue.get()
+        process.join()
+        result["output_bytes"] = _directory_size(output_dir)
+        return result
+    finally:
+        shutil.rmtree(output_dir, ignore_errors=True)
+
+
+def summarize(runs):
+    """Tekrarlardan en iyi ve ortanca süreyi, en yüksek bellek değerlerini çıkarır."""
+    seconds = [run["seconds"] for run in runs]
+
+    def highest(key):
+        values = [run[key] for run in runs if run.get(key) is not None]
+        return max(values) if values else None
+
+    peak, baseline = highest("peak_rss"), highest("baseline_rss")
+    return {
+        "seconds": min(seconds),
+        "median_seconds": statistics.median(seconds),
+        "runs": seconds,
+        "peak_rss": peak,
+        "delta_rss": max((run["peak_rss"] or 0) - (run["baseline_rss"] or 0) for run in runs) if peak else None,
+        "children_peak_rss": highest("children_peak_rss"),
+        "output_bytes": runs[0]["output_bytes"],
+    }
+
+
+def compare(baseline, current, time_threshold=DEFAULT_TIME_THRESHOLD, memory_threshold=DEFAULT_MEMORY_THRESHOLD):
+    """
+    İki sonuç dosyasının ortak senaryolarını karşılaştırır. (satırlar, gerilemeler) döndürür.
+    Süre için en iyi tekrar, bellek için ana sürecin tepe değeri kullanılır; küçük mutlak farklar yok sayılır.
+    """
+    rows, regressions = [], []
+    for name, result in current["results"].items():
+        base = baseline.get("results", {}).get(name)
+        if base is None or "error" in result or "error" in base:
+            continue
+        time_ratio = result["seconds"] / base["seconds"] if base["seconds"] else 1.0
+        slower = (time_ratio > 1 + time_threshold and result["seconds"] - base["seconds"] > TIME_SLACK)
+        memory_ratio, bigger = None, False
+        if result.get("peak_rss") and base.get("peak_rss"):
+            memory_ratio = result["peak_rss"] / base["peak_rss"]
+            bigger = (memory_ratio > 1 + memory_threshold and result["peak_rss"] - base["peak_rss"] > MEMORY_SLACK)
+        rows.append((name, base["seconds"], result["seconds"], time_ratio, memory_ratio, slower, bigger))
+        if slower:
+            regressions.append(f"{name}: {time_ratio:.2f}x time ({base['seconds']:.3f}s -> {result['seconds']:.3f}s)")
+        if bigger:
+            regressions.append(f"{name}: {memory_ratio:.2f}x peak memory")
+    return rows, regressions
+
+
+def _versions():
+    versions = {"python": platform.python_version()}
+    for module in ("PyPDF2", "PIL"):
+        try:
+            versions[module] = __import__(module).__version__
+        except (ImportError, AttributeError):
+            versions[module] = None
+    return versions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks for split/merge/images-to-PDF on a synthetic corpus")
+    parser.add_argument("--scale", type=float, default=1.0, help="corpus size multiplier (0.1 for a quick run)")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per scenario, each in a fresh process")
+    parser.add_argument("--scenarios", help="comma-separated scenario names (default: all)")
+    parser.add_argument("--corpus", help="keep the generated corpus in this directory and reuse it next time")
+    parser.add_argument("--json", help="write results to this file")
+    parser.add_argument("--compare", help="compare with an earlier --json result and fail on regressions")
+    parser.add_argument("--time-threshold", type=float, default=DEFAULT_TIME_THRESHOLD)
+    parser.add_argument("--memory-threshold", type=float, default=DEFAULT_MEMORY_THRESHOLD)
+    parser.add_argument("--list", action="store_true", help="list scenarios and exit")
+    args = parser.parse_args()
+
+    if args.list:
+        for name, description in SCENARIOS.items():
+            print(f"{name:<20}{description}")
+        return 0
+    names = list(SCENARIOS) if not args.scenarios else [name.strip() for name in args.scenarios.split(",")]
+    unknown = [name for name in names if name not in SCENARIOS]
+    if unknown:
+        parser.error(f"unknown scenarios: {', '.join(unknown)}")
+    if not pdf_fixtures.PIL_AVAILABLE:
+        skipped = [name for name in names if name in IMAGE_SCENARIOS]
+        if skipped:
+            print(f"skipping {', '.join(skipped)}: Pillow is not installed", file=sys.stderr)
+        names = [name for name in names if name not in IMAGE_SCENARIOS]
+
+    spec = corpus_spec(args.scale)
+    if not pdf_fixtures.PIL_AVAILABLE:
+        spec = {name: entry for name, entry in spec.items() if entry[0] != "make_image_set"}
+    work_dir = tempfile.mkdtemp(prefix="pdfworks-bench-")
+    try:
+        corpus = build_corpus(args.corpus or os.path.join(work_dir, "corpus"), spec)
+        report = {
+            "meta": {
+                "created": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+                "platform": platform.platform(),
+                "cpus": os.cpu_count(),
+                "versions": _versions(),
+                "scale": args.scale,
+                "repeat": args.repeat,
+                "corpus": spec,
+            },
+            "results": {},
+        }
+        print(f"{'scenario':<20}{'best s':>9}{'median s':>10}{'peak RSS MB':>13}{'delta MB':>10}{'output MB':>11}")
+        for name in names:
+            runs = [measure(name, corpus, work_dir) for _ in range(args.repeat)]
+            errors = [run["error"] for run in runs if "error" in run]
+            if errors:
+                report["results"][name] = {"error": errors[0]}
+                print(f"{name:<20}error: {errors[0]}")
+                continue
+            result = report["results"][name] = summarize(runs)
+            print(f"{name:<20}{result['seconds']:9.3f}{result['median_seconds']:10.3f}"
+                  f"{(result['peak_rss'] or 0) / 1024 / 1024:13.1f}{(result['delta_rss'] or 0) / 1024 / 1024:10.1f}"
+                  f"{result['output_bytes'] / 1024 / 1024:11.1f}")
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as output:
+            json.dump(report, output, indent=2)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as baseline_file:
+            baseline = json.load(baseline_file)
+        # Demetler JSON'da listeye dönüştüğünden karşılaştırma JSON biçimleri üzerinden yapılır
+        if baseline.get("meta", {}).get("corpus") != json.loads(json.dumps(report["meta"]["corpus"])):
+            print("warning: baseline was measured on a different corpus (--scale or generator changed)",
+                  file=sys.stderr)
+        rows, regressions = compare(baseline, report, args.time_threshold, args.memory_threshold)
+        print(f"\n{'scenario':<20}{'base s':>9}{'now s':>9}{'time':>8}{'memory':>8}")
+        for name, base_seconds, seconds, time_ratio, memory_ratio, slower, bigger in rows:
+            memory = f"{memory_ratio:.2f}x" if memory_ratio is not None else "-"
+            flag = " REGRESSION" if slower or bigger else ""
+            print(f"{name:<20}{base_seconds:9.3f}{seconds:9.3f}{time_ratio:7.2f}x{memory:>8}{flag}")
+        if regressions:
+            print("\nregressions:\n  " + "\n  ".join(regressions), file=sys.stderr)
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,78 @@
+# Sonuç sayfası ayrıştırma kıyaslaması.
+# Kullanım: python benchmarks/bench_serp_parse.py [--results 20] [--repeat 50] [--json sonuc.json]
+#
+# serp_parser.parse ile, önceki BeautifulSoup tabanlı yaklaşımın maliyet yapısını (tam soup oluşturma,
+# her kapsayıcı seçicisi için ayrı select ve tüm bağlantılar üzerinde ikinci geçiş) karşılaştırır.
+
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import serp_parser  # noqa: E402
+from serp_fixtures import ENGINES, all_fixtures  # noqa: E402
+
+try:
+    from bs4 import BeautifulSoup
+    BS4_AVAILABLE = True
+except ImportError:
+    BS4_AVAILABLE = False
+
+LEGACY_SELECTORS = {
+    "Google": ['div.g', 'div.MjjYud', 'div.Gx5Zad', 'div.tF2Cxc', 'div[data-hveid]', 'a[href*=".pdf"]'],
+    "Bing": ['li.b_algo', 'div.b_title', '.b_algo'],
+    "DuckDuckGo": ['.result', '.links_main', '.result__body'],
+    "Yandex": ['.serp-item', '.organic', '.search-result'],
+}
+
+
+def legacy_parse(engine, html):
+    # Eski ayrıştırıcıların yaptığı işlerin karşılığı: tüm seçiciler önceden çalıştırılır, ardından tüm bağlantılar taranır
+    soup = BeautifulSoup(html, 'lxml')
+    selections = [soup.select(selector) for selector in LEGACY_SELECTORS[engine]]
+    containers = next((selection for selection in selections if selection), [])
+    links = [link for container in containers for link in container.find_all('a', href=True)]
+    links.extend(soup.find_all('a', href=True))
+    return links
+
+
+def measure(func, engine, html, repeat):
+    func(engine, html)  # ısınma
+    started = time.perf_counter()
+    for _ in range(repeat):
+        func(engine, html)
+    return (time.perf_counter() - started) / repeat * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="SERP parse benchmark")
+    parser.add_argument("--results", type=int, default=20, help="results per synthetic page")
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--json", help="write measurements to this file")
+    args = parser.parse_args()
+
+    fixtures = all_fixtures(args.results)
+    report = []
+    print(f"{'engine':<12}{'KB':>8}{'hits':>6}{'serp_parser ms':>16}{'legacy bs4 ms':>15}{'speedup':>9}")
+    for engine in ENGINES:
+        html = fixtures[engine]
+        hits = len(serp_parser.parse(engine, html).results)
+        parse_ms = measure(serp_parser.parse, engine, html, args.repeat)
+        legacy_ms = measure(legacy_parse, engine, html, args.repeat) if BS4_AVAILABLE else None
+        report.append({
+            "engine": engine, "bytes": len(html.encode()), "hits": hits,
+            "parse_ms": parse_ms, "legacy_ms": legacy_ms,
+        })
+        legacy = f"{legacy_ms:15.2f}{legacy_ms / parse_ms:8.1f}x" if legacy_ms else f"{'-':>15}{'-':>9}"
+        print(f"{engine:<12}{len(html.encode()) / 1024:8.0f}{hits:6d}{parse_ms:16.2f}{legacy}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as output:
+            json.dump(report, output, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,248 @@
+# Kıyaslamalar için sentetik PDF üreticisi.
+# Gerçek arşivlerdeki gibi dengeli bir sayfa ağacı (/Pages düğümleri fanout kadar çocuk taşır), kök düğümden
+# devralınan ortak font kaynağı ve her sayfa için ayrı bir içerik akışı yazar. Dosya, sayfalar üretildikçe
+# doğrudan diske yazılır; aynı tohum (seed) her zaman aynı dosyayı üretir.
+# Diğer üreticiler işlemlerin farklı maliyetlerini öne çıkarır: büyük gömülü görseller, her sayfada farklı
+# gömülü fontlar, derin nesne zincirleri ve görsel -> PDF dönüşümü için JPEG/PNG görsel kümeleri.
+
+import itertools
+import os
+import random
+import zlib
+
+# Görsel kümeleri için Pillow (opsiyonel)
+try:
+    from PIL import Image
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+
+WORDS = ("tez", "makale", "rapor", "analiz", "veri", "model", "sistem", "yöntem", "dergi", "bildiri")
+
+
+def _content(rng, index, page_bytes):
+    lines = [b"BT /F1 12 Tf 72 740 Td (Page %d) Tj ET" % (index + 1)]
+    y = 720
+    while sum(len(line) + 1 for line in lines) < page_bytes and y > 40:
+        text = " ".join(rng.choices(WORDS, k=8)).encode("latin-1", "replace")
+        lines.append(b"BT /F1 10 Tf 72 %d Td (%s) Tj ET" % (y, text))
+        y -= 14
+    return b"\n".join(lines)
+
+
+def make_large_pdf(path, pages=40000, fanout=32, page_bytes=1024, seed=0):
+    """pages sayfalık PDF'i path'e yazar ve dosya boyutunu döndürür."""
+    rng = random.Random(seed)
+    numbers = itertools.count(4)  # 1: katalog, 2: kök sayfa düğümü, 3: ortak font
+    page_objects = [(next(numbers), next(numbers)) for _ in range(pages)]  # (sayfa, içerik akışı)
+
+    # Sayfa ağacını alttan üste kur
+    parents = {}
+    nodes = []  # (numara, çocuklar, sayfa sayısı)
+    level = [page for page, _ in page_objects]
+    counts = [1] * pages
+    while len(level) > fanout:
+        next_level, next_counts = [], []
+        for start in range(0, len(level), fanout):
+            number = next(numbers)
+            kids = level[start:start + fanout]
+            count = sum(counts[start:start + fanout])
+            nodes.append((number, kids, count))
+            for kid in kids:
+                parents[kid] = number
+            next_level.append(number)
+            next_counts.append(count)
+        level, counts = next_level, next_counts
+    for kid in level:
+        parents[kid] = 2
+
+    offsets = {}
+    with open(path, "wb") as output:
+        def write_object(number, body):
+            offsets[number] = output.tell()
+            output.write(b"%d 0 obj\n" % number + body + b"\nendobj\n")
+
+        def refs(numbers_):
+            return b" ".join(b"%d 0 R" % number for number in numbers_)
+
+        output.write(b"%PDF-1.7\n%\xe2\xe3\xcf\xd3\n")
+        write_object(1, b"<< /Type /Catalog /Pages 2 0 R >>")
+        write_object(
+            2,
+            b"<< /Type /Pages /Kids [ %s ] /Count %d /MediaBox [ 0 0 612 792 ]"
+            b" /Resources << /Font << /F1 3 0 R >> >> >>" % (refs(level), pages),
+        )
+        write_object(3, b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+        for number, kids, count in nodes:
+            write_object(
+                number,
+                b"<< /Type /Pages /Parent %d 0 R /Kids [ %s ] /Count %d >>" % (parents[number], refs(kids), count),
+            )
+        for index, (page, content) in enumerate(page_objects):
+            write_object(page, b"<< /Type /Page /Parent %d 0 R /Contents %d 0 R >>" % (parents[page], content))
+            data = _content(rng, index, page_bytes)
+            write_object(content, b"<< /Length %d >>\nstream\n" % len(data) + data + b"\nendstream")
+
+        size = max(offsets) + 1
+        xref_offset = output.tell()
+        output.write(b"xref\n0 %d\n0000000000 65535 f\r\n" % size)
+        for number in range(1, size):
+            output.write(b"%010d 00000 n\r\n" % offsets[number])
+        output.write(b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (size, xref_offset))
+        return output.tell()
+
+
+class _PdfFile:
+    """Nesneleri sırayla diske yazan ve kapanışta xref tablosunu ekleyen küçük yardımcı."""
+
+    def __init__(self, path):
+        self._output = open(path, "wb")
+        self._offsets = {}
+        self._numbers = itertools.count(3)  # 1: katalog, 2: kök sayfa düğümü
+        self._output.write(b"%PDF-1.7\n%\xe2\xe3\xcf\xd3\n")
+
+    def reserve(self):
+        return next(self._numbers)
+
+    def write(self, body, number=None):
+        number = number or self.reserve()
+        self._offsets[number] = self._output.tell()
+        self._output.write(b"%d 0 obj\n" % number + body + b"\nendobj\n")
+        return number
+
+    def write_stream(self, data, entries=b"", number=None):
+        return self.write(b"<< %s /Length %d >>\nstream\n" % (entries, len(data)) + data + b"\nendstream", number)
+
+    def close(self, pages):
+        """Düz bir sayfa ağacı ve katalog yazar, dosyayı kapatır ve boyutunu döndürür."""
+        self.write(b"<< /Type /Pages /Kids [ %s ] /Count %d /MediaBox [ 0 0 612 792 ] >>"
+                   % (b" ".join(b"%d 0 R" % page for page in pages), len(pages)), 2)
+        self.write(b"<< /Type /Catalog /Pages 2 0 R >>", 1)
+        size = max(self._offsets) + 1
+        xref_offset = self._output.tell()
+        self._output.write(b"xref\n0 %d\n0000000000 65535 f\r\n" % size)
+        for number in range(1, size):
+            offset = self._offsets.get(number)
+            self._output.write(b"0000000000 00000 f\r\n" if offset is None else b"%010d 00000 n\r\n" % offset)
+        self._output.write(b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (size, xref_offset))
+        size = self._output.tell()
+        self._output.close()
+        return size
+
+
+def _noise(rng, size):
+    # Sıkıştırılamayan bayt dizisi; büyük görsellerin ve gömülü font programlarının yerine geçer
+    return rng.getrandbits(size * 8).to_bytes(size, "little") if size else b""
+
+
+def make_image_pdf(path, pages=20, width=1600, height=1200, seed=0):
+    """Her sayfasında width x height RGB bir görsel (Flate ile sıkıştırılmış gürültü ve renk geçişi) olan PDF yazar."""
+    rng = random.Random(seed)
+    pdf = _PdfFile(path)
+    # Satırların yarısı gürültü, yarısı düz geçiş: sıkıştırma oranı gerçek taramalara yakın kalır
+    gradient = bytes(x * 255 // max(1, width - 1) for x in range(width)) * 3
+    page_numbers = []
+    for index in range(pages):
+        rows = [_noise(rng, width * 3) if row % 2 else gradient for row in range(height)]
+        image = pdf.write_stream(
+            zlib.compress(b"".join(rows), 1),
+            b"/Type /XObject /Subtype /Image /Width %d /Height %d /ColorSpace /DeviceRGB"
+            b" /BitsPerComponent 8 /Filter /FlateDecode" % (width, height),
+        )
+        content = pdf.write_stream(b"q 540 0 0 405 36 300 cm /Im0 Do Q BT /F1 12 Tf 72 740 Td (Image %d) Tj ET"
+                                   % (index + 1))
+        page_numbers.append(pdf.write(
+            b"<< /Type /Page /Parent 2 0 R /Contents %d 0 R /Resources << /XObject << /Im0 %d 0 R >> >> >>"
+            % (content, image)
+        ))
+    return pdf.close(page_numbers)
+
+
+def make_font_pdf(path, pages=100, fonts=100, fonts_per_page=8, font_bytes=16 * 1024, seed=0):
+    """
+    fonts farklı gömülü fonttan her sayfada fonts_per_page tanesini kullanan PDF yazar.
+    Font programları rastgele baytlardır (yalnızca kopyalama ve tekilleştirme maliyeti için); aynı tohumla
+    üretilen iki dosya aynı fontları içerir, bu da birleştirmede tekilleştirmeyi ölçmeyi sağlar.
+    """
+    rng = random.Random(seed)
+    pdf = _PdfFile(path)
+    font_numbers = []
+    for index in range(fonts):
+        program = pdf.write_stream(zlib.compress(_noise(rng, font_bytes), 1), b"/Filter /FlateDecode")
+        descriptor = pdf.write(
+            b"<< /Type /FontDescriptor /FontName /Bench%d /Flags 32 /FontBBox [ 0 -200 1000 900 ]"
+            b" /ItalicAngle 0 /Ascent 900 /Descent -200 /CapHeight 700 /StemV 80 /FontFile %d 0 R >>"
+            % (index, program)
+        )
+        widths = b" ".join(b"%d" % rng.randint(250, 750) for _ in range(95))
+        font_numbers.append(pdf.write(
+            b"<< /Type /Font /Subtype /Type1 /BaseFont /Bench%d /FirstChar 32 /LastChar 126"
+            b" /Widths [ %s ] /FontDescriptor %d 0 R >>" % (index, widths, descriptor)
+        ))
+
+    page_numbers = []
+    for index in range(pages):
+        used = rng.sample(range(fonts), min(fonts_per_page, fonts))
+        names = b" ".join(b"/F%d %d 0 R" % (slot, font_numbers[font]) for slot, font in enumerate(used))
+        text = b"\n".join(b"BT /F%d 11 Tf 72 %d Td (%s) Tj ET"
+                          % (slot, 740 - slot * 16, " ".join(rng.choices(WORDS, k=6)).encode("latin-1", "replace"))
+                          for slot in range(len(used)))
+        content = pdf.write_stream(text)
+        page_numbers.append(pdf.write(
+            b"<< /Type /Page /Parent 2 0 R /Contents %d 0 R /Resources << /Font << %s >> >> >>" % (content, names)
+        ))
+    return pdf.close(page_numbers)
+
+
+def make_deep_pdf(path, pages=200, depth=200, seed=0):
+    """
+    Her sayfanın kaynakları depth uzunluğunda bir dolaylı nesne zincirine (/Properties -> /Next -> ...)
+    bağlanan PDF yazar. Zincirin ilk yarısı sayfaya özgü, ikinci yarısı tüm sayfalarca paylaşılır;
+    böylece hem derin özyineleme hem de ortak alt grafiklerin tekrar ziyaret edilmesi ölçülür.
+    """
+    rng = random.Random(seed)
+    pdf = _PdfFile(path)
+    shared = None
+    for level in range(depth // 2):
+        link = b" /Next %d 0 R" % shared if shared else b""
+        shared = pdf.write(b"<< /Level %d /Value %d%s >>" % (level, rng.randint(0, 1 << 30), link))
+
+    page_numbers = []
+    for index in range(pages):
+        node = shared
+        for level in range(depth - depth // 2):
+            link = b" /Next %d 0 R" % node if node else b""
+            node = pdf.write(b"<< /Page %d /Level %d /Value %d%s >>" % (index, level, rng.randint(0, 1 << 30), link))
+        data = _content(rng, index, 256)
+        content = pdf.write_stream(data)
+        page_numbers.append(pdf.write(
+            b"<< /Type /Page /Parent 2 0 R /Contents %d 0 R"
+            b" /Resources << /Font << /F1 << /Type /Font /Subtype /Type1 /BaseFont /Helvetica >> >>"
+            b" /Properties << /P0 %d 0 R >> >> >>" % (content, node)
+        ))
+    return pdf.close(page_numbers)
+
+
+def make_image_set(directory, count=20, size=(2400, 1800), kind="jpeg", seed=0):
+    """
+    directory'ye count adet görsel yazar ve yollarını döndürür. kind: "jpeg" veya "png".
+    Görseller küçük bir rastgele dokunun büyütülmüş hâli ve renk geçişidir; aynı tohum aynı dosyaları üretir.
+    """
+    if not PIL_AVAILABLE:
+        raise RuntimeError("Image sets need Pillow (pip install Pillow)")
+    rng = random.Random(seed)
+    os.makedirs(directory, exist_ok=True)
+    width, height = size
+    paths = []
+    for index in range(count):
+        texture = Image.frombytes("RGB", (64, 48), _noise(rng, 64 * 48 * 3)).resize(size, Image.BILINEAR)
+        gradient = Image.linear_gradient("L").resize(size).convert("RGB")
+        image = Image.blend(texture, gradient, 0.35)
+        if kind == "png":
+            path = os.path.join(directory, f"image_{index:04d}.png")
+            image.save(path, "PNG", compress_level=1)
+        else:
+            path = os.path.join(directory, f"image_{index:04d}.jpg")
+            image.save(path, "JPEG", quality=90)
+        paths.append(path)
+    return paths
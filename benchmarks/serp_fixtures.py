@@ -0,0 +1,58 @@
+# Arama motoru sonuç sayfalarını (SERP) taklit eden sentetik HTML fikstürleri.
+# Aynı tohum (seed) her zaman aynı sayfayı üretir; gerçek sayfalardaki gibi sonuçların etrafında
+# menüler, betikler ve iç içe geçmiş çok sayıda div bulunur.
+
+import random
+from urllib.parse import quote
+
+ENGINES = ("Google", "Bing", "DuckDuckGo", "Yandex")
+WORDS = ("tez", "makale", "rapor", "analiz", "veri", "model", "sistem", "yöntem", "dergi", "bildiri")
+
+
+def _noise(rng, depth=3, width=4):
+    # Sonuçlarla ilgisi olmayan iç içe öğeler
+    if depth == 0:
+        return f'<span class="n{rng.randrange(99)}">{" ".join(rng.choices(WORDS, k=6))}</span>'
+    children = "".join(_noise(rng, depth - 1, width) for _ in range(width))
+    return f'<div class="w{rng.randrange(99)}" jsname="x{rng.randrange(999)}">{children}</div>'
+
+
+def _target(rng, index):
+    host = rng.choice(("dergipark.org.tr", "arxiv.org", "example.edu", "repository.ac.uk", "docs.example.com"))
+    extension = ".pdf" if rng.random() < 0.7 else ".html"
+    return f"https://{host}/files/{index}/{rng.choice(WORDS)}-{index}{extension}?utm_source=serp"
+
+
+def _result(engine, rng, index):
+    url = _target(rng, index)
+    title = f"{rng.choice(WORDS).title()} {index}"
+    snippet = " ".join(rng.choices(WORDS, k=25))
+    if engine == "Google":
+        return (f'<div class="MjjYud"><div class="g" data-hveid="{index}"><div class="tF2Cxc">'
+                f'<a href="/url?q={quote(url, safe="")}&sa=U&ved=0ah{index}"><h3>{title}</h3>'
+                f'<cite>{url[:40]}</cite></a><div class="VwiC3b">{snippet}</div>'
+                f'{_noise(rng, 2, 3)}</div></div></div>')
+    if engine == "Bing":
+        return (f'<li class="b_algo"><h2><a href="{url}">{title}</a></h2>'
+                f'<div class="b_caption"><p>{snippet}</p></div>{_noise(rng, 2, 3)}</li>')
+    if engine == "DuckDuckGo":
+        return (f'<div class="result results_links"><div class="links_main result__body">'
+                f'<a class="result__a" href="//duckduckgo.com/l/?uddg={quote(url, safe="")}&rut=ab{index}">{title}</a>'
+                f'<a class="result__snippet" href="#">{snippet}</a>{_noise(rng, 2, 3)}</div></div>')
+    return (f'<li class="serp-item"><div class="organic"><a href="https://yandex.com/r.xml?u={quote(url, safe="")}">'
+            f'{title}</a><div class="organic__snippet">{snippet}</div>{_noise(rng, 2, 3)}</div></li>')
+
+
+def make_serp(engine, results=20, seed=0):
+    """engine için results adet sonuç içeren sentetik bir sonuç sayfası döndürür."""
+    rng = random.Random(f"{engine}-{results}-{seed}")
+    body = "".join(_result(engine, rng, index) for index in range(results))
+    navigation = "".join(f'<a href="https://www.{engine.lower()}.com/nav/{i}">menü {i}</a>' for i in range(60))
+    script = "<script>var s = '" + "x" * 20000 + "';</script>"
+    return (f"<!DOCTYPE html><html><head><title>{engine}</title>{script}</head><body>"
+            f"<header>{navigation}{_noise(rng, 4, 4)}</header><main>{body}</main>"
+            f"<footer>{_noise(rng, 4, 4)}</footer></body></html>")
+
+
+def all_fixtures(results=20, seed=0):
+    return {engine: make_serp(engine, results, seed) for engine in ENGINES}
@@ -0,0 +1,170 @@
+# Gerekli kütüphaneler: requests
+# Kurulum: pip install requests
+#
+# Farklı URL'lerdeki aynı PDF'i (yansı siteler, yönlendirmeler, "?download=1" türevleri) içerikten tanır.
+# Parmak izi, dosya boyutu ile ilk ve son KB'ın SHA-256 özetidir ve iki küçük Range isteğiyle alınır
+# (doğrulama sırasında indirilen ilk KB yeniden istenmez). Parmak izleri çakışırsa iki dosyanın tam özeti
+# karşılaştırılır. Yinelenen sonuçlar önizleme ve indirme adımlarından önce elenir.
+
+import hashlib
+import threading
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+import pdf_range
+
+FINGERPRINT_SIZE = 1024              # Parmak izine giren baş ve son bölümün boyutu
+MAX_FULL_HASH = 64 * 1024 * 1024     # Bundan büyük dosyalarda parmak izi eşleşmesi yinelenme sayılır
+TIMEOUT = 10
+FULL_HASH_TIMEOUT = 60
+DEFAULT_WORKERS = 16
+
+Fingerprint = namedtuple("Fingerprint", "size digest")
+
+
+def make_fingerprint(size, head, tail):
+    """Boyut, ilk FINGERPRINT_SIZE ve son FINGERPRINT_SIZE bayttan parmak izi üretir."""
+    digest = hashlib.sha256()
+    digest.update(head[:FINGERPRINT_SIZE])
+    digest.update(tail[-FINGERPRINT_SIZE:])
+    return Fingerprint(size, digest.hexdigest())
+
+
+def fingerprint_request(request, head=b""):
+    """
+    request(start, length) -> (veri, Content-Range) çağrılabiliriyle (bkz. pdf_range) parmak izini alır.
+    head dosyanın zaten indirilmiş ilk baytlarıdır; yeterliyse ikinci istek yapılmaz.
+    Sunucu Range desteklemiyorsa pdf_range.RangeNotSupported fırlatır.
+    """
+    tail, content_range = request(None, FINGERPRINT_SIZE)
+    _, _, size = pdf_range.parse_content_range(content_range)
+    if len(head) < min(FINGERPRINT_SIZE, size):
+        head, _ = request(0, min(FINGERPRINT_SIZE, size))
+    return make_fingerprint(size, head, tail)
+
+
+def full_hash(session, url, headers=None, timeout=FULL_HASH_TIMEOUT, max_size=MAX_FULL_HASH):
+    """Dosyanın tamamının SHA-256 özeti; dosya max_size'ı aşarsa None."""
+    digest = hashlib.sha256()
+    size = 0
+    response = session.get(url, headers=headers, timeout=timeout, stream=True)
+    try:
+        response.raise_for_status()
+        for chunk in response.iter_content(chunk_size=64 * 1024):
+            size += len(chunk)
+            if size > max_size:
+                return None
+            digest.update(chunk)
+    finally:
+        response.close()
+    return digest.hexdigest()
+
+
+class DuplicateIndex:
+    """
+    Parmak izi -> URL eşlemesi ve yinelenen URL'lerin asıl URL'leri. Farklı iş parçacıklarından kullanılabilir.
+    register() çakışan URL'leri döndürür; çağıran taraf tam özetleri karşılaştırıp mark_duplicate() veya
+    hiçbir şey yapmaz (farklı dosya). Parmak izi ilk kaydedilen URL asıl kabul edilir.
+    """
+
+    def __init__(self):
+        self._groups = {}       # Fingerprint -> [url, ...]
+        self._full_hashes = {}  # url -> tam SHA-256 (veya dosya çok büyükse None)
+        self.aliases = {}       # yinelenen url -> asıl url
+        self.full_hash_count = 0
+        self._lock = threading.Lock()
+
+    def register(self, url, fingerprint):
+        """URL'yi kaydeder ve aynı parmak izine sahip, daha önce kaydedilmiş URL'leri döndürür."""
+        with self._lock:
+            group = self._groups.setdefault(fingerprint, [])
+            earlier = [other for other in group if other != url]
+            if url not in group:
+                group.append(url)
+            return earlier
+
+    def mark_duplicate(self, url, canonical):
+        with self._lock:
+            for group in self._groups.values():
+                if url in group:
+                    group.remove(url)
+            self.aliases[url] = self.aliases.get(canonical, canonical)
+
+    def canonical(self, url):
+        return self.aliases.get(url, url)
+
+    def known_full_hash(self, url):
+        """(hesaplandı mı, özet) döndürür."""
+        with self._lock:
+            return url in self._full_hashes, self._full_hashes.get(url)
+
+    def store_full_hash(self, url, digest):
+        with self._lock:
+            self._full_hashes[url] = digest
+            self.full_hash_count += 1
+
+    @property
+    def duplicates(self):
+        return len(self.aliases)
+
+
+def same_content(first_hash, second_hash):
+    """Tam özetler eşitse veya ikisi de çok büyük dosyalar için hesaplanmadıysa True."""
+    return first_hash == second_hash
+
+
+class ContentDeduplicator:
+    """
+    requests oturumuyla çalışan eşzamanlı (iş parçacıklı) yinelenme denetimi.
+    SearchPipeline ayrı bir asyncio uyarlaması kullanır; ikisi de aynı DuplicateIndex'i paylaşabilir.
+    """
+
+    def __init__(self, session, headers=None, index=None, workers=DEFAULT_WORKERS, timeout=TIMEOUT):
+        self.session = session
+        self.headers = headers or dict  # Her istek için başlık sözlüğü döndüren çağrılabilir
+        self.index = index or DuplicateIndex()
+        self.workers = workers
+        self.timeout = timeout
+
+    def fingerprint(self, url, head=b""):
+        """Parmak izini döndürür; sunucu Range desteklemiyorsa veya istek başarısızsa None."""
+        request = pdf_range.http_range_request(self.session, url, self.headers(), timeout=self.timeout)
+        try:
+            return fingerprint_request(request, head)
+        except Exception:
+            return None
+
+    def _full_hash(self, url):
+        known, digest = self.index.known_full_hash(url)
+        if not known:
+            try:
+                digest = full_hash(self.session, url, self.headers())
+            except Exception:
+                digest = f"error:{url}"  # Karşılaştırılamayan dosya hiçbir şeyle eşleşmez
+            self.index.store_full_hash(url, digest)
+        return digest
+
+    def check(self, url, fingerprint):
+        """URL aynı içeriğe sahip, daha önce kaydedilmiş bir URL'nin kopyasıysa o URL'yi döndürür."""
+        if fingerprint is None:
+            return None
+        for other in self.index.register(url, fingerprint):
+            if same_content(self._full_hash(other), self._full_hash(url)):
+                self.index.mark_duplicate(url, other)
+                return self.index.canonical(url)
+        return None
+
+    def deduplicate(self, results, heads=None):
+        """
+        [(başlık, url, açıklama), ...] listesinden aynı içeriğin sonraki kopyalarını çıkarır; sıra korunur.
+        heads: {url: zaten indirilmiş ilk baytlar}. Parmak izleri aynı anda alınır.
+        """
+        heads = heads or {}
+        urls = [url for _, url, _ in results]
+        with ThreadPoolExecutor(max_workers=max(1, min(self.workers, len(urls)))) as executor:
+            fingerprints = list(executor.map(lambda url: self.fingerprint(url, heads.get(url, b"")), urls))
+        unique = []
+        for result, fingerprint in zip(results, fingerprints):
+            if self.check(result[1], fingerprint) is None:
+                unique.append(result)
+        return unique
@@ -0,0 +1,359 @@
+# Gerekli kütüphaneler: requests, lxml
+# Kurulum: pip install requests lxml
+#
+# SearchWorker._search_deeper için nazik (politeness-aware) tarayıcı zamanlayıcısı.
+# Her sunucu için bir jeton kovası istek hızını sınırlar, robots.txt kurallarına (Crawl-delay dahil) uyulur,
+# geçici hatalar rastgele sapmalı üstel bekleme ile yeniden denenir. Sıradaki sayfa, alan adının
+# anahtar kelime puanına göre öncelikli bir kuyruktan seçilir. Aynı tohum (seed) aynı tarama sırasını verir.
+
+import heapq
+import itertools
+import random
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from urllib.parse import unquote, urljoin, urlsplit
+from urllib.robotparser import RobotFileParser
+
+import lxml.html
+import requests
+
+import serp_parser
+import url_normalize
+
+# Akademik veya depo olabilecek sitelere öncelik ver
+PRIORITY_KEYWORDS = [
+    'academia', 'researchgate', 'sci-hub', 'repository', 'arxiv',
+    'library', 'kutuphane', 'edu', '.ac.', '.gov', 'research',
+    'journal', 'conference', 'dergi', 'makale', 'tez'
+]
+
+DEFAULT_RATE = 1.0          # Sunucu başına saniyede en fazla istek
+DEFAULT_BURST = 2           # Kovanın kapasitesi: art arda yapılabilecek istek sayısı
+DEFAULT_WORKERS = 8         # Aynı anda taranan en fazla sayfa (farklı sunucularda)
+PER_HOST_CONCURRENCY = 1    # Bir sunucuya aynı anda yapılan en fazla istek
+DEFAULT_MAX_PAGES = 25      # Bir taramada indirilen en fazla sayfa
+DEFAULT_MAX_RESULTS = 10
+MAX_RETRIES = 3
+BACKOFF_BASE = 1.0          # İlk yeniden denemeden önceki ortalama bekleme (saniye)
+BACKOFF_MAX = 30.0
+MAX_PAGE_SIZE = 2 * 1024 * 1024
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+# Yeniden denenmeye değer ağ hataları; yönlendirme döngüsü, geçersiz URL gibi diğer istek hataları sayfayı atlatır
+TRANSIENT_ERRORS = (
+    requests.exceptions.Timeout,
+    requests.exceptions.ConnectionError,
+    requests.exceptions.ChunkedEncodingError,
+)
+DEFAULT_TIME_BUDGET = 30.0  # Bir taramanın (robots.txt, yeniden denemeler ve beklemeler dahil) en uzun süresi
+MIN_REQUEST_TIMEOUT = 0.5   # Bütçenin sonuna yaklaşırken bile isteklere tanınan en kısa süre
+FOUND_DESCRIPTION = "Site taramasından bulundu"
+
+
+def priority_score(url):
+    """Alan adında geçen öncelikli anahtar kelime sayısı."""
+    host = urlsplit(url).netloc.lower()
+    return sum(keyword in host for keyword in PRIORITY_KEYWORDS)
+
+
+class TokenBucket:
+    """rate jeton/saniye hızla dolan, en fazla burst jeton tutan kova. Farklı iş parçacıklarından kullanılabilir."""
+
+    def __init__(self, rate=DEFAULT_RATE, burst=DEFAULT_BURST, clock=time.monotonic):
+        self.rate = rate
+        self.burst = burst
+        self.clock = clock
+        self.tokens = float(burst)
+        self.updated = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = self.clock()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def try_acquire(self):
+        with self._lock:
+            self._refill()
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return True
+            return False
+
+    def wait_time(self):
+        """Bir sonraki jetonun oluşmasına kalan süre."""
+        with self._lock:
+            self._refill()
+            return 0.0 if self.tokens >= 1 else (1 - self.tokens) / self.rate
+
+    def limit_rate(self, rate):
+        """Hızı en fazla rate'e düşürür (ör. robots.txt Crawl-delay); biriken jetonlar eski hızla hesaplanır."""
+        with self._lock:
+            self._refill()
+            self.rate = min(self.rate, rate)
+
+
+class RobotsCache:
+    """Sunucu başına robots.txt kurallarını bir kez indirir ve saklar."""
+
+    def __init__(self, session, user_agent, timeout=10):
+        self.session = session
+        self.user_agent = user_agent
+        self.timeout = timeout
+        self._parsers = {}
+        self._lock = threading.Lock()
+
+    def get(self, url, timeout=None):
+        parts = urlsplit(url)
+        origin = f"{parts.scheme}://{parts.netloc}"
+        with self._lock:
+            parser = self._parsers.get(origin)
+        if parser is not None:
+            return parser
+
+        parser = RobotFileParser(origin + "/robots.txt")
+        try:
+            response = self.session.get(
+                origin + "/robots.txt", headers={'User-Agent': self.user_agent}, timeout=timeout or self.timeout
+            )
+            if response.status_code in (401, 403):
+                parser.disallow_all = True
+            elif response.status_code >= 400:
+                parser.allow_all = True
+            else:
+                parser.parse(response.text.splitlines())
+        except requests.exceptions.RequestException:
+            parser.allow_all = True  # robots.txt'e ulaşılamıyorsa siteye erişim de muhtemelen başarısız olur
+        with self._lock:
+            return self._parsers.setdefault(origin, parser)
+
+    def allowed(self, url, timeout=None):
+        return self.get(url, timeout).can_fetch(self.user_agent, url)
+
+    def crawl_delay(self, url, timeout=None):
+        return self.get(url, timeout).crawl_delay(self.user_agent)
+
+
+class CrawlScheduler:
+    """
+    Tohum URL'lerden başlayarak PDF bağlantılarını toplar.
+
+    Sıradaki sayfa (-öncelik puanı, derinlik, eklenme sırası) anahtarlı öncelik kuyruğundan, jetonu olan ve
+    aynı anda izin verilenden fazla isteği açık olmayan ilk sunucudan seçilir. HTML sayfalarındaki aynı
+    sunucuya ait bağlantılar max_depth'e kadar izlenir. 429/5xx yanıtları ve ağ hataları
+    BACKOFF_BASE * 2^deneme * [0.5, 1.5) saniye beklenerek (Retry-After varsa ona uyularak) yeniden denenir.
+    Tarama en fazla time_budget saniye sürer: istek zaman aşımları kalan süreye göre kısaltılır ve süre dolunca
+    yanıt vermeyen sunucular beklenmeden o ana kadar bulunan sonuçlar döndürülür.
+    """
+
+    def __init__(self, session, user_agent, max_depth=1, max_pages=DEFAULT_MAX_PAGES,
+                 max_results=DEFAULT_MAX_RESULTS, workers=DEFAULT_WORKERS, rate=DEFAULT_RATE,
+                 burst=DEFAULT_BURST, max_retries=MAX_RETRIES, respect_robots=True, seed=None,
+                 should_continue=None, clock=time.monotonic, sleep=time.sleep, timeout=10,
+                 time_budget=DEFAULT_TIME_BUDGET):
+        self.session = session
+        self.user_agent = user_agent
+        self.max_depth = max_depth
+        self.max_pages = max_pages
+        self.max_results = max_results
+        self.workers = workers
+        self.rate = rate
+        self.burst = burst
+        self.max_retries = max_retries
+        self.should_continue = should_continue
+        self.clock = clock
+        self.sleep = sleep
+        self.timeout = timeout
+        self.time_budget = time_budget
+        self.rng = random.Random(seed)
+        self.robots = RobotsCache(session, user_agent, timeout) if respect_robots else None
+        self.pages_fetched = 0
+        self.retries = 0
+        self.results = []
+        self._frontier = []  # (-puan, derinlik, sıra, url, deneme, en erken zaman)
+        self._counter = itertools.count()
+        self._seen = set()
+        self._found = set()
+        self._buckets = {}
+        self._in_flight = {}  # sunucu -> açık istek sayısı
+        self._buckets_lock = threading.Lock()
+        self._deadline = None
+
+    def add(self, url, depth=1, attempt=0, not_before=0.0):
+        """URL'yi kuyruğa ekler; aynı (normalleştirilmiş) URL ikinci kez eklenmez."""
+        if attempt == 0:
+            try:
+                key = url_normalize.normalize_url(url)
+            except ValueError:
+                return  # Geçersiz port, bozuk IPv6 adresi vb.
+            if key in self._seen:
+                return
+            self._seen.add(key)
+        heapq.heappush(
+            self._frontier, (-priority_score(url), depth, next(self._counter), url, attempt, not_before)
+        )
+
+    def _bucket(self, host):
+        with self._buckets_lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = self._buckets[host] = TokenBucket(self.rate, self.burst, self.clock)
+            return bucket
+
+    def _remaining(self):
+        return float("inf") if self._deadline is None else self._deadline - self.clock()
+
+    def _pop_ready(self):
+        """Şimdi taranabilecek en öncelikli girdiyi döndürür; yoksa (None, beklenecek süre)."""
+        skipped = []
+        ready = None
+        wait_for = None
+        now = self.clock()
+        while self._frontier:
+            entry = heapq.heappop(self._frontier)
+            host = urlsplit(entry[3]).netloc
+            if entry[5] > now:
+                delay = entry[5] - now
+            elif self._in_flight.get(host, 0) >= PER_HOST_CONCURRENCY:
+                delay = None  # Bu sunucudaki istek bitince yeniden bakılır
+            elif self._bucket(host).try_acquire():
+                ready = entry
+                break
+            else:
+                delay = self._bucket(host).wait_time()
+            if delay is not None:
+                wait_for = delay if wait_for is None else min(wait_for, delay)
+            skipped.append(entry)
+        for entry in skipped:
+            heapq.heappush(self._frontier, entry)
+        return ready, wait_for
+
+    def _backoff(self, attempt, retry_after=None):
+        if retry_after is not None:
+            return min(retry_after, BACKOFF_MAX)
+        return min(BACKOFF_BASE * (2 ** attempt) * (0.5 + self.rng.random()), BACKOFF_MAX)
+
+    def _fetch(self, url, timeout):
+        """İş parçacığında çalışır: ('ok', html) | ('retry', Retry-After) | ('skip', None) döndürür."""
+        if self.robots is not None:
+            if not self.robots.allowed(url, timeout):
+                return 'skip', None
+            delay = self.robots.crawl_delay(url, timeout)
+            if delay:
+                self._bucket(urlsplit(url).netloc).limit_rate(1.0 / float(delay))
+        try:
+            response = self.session.get(
+                url,
+                headers={
+                    'User-Agent': self.user_agent,
+                    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+                },
+                timeout=timeout,
+                stream=True,
+            )
+        except TRANSIENT_ERRORS:
+            return 'retry', None
+        except requests.exceptions.RequestException:
+            return 'skip', None
+        try:
+            if response.status_code in RETRY_STATUSES:
+                retry_after = response.headers.get('Retry-After', '')
+                return 'retry', float(retry_after) if retry_after.isdigit() else None
+            if response.status_code != 200 or 'html' not in response.headers.get('Content-Type', 'text/html'):
+                return 'skip', None
+            body = b""
+            for chunk in response.iter_content(chunk_size=65536):
+                body += chunk
+                if len(body) >= MAX_PAGE_SIZE:
+                    break
+            return 'ok', body
+        except TRANSIENT_ERRORS:
+            return 'retry', None  # Gövde okunurken bağlantı koptu
+        except requests.exceptions.RequestException:
+            return 'skip', None
+        finally:
+            response.close()
+
+    def _process(self, url, depth, html):
+        try:
+            document = lxml.html.document_fromstring(html)
+        except (lxml.etree.ParserError, ValueError):
+            return
+        host = urlsplit(url).netloc
+        for link in document.iter('a'):
+            href = link.get('href')
+            if not href:
+                continue
+            # Göreceli URL'leri mutlak URL'lere dönüştür
+            try:
+                full_url = urljoin(url, href)
+                if urlsplit(full_url).scheme not in ('http', 'https'):
+                    continue
+                is_pdf = url_normalize.is_pdf_url(full_url)
+                key = url_normalize.normalize_url(full_url) if is_pdf else None
+            except ValueError:
+                continue  # Bozuk bağlantı yalnızca kendisi atlanır
+            if is_pdf:
+                if key in self._found or len(self.results) >= self.max_results:
+                    continue
+                self._found.add(key)
+                title = serp_parser.link_title(link)
+                if not title:
+                    # Dosya adını URL'den çıkarmayı dene
+                    title = unquote(urlsplit(full_url).path).rsplit('/', 1)[-1] or serp_parser.NO_TITLE
+                self.results.append((title, full_url, FOUND_DESCRIPTION))
+            elif depth < self.max_depth and urlsplit(full_url).netloc == host:
+                self.add(full_url, depth + 1)
+
+    def _running(self):
+        if self._remaining() <= 0:
+            return False
+        return self.should_continue is None or self.should_continue()
+
+    def run(self):
+        """
+        Taramayı yürütür ve bulunan [(başlık, url, açıklama), ...] listesini döndürür.
+        Süre bütçesi dolarsa hâlâ süren istekler beklenmez; iş parçacıkları kısaltılmış zaman aşımlarıyla kendiliğinden biter.
+        """
+        if self.time_budget is not None:
+            self._deadline = self.clock() + self.time_budget
+        executor = ThreadPoolExecutor(max_workers=self.workers)
+        futures = {}
+        try:
+            while self._running() and len(self.results) < self.max_results:
+                wait_for = None
+                while len(futures) < self.workers and self.pages_fetched < self.max_pages:
+                    entry, wait_for = self._pop_ready()
+                    if entry is None:
+                        break
+                    host = urlsplit(entry[3]).netloc
+                    self._in_flight[host] = self._in_flight.get(host, 0) + 1
+                    self.pages_fetched += 1
+                    timeout = max(MIN_REQUEST_TIMEOUT, min(self.timeout, self._remaining()))
+                    futures[executor.submit(self._fetch, entry[3], timeout)] = entry
+
+                if not futures:
+                    if wait_for is None or self.pages_fetched >= self.max_pages or wait_for >= self._remaining():
+                        break  # Kuyruk boş, sayfa bütçesi bitti veya sıradaki istek süre bütçesine sığmıyor
+                    self.sleep(min(wait_for, 1.0, self._remaining()))
+                    continue
+
+                done, _ = wait(futures, timeout=max(0.0, min(wait_for or 1.0, 1.0, self._remaining())),
+                               return_when=FIRST_COMPLETED)
+                for future in done:
+                    _, depth, _, url, attempt, _ = futures.pop(future)
+                    host = urlsplit(url).netloc
+                    self._in_flight[host] -= 1
+                    try:
+                        status, payload = future.result()
+                    except Exception:
+                        continue  # Beklenmeyen hata yalnızca bu sayfayı atlatır; bulunan sonuçlar korunur
+                    if status == 'ok':
+                        self._process(url, depth, payload)
+                    elif status == 'retry' and attempt < self.max_retries:
+                        self.retries += 1
+                        self.pages_fetched -= 1  # Yeniden deneme sayfa bütçesinden düşülmez
+                        self.add(url, depth, attempt + 1, self.clock() + self._backoff(attempt, payload))
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+        return self.results[:self.max_results]
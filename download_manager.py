@@ -0,0 +1,453 @@
+# Gerekli kütüphaneler: requests
+# Kurulum: pip install requests
+#
+# Arama sonuçlarındaki PDF'leri toplu indirir. Büyük dosyalar Range istekleriyle parçalara bölünüp paralel indirilir;
+# indirme sürerken veriler "<ad>.part" dosyasına, tamamlanan bayt aralıkları "<ad>.part.json" dosyasına yazılır.
+# Yarıda kalan indirmeler kaldığı yerden sürdürülür. Toplam ve sunucu başına bağlantı sayısı ile bant genişliği
+# sınırlanabilir; indirme bitince SHA-256 özeti hesaplanır ve verilmişse beklenen özetle karşılaştırılır.
+# Tamamlanan dosyaların kaynak URL'si ve özeti klasördeki ".downloads.json" dosyasında tutulur; mevcut bir dosya
+# yalnızca aynı URL'den indirilmiş ve sonradan değişmemişse yeniden kullanılır.
+
+import base64
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, wait
+from urllib.parse import unquote, urlsplit
+
+import requests
+
+import pdf_range
+import url_normalize
+
+DEFAULT_MAX_FILES = 8           # Aynı anda indirilen en fazla dosya
+DEFAULT_MAX_CONNECTIONS = 32    # Tüm indirmelerin toplam en fazla bağlantısı
+DEFAULT_PER_HOST = 4            # Sunucu başına en fazla bağlantı (http_pool.DEFAULT_PER_HOST'u aşmamalı)
+SPLIT_THRESHOLD = 8 * 1024 * 1024   # Bu boyuttan büyük dosyalar parçalara bölünür
+MIN_SEGMENT_SIZE = 2 * 1024 * 1024
+CHUNK_SIZE = 64 * 1024
+STATE_INTERVAL = 1024 * 1024    # Her parçada bu kadar bayt yazıldıkça ilerleme durumu diske kaydedilir
+PROGRESS_INTERVAL = 0.2         # Dosya başına ilerleme bildirimleri arasındaki en kısa süre (saniye)
+TIMEOUT = 30
+MAX_NAME_LENGTH = 120
+INDEX_NAME = ".downloads.json"  # Dosya adı -> {url, size, sha256, validator}
+
+DownloadResult = namedtuple("DownloadResult", "url path size sha256 resumed error")
+
+
+class DownloadError(Exception):
+    """Dosya indirilemedi veya doğrulanamadı."""
+
+
+class BandwidthLimiter:
+    """Birden çok iş parçacığı arasında paylaşılan, saniyede en fazla rate bayta izin veren sınırlayıcı."""
+
+    def __init__(self, rate, burst=None):
+        self.rate = float(rate)
+        self.burst = float(burst or max(rate, CHUNK_SIZE))
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def consume(self, count):
+        """count bayt için gereken süre kadar bekler."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= count
+            delay = -self._tokens / self.rate if self._tokens < 0 else 0
+        if delay:
+            time.sleep(delay)
+
+
+def file_name_for(url):
+    """URL'den dosya adı üretir; adı olmayan veya .pdf ile bitmeyen bağlantılar URL özetiyle ayırt edilir."""
+    name = unquote(urlsplit(url_normalize.unwrap_redirect(url)).path).rsplit("/", 1)[-1]
+    name = re.sub(r'[\\/:*?"<>|\x00-\x1f]', "_", name).strip(" .")[:MAX_NAME_LENGTH]
+    if name.lower().endswith(".pdf") and len(name) > 4:
+        return name
+    digest = hashlib.sha1(url_normalize.normalize_url(url).encode("utf-8")).hexdigest()[:8]
+    return f"{name or 'document'}-{digest}.pdf"
+
+
+def expected_digest(headers):
+    """Repr-Digest/Digest (sha-256) veya Content-MD5 başlığından (algoritma, hex özet) döndürür."""
+    for header in ("Repr-Digest", "Digest"):
+        match = re.search(r"sha-256=:?([A-Za-z0-9+/=]+):?", headers.get(header, ""), re.IGNORECASE)
+        if match:
+            return "sha256", base64.b64decode(match.group(1)).hex()
+    if headers.get("Content-MD5"):
+        return "md5", base64.b64decode(headers["Content-MD5"]).hex()
+    return None
+
+
+def file_digest(path, algorithm="sha256"):
+    digest = hashlib.new(algorithm)
+    with open(path, "rb") as file:
+        for block in iter(lambda: file.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class _Segment:
+    """[start, end) aralığı; position diske yazılan, durable ise .part.json'a kaydedilmiş konumdur."""
+
+    __slots__ = ("start", "end", "position", "durable")
+
+    def __init__(self, start, end, position=None):
+        self.start = start
+        self.end = end
+        self.position = start if position is None else position
+        self.durable = self.position
+
+    @property
+    def done(self):
+        return self.end is not None and self.position >= self.end
+
+
+class _Transfer:
+    """Tek bir dosyanın indirme durumu; parça konumları .part.json dosyasında saklanır."""
+
+    def __init__(self, url, path):
+        self.url = url
+        self.path = path
+        self.part_path = path + ".part"
+        self.state_path = path + ".part.json"
+        self.size = None
+        self.validator = None  # ETag veya Last-Modified: sunucudaki dosya değişirse parçalar birleştirilmez
+        self.digest = None
+        self.segments = []
+        self.resumed = 0
+        self.failed = False
+        self.reported = 0.0
+        self.lock = threading.Lock()
+
+    def load(self):
+        """Önceki indirmeden kalan durumu yükler; kullanılabilir durum yoksa False döndürür."""
+        try:
+            with open(self.state_path, encoding="utf-8") as file:
+                state = json.load(file)
+        except (OSError, ValueError):
+            return False
+        if state.get("url") != self.url or not os.path.exists(self.part_path):
+            return False
+        self.size = state["size"]
+        self.validator = state.get("validator")
+        self.digest = tuple(state["digest"]) if state.get("digest") else None
+        self.segments = [_Segment(*segment) for segment in state["segments"]]
+        self.resumed = sum(segment.position - segment.start for segment in self.segments)
+        return True
+
+    def save(self):
+        if self.failed:
+            return
+        state = {
+            "url": self.url,
+            "size": self.size,
+            "validator": self.validator,
+            "digest": self.digest,
+            "segments": [[segment.start, segment.end, segment.durable] for segment in self.segments],
+        }
+        with self.lock:
+            with open(self.state_path + ".tmp", "w", encoding="utf-8") as file:
+                json.dump(state, file)
+            os.replace(self.state_path + ".tmp", self.state_path)
+
+    def downloaded(self):
+        return sum(segment.position - segment.start for segment in self.segments)
+
+    def discard(self):
+        """Parçaları siler ve bu dosyanın diğer parçalarını durdurur."""
+        self.failed = True
+        for path in (self.part_path, self.state_path):
+            if os.path.exists(path):
+                os.remove(path)
+        self.segments = []
+        self.resumed = 0
+
+
+class DownloadManager:
+    """
+    PDF indirme kuyruğu. submit() ile eklenen her URL için bir Future döndürür; sonuç DownloadResult'tır.
+
+    Geri çağırmalar indirme iş parçacıklarından yapılır:
+    on_progress(url, indirilen, toplam veya None), on_finished(DownloadResult).
+    Hata durumunda DownloadResult.error doludur ve .part dosyası (sürdürülebiliyorsa) korunur.
+    """
+
+    def __init__(self, dest_dir, session=None, max_files=DEFAULT_MAX_FILES,
+                 max_connections=DEFAULT_MAX_CONNECTIONS, per_host=DEFAULT_PER_HOST, bandwidth=None,
+                 split_threshold=SPLIT_THRESHOLD, min_segment=MIN_SEGMENT_SIZE, headers=None,
+                 on_progress=None, on_finished=None, timeout=TIMEOUT):
+        self.dest_dir = dest_dir
+        self.session = session or requests.Session()
+        self.per_host = per_host
+        self.split_threshold = split_threshold
+        self.min_segment = min_segment
+        self.headers = dict(headers or {})
+        self.on_progress = on_progress
+        self.on_finished = on_finished
+        self.timeout = timeout
+        self.limiter = BandwidthLimiter(bandwidth) if bandwidth else None
+        self.bytes_downloaded = 0
+        self._connections = threading.BoundedSemaphore(max_connections)
+        self._host_slots = {}
+        self._claimed = {}  # dosya yolu -> URL
+        self._lock = threading.Lock()
+        self._cancelled = threading.Event()
+        # Dosya görevleri parça görevlerini bekler; ayrı havuzlar kilitlenmeyi önler
+        self._files = ThreadPoolExecutor(max_workers=max_files)
+        self._segments = ThreadPoolExecutor(max_workers=max_connections)
+        os.makedirs(dest_dir, exist_ok=True)
+        self.index_path = os.path.join(dest_dir, INDEX_NAME)
+        self._completed = self._load_index()
+
+    def submit(self, url, expected_sha256=None):
+        return self._files.submit(self._download, url, expected_sha256)
+
+    def submit_results(self, results):
+        """SearchWorker sonuçlarını ([(başlık, url, açıklama), ...]) kuyruğa ekler."""
+        return [self.submit(url) for _, url, _ in results]
+
+    def cancel(self):
+        """Süren indirmeleri durdurur; .part dosyaları sonraki çalıştırmada sürdürülmek üzere kalır."""
+        self._cancelled.set()
+
+    def close(self, wait_for=True):
+        self._files.shutdown(wait=wait_for)
+        self._segments.shutdown(wait=wait_for)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _host_slot(self, url):
+        host = urlsplit(url).netloc
+        with self._lock:
+            slot = self._host_slots.get(host)
+            if slot is None:
+                slot = self._host_slots[host] = threading.BoundedSemaphore(self.per_host)
+            return slot
+
+    def _target_path(self, url):
+        path = os.path.join(self.dest_dir, file_name_for(url))
+        with self._lock:
+            owner = self._claimed.setdefault(path, url)
+            if owner != url or self._belongs_to_other(path, url):
+                # Aynı ada sahip farklı bir dosya: adı URL özetiyle ayır
+                stem = os.path.splitext(os.path.basename(path))[0]
+                digest = hashlib.sha1(url_normalize.normalize_url(url).encode("utf-8")).hexdigest()[:8]
+                path = os.path.join(self.dest_dir, f"{stem}-{digest}.pdf")
+                self._claimed.setdefault(path, url)
+        return path
+
+    def _belongs_to_other(self, path, url):
+        try:
+            with open(path + ".part.json", encoding="utf-8") as file:
+                return json.load(file).get("url") not in (None, url)
+        except (OSError, ValueError):
+            pass
+        if not os.path.exists(path):
+            return False
+        # Tamamlanmış dosya: kaydı yoksa (klasöre başka yolla konmuş) veya başka bir URL'ninse üzerine yazılmaz
+        entry = self._completed.get(os.path.basename(path))
+        return entry is None or entry.get("url") != url
+
+    def _load_index(self):
+        try:
+            with open(self.index_path, encoding="utf-8") as file:
+                index = json.load(file)
+        except (OSError, ValueError):
+            return {}
+        return index if isinstance(index, dict) else {}
+
+    def _record(self, transfer, sha256):
+        """Tamamlanan dosyanın kaynağını ve özetini dizin dosyasına yazar."""
+        with self._lock:
+            self._completed[os.path.basename(transfer.path)] = {
+                "url": transfer.url,
+                "size": transfer.size,
+                "sha256": sha256,
+                "validator": transfer.validator,
+            }
+            with open(self.index_path + ".tmp", "w", encoding="utf-8") as file:
+                json.dump(self._completed, file)
+            os.replace(self.index_path + ".tmp", self.index_path)
+
+    def _reuse(self, transfer, expected_sha256):
+        """Aynı URL'den daha önce tamamlanmış ve o zamandan beri değişmemiş dosyanın sonucunu döndürür; yoksa None."""
+        if os.path.exists(transfer.state_path) or not os.path.exists(transfer.path):
+            return None
+        with self._lock:
+            entry = self._completed.get(os.path.basename(transfer.path))
+        size = os.path.getsize(transfer.path)
+        if not entry or entry.get("url") != transfer.url or entry.get("size") != size:
+            return None
+        if expected_sha256 and expected_sha256.lower() != entry.get("sha256"):
+            return None
+        sha256 = file_digest(transfer.path)
+        if sha256 != entry.get("sha256"):
+            return None
+        return DownloadResult(transfer.url, transfer.path, size, sha256, 0, None)
+
+    def _request(self, url, headers, stream=True):
+        return self.session.get(
+            url, headers=dict(self.headers, **headers), timeout=self.timeout, stream=stream
+        )
+
+    def _download(self, url, expected_sha256=None):
+        transfer = _Transfer(url, self._target_path(url))
+        try:
+            result = self._reuse(transfer, expected_sha256) or self._fetch(transfer, expected_sha256)
+        except Exception as e:
+            result = DownloadResult(url, transfer.path, transfer.size, None, transfer.resumed, str(e))
+        if self.on_finished:
+            self.on_finished(result)
+        return result
+
+    def _fetch(self, transfer, expected_sha256):
+        url = transfer.url
+        if transfer.load():
+            self._wait_segments(self._start_segments(transfer))
+        else:
+            # Açık uçlu Range isteği: 206 dönerse boyut öğrenilir ve ilk parça aynı yanıttan okunur;
+            # diğer parçalar bu okuma sürerken ayrı bağlantılarla indirilir
+            others = []
+            try:
+                with self._host_slot(url), self._connections:
+                    response = self._request(url, {"Range": "bytes=0-", "Accept-Encoding": "identity"})
+                    try:
+                        if response.status_code not in (200, 206):
+                            raise DownloadError(f"HTTP {response.status_code}")
+                        transfer.digest = expected_digest(response.headers)
+                        if response.status_code == 206:
+                            _, _, transfer.size = pdf_range.parse_content_range(response.headers.get("Content-Range"))
+                            transfer.validator = response.headers.get("ETag") or response.headers.get("Last-Modified")
+                            transfer.segments = self._plan(transfer.size)
+                        else:
+                            length = response.headers.get("Content-Length")
+                            transfer.size = int(length) if length and "Content-Encoding" not in response.headers else None
+                            transfer.segments = [_Segment(0, transfer.size)]
+                        with open(transfer.part_path, "wb") as file:
+                            if transfer.size:
+                                file.truncate(transfer.size)
+                        if response.status_code == 206:
+                            transfer.save()
+                            others = self._start_segments(transfer, transfer.segments[0])
+                        self._write_segment(transfer, transfer.segments[0], response, resumable=response.status_code == 206)
+                    finally:
+                        response.close()
+            finally:
+                # İlk parça başarısız olsa da diğerleri bitmeden dönülmez; kaydedilen ilerleme sürdürülebilir kalır
+                wait(others)
+            self._wait_segments(others)
+
+        if self._cancelled.is_set():
+            raise DownloadError("İndirme iptal edildi")
+        if transfer.size is None:
+            transfer.size = os.path.getsize(transfer.part_path)
+        elif os.path.getsize(transfer.part_path) != transfer.size:
+            raise DownloadError("Dosya boyutu beklenenle uyuşmuyor")
+
+        sha256 = file_digest(transfer.part_path)
+        checks = []
+        if expected_sha256:
+            checks.append(("sha256", expected_sha256.lower()))
+        if transfer.digest:
+            checks.append(tuple(transfer.digest))
+        for algorithm, expected in checks:
+            actual = sha256 if algorithm == "sha256" else file_digest(transfer.part_path, algorithm)
+            if actual != expected:
+                transfer.discard()
+                raise DownloadError(f"{algorithm} özeti uyuşmuyor")
+
+        os.replace(transfer.part_path, transfer.path)
+        if os.path.exists(transfer.state_path):
+            os.remove(transfer.state_path)
+        self._record(transfer, sha256)
+        self._report(transfer, force=True)
+        return DownloadResult(url, transfer.path, transfer.size, sha256, transfer.resumed, None)
+
+    def _plan(self, size):
+        """Dosyayı bağlantı sınırına göre eşit parçalara böler; küçük dosyalar tek parçadır."""
+        if size < self.split_threshold:
+            return [_Segment(0, size)]
+        count = max(1, min(self.per_host, size // self.min_segment))
+        step = -(-size // count)
+        return [_Segment(start, min(start + step, size)) for start in range(0, size, step)]
+
+    def _start_segments(self, transfer, skip=None):
+        pending = [segment for segment in transfer.segments if segment is not skip and not segment.done]
+        return [self._segments.submit(self._fetch_segment, transfer, segment) for segment in pending]
+
+    @staticmethod
+    def _wait_segments(futures):
+        done, _ = wait(futures)
+        for future in done:
+            future.result()  # İlk hatayı yükselt
+
+    def _fetch_segment(self, transfer, segment):
+        headers = {"Range": f"bytes={segment.position}-{segment.end - 1}", "Accept-Encoding": "identity"}
+        if transfer.validator:
+            headers["If-Range"] = transfer.validator
+        with self._host_slot(transfer.url), self._connections:
+            if self._cancelled.is_set():
+                return
+            response = self._request(transfer.url, headers)
+            try:
+                if response.status_code != 206:
+                    # Sunucudaki dosya değişmiş veya Range desteklenmiyor: kaydedilen parçalar geçersiz
+                    transfer.discard()
+                    raise DownloadError(f"Parça indirilemedi (HTTP {response.status_code}), yeniden başlatın")
+                start, _, _ = pdf_range.parse_content_range(response.headers.get("Content-Range"))
+                if start != segment.position:
+                    raise DownloadError("Sunucu beklenmeyen aralık döndürdü")
+                self._write_segment(transfer, segment, response, resumable=True)
+            finally:
+                response.close()
+
+    def _write_segment(self, transfer, segment, response, resumable):
+        unsaved = 0
+        with open(transfer.part_path, "r+b") as file:
+            file.seek(segment.position)
+            for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+                if self._cancelled.is_set() or transfer.failed:
+                    break
+                if segment.end is not None:
+                    chunk = chunk[:segment.end - segment.position]
+                if self.limiter:
+                    self.limiter.consume(len(chunk))
+                file.write(chunk)
+                segment.position += len(chunk)
+                unsaved += len(chunk)
+                with self._lock:
+                    self.bytes_downloaded += len(chunk)
+                if resumable and unsaved >= STATE_INTERVAL:
+                    file.flush()
+                    segment.durable = segment.position
+                    transfer.save()
+                    unsaved = 0
+                self._report(transfer)
+                if segment.done:
+                    break  # İlk parça açık uçlu yanıttan okunuyorsa burada bırak
+            file.flush()
+        segment.durable = segment.position
+        if resumable:
+            transfer.save()
+        if segment.end is not None and not segment.done and not (self._cancelled.is_set() or transfer.failed):
+            raise DownloadError("Bağlantı erken kapandı")
+
+    def _report(self, transfer, force=False):
+        if not self.on_progress:
+            return
+        now = time.monotonic()
+        if force or now - transfer.reported >= PROGRESS_INTERVAL:
+            transfer.reported = now
+            self.on_progress(transfer.url, transfer.downloaded(), transfer.size)
@@ -1,13 +1,14 @@
-# Gerekli kütüphaneler: PySide6, requests, beautifulsoup4, lxml, pdfminer.six
-# Kurulum: pip install PySide6 requests beautifulsoup4 lxml pdfminer.six
+# Gerekli kütüphaneler: PySide6, requests, lxml, pdfminer.six
+# Kurulum: pip install PySide6 requests lxml pdfminer.six
 
 import sys
 import os
 import re
 import io
 import random
+import threading
 import time
-from urllib.parse import urlparse, parse_qs, unquote, urljoin
+from urllib.parse import urlparse, unquote, urljoin
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from PySide6.QtWidgets import (
@@ -21,8 +22,20 @@ from PySide6.QtCore import Qt, QThread, Signal, QObject, QSettings, QUrl
 from PySide6.QtGui import QDesktopServices, QIcon, QFont
 
 import requests
-from bs4 import BeautifulSoup
+import lxml.html
 import io
+import asyncio
+
+import content_dedup
+import crawl_scheduler
+import download_manager
+import http_pool
+import pdf_index
+import pdf_range
+import search_cache
+import search_pipeline
+import serp_parser
+import url_normalize
 
 # PDF önizleme için pdfminer.six kullanımı (opsiyonel)
 try:
@@ -59,6 +72,28 @@ SEARCH_ENGINES = {
     }
 }
 
+# Bu seçenekle SEARCH_ENGINES içindeki tüm motorlar aynı anda sorgulanır ve sonuçları birleştirilir
+ALL_ENGINES = "Tümü"
+CRAWL_TIMEOUT_MARGIN = 2  # Derin taramanın motor zaman aşımından kaç saniye önce kesileceği
+
+
+def random_headers():
+    """PDF ve site istekleri için rastgele User-Agent içeren tarayıcı başlıkları döndürür."""
+    return {
+        'User-Agent': random.choice(USER_AGENTS),
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+        'Accept-Language': 'en-US,en;q=0.5',
+        'Accept-Encoding': 'gzip, deflate, br',
+        'DNT': '1',
+        'Connection': 'keep-alive',
+        'Upgrade-Insecure-Requests': '1',
+        'Sec-Fetch-Dest': 'document',
+        'Sec-Fetch-Mode': 'navigate',
+        'Sec-Fetch-Site': 'cross-site',
+        'Pragma': 'no-cache',
+        'Cache-Control': 'no-cache',
+    }
+
 # --- PDF URL Doğrulayıcı ve Önizleyici ---
 class PDFValidator(QObject):
     """
@@ -66,92 +101,116 @@ class PDFValidator(QObject):
     """
     validation_result = Signal(bool, str, str)  # başarılı mı, url, mesaj veya önizleme
     
-    def __init__(self):
+    def __init__(self, session=None, cache=None):
         super().__init__()
+        # Tüm istekler ortak bağlantı havuzundan geçer; testlerde yerel bir sunucuya yönlendirilmiş oturum verilebilir
+        self.session = session or http_pool.get_shared_session()
+        self.cache = cache  # search_cache.SearchCache; verilirse kararlar ve önizlemeler diskte saklanır
         
     def validate_and_preview(self, url):
+        """
+        URL'yi doğrular, sonucu validation_result sinyaliyle bildirir ve (başarılı mı, url, mesaj) olarak döndürür.
+        Farklı iş parçacıklarından aynı anda çağrılabilir.
+        """
+        if self.cache is not None:
+            is_valid, message = self._validate_cached(url)
+        else:
+            is_valid, message = self._validate(url)
+        self.validation_result.emit(is_valid, url, message)
+        return is_valid, url, message
+
+    def _validate_cached(self, url):
+        entry = self.cache.get(search_cache.VALIDATION, url)
+        # Önizlemesi olmayan olumlu kayıtlar (hattın yarıda kalan işleri) yeniden doğrulanır
+        if entry is not None and (entry.value["message"] is not None or not entry.value["is_pdf"]):
+            cached = entry.value["is_pdf"], entry.value["message"] or "Geçersiz PDF. İçerik PDF formatında değil."
+            if entry.fresh:
+                return cached
+            if entry.revalidatable:
+                try:
+                    headers = dict(random_headers(), **entry.conditional_headers())
+                    response = self.session.get(url, headers=headers, timeout=10, stream=True)
+                    response.close()
+                    if response.status_code == 304:
+                        self.cache.touch(search_cache.VALIDATION, url)
+                        return cached
+                except requests.exceptions.RequestException:
+                    pass
+        
+        validators = {}
+        is_valid, message = self._validate(url, validators)
+        if validators:  # Sunucudan yanıt alındıysa sakla; ağ hataları önbelleğe yazılmaz
+            self.cache.put(search_cache.VALIDATION, url, {"is_pdf": is_valid, "message": message}, **validators)
+        return is_valid, message
+
+    def _validate(self, url, validators=None):
+        """validators sözlüğü verilirse yanıtın ETag/Last-Modified değerleri içine yazılır."""
+        if validators is None:
+            validators = {}
         try:
-            headers = self._get_random_headers()
+            headers = random_headers()
             # HEAD isteğiyle dosya tipini kontrol et (ancak bazı sunucular HEAD'i desteklemez)
             try:
-                head_response = requests.head(url, headers=headers, timeout=10, allow_redirects=True)
+                head_response = self.session.head(url, headers=headers, timeout=10, allow_redirects=True)
                 content_type = head_response.headers.get('Content-Type', '').lower()
                 
                 if 'application/pdf' in content_type:
+                    validators.update(search_cache.response_validators(head_response.headers))
                     # Content-Type doğru, şimdi önizleme için PDF'ten metin çıkarmayı dene
                     if PDF_PREVIEW_AVAILABLE:
-                        preview_text = self._get_pdf_preview(url, headers)
-                        self.validation_result.emit(True, url, preview_text)
-                    else:
-                        self.validation_result.emit(True, url, "PDF Önizleme kullanılamıyor (pdfminer.six kurulu değil)")
-                    return
+                        return True, self._get_pdf_preview(url, headers)
+                    return True, "PDF Önizleme kullanılamıyor (pdfminer.six kurulu değil)"
             except requests.exceptions.RequestException:
                 # HEAD isteği başarısız oldu, GET ile deneyelim
                 pass
                 
             # GET ile PDF içeriğini kontrol et (ilk birkaç byte)
-            response = requests.get(url, headers=headers, timeout=10, stream=True)
-            content_sample = next(response.iter_content(chunk_size=1024))
+            response = self.session.get(url, headers=headers, timeout=10, stream=True)
+            content_sample = next(response.iter_content(chunk_size=1024), b'')
             response.close()
+            if response.status_code < 400:
+                validators.update(search_cache.response_validators(response.headers))
             
             # PDF sihirli numarası ile kontrol
             if content_sample.startswith(b'%PDF-'):
                 if PDF_PREVIEW_AVAILABLE:
-                    preview_text = self._get_pdf_preview(url, headers)
-                    self.validation_result.emit(True, url, preview_text)
-                else:
-                    self.validation_result.emit(True, url, "PDF doğrulandı, önizleme kullanılamıyor")
-            else:
-                self.validation_result.emit(False, url, "Geçersiz PDF. İçerik PDF formatında değil.")
+                    return True, self._get_pdf_preview(url, headers, probe=content_sample)
+                return True, "PDF doğrulandı, önizleme kullanılamıyor"
+            return False, "Geçersiz PDF. İçerik PDF formatında değil."
                 
         except Exception as e:
-            self.validation_result.emit(False, url, f"Doğrulama hatası: {str(e)}")
+            return False, f"Doğrulama hatası: {str(e)}"
     
-    def _get_pdf_preview(self, url, headers):
+    def _get_pdf_preview(self, url, headers, probe=b''):
+        """
+        İlk sayfanın metnini çıkarır. Sunucu Range isteklerini destekliyorsa yalnızca dosya sonundaki xref ile
+        ilk sayfanın nesneleri indirilir; probe, doğrulama sırasında zaten indirilmiş ilk baytlardır.
+        """
         try:
-            response = requests.get(url, headers=headers, timeout=20, stream=True)
-            pdf_bytes = io.BytesIO()
-            
-            # PDF'in ilk 100KB'ını indir (tam dosyayı indirmek yerine)
-            MAX_PREVIEW_SIZE = 100 * 1024  # 100KB
-            bytes_read = 0
-            
-            for chunk in response.iter_content(chunk_size=8192):
-                pdf_bytes.write(chunk)
-                bytes_read += len(chunk)
-                if bytes_read >= MAX_PREVIEW_SIZE:
-                    break
-            
-            pdf_bytes.seek(0)
-            
-            # PDF'ten metin çıkar
-            preview_text = extract_text(pdf_bytes, page_numbers=[0])  # Sadece ilk sayfadan
-            
-            # Metni temizle ve kısalt
-            preview_text = ' '.join(preview_text.split())
-            if len(preview_text) > 500:
-                preview_text = preview_text[:500] + "..."
+            try:
+                request = pdf_range.http_range_request(self.session, url, headers, timeout=20)
+                pdf_file = pdf_range.open_remote(request, probe=probe)
+            except pdf_range.RangeNotSupported:
+                response = self.session.get(url, headers=headers, timeout=20, stream=True)
+                pdf_bytes = io.BytesIO()
                 
-            return preview_text if preview_text.strip() else "PDF'te çıkarılabilir metin bulunamadı."
+                # PDF'in ilk 100KB'ını indir (tam dosyayı indirmek yerine)
+                MAX_PREVIEW_SIZE = 100 * 1024  # 100KB
+                bytes_read = 0
+                
+                for chunk in response.iter_content(chunk_size=8192):
+                    pdf_bytes.write(chunk)
+                    bytes_read += len(chunk)
+                    if bytes_read >= MAX_PREVIEW_SIZE:
+                        break
+                response.close()  # Okunmayan gövdeyi bırak, bağlantı havuza dönsün
+                pdf_file = pdf_bytes.getvalue()
+            
+            # PDF'in ilk sayfasından metin çıkar, temizle ve kısalt
+            return search_pipeline.preview_text(pdf_file)
                 
         except Exception as e:
             return f"Önizleme alınamadı: {str(e)}"
-    
-    def _get_random_headers(self):
-        return {
-            'User-Agent': random.choice(USER_AGENTS),
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'DNT': '1',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-            'Sec-Fetch-Dest': 'document',
-            'Sec-Fetch-Mode': 'navigate',
-            'Sec-Fetch-Site': 'cross-site',
-            'Pragma': 'no-cache',
-            'Cache-Control': 'no-cache',
-        }
 
 # --- Arama İş Parçacığı için Worker ---
 class SearchWorker(QObject):
@@ -159,19 +218,35 @@ class SearchWorker(QObject):
     Çeşitli arama motorlarında PDF aramasını ayrı bir iş parçacığında yürüten worker sınıfı.
     """
     results_ready = Signal(list)  # Sonuçlar: [(başlık, url, açıklama), ...]
+    result_found = Signal(tuple)  # Hazır olan her sonuç anında: (başlık, url, açıklama)
     progress_update = Signal(str, int)  # Durum mesajı, ilerleme yüzdesi
     error = Signal(str)           # Hata mesajı veya durum bilgisi
     finished = Signal()           # İş parçacığının bittiğini bildirir
 
-    def __init__(self, query, engine="Google", num_results=20, verify_urls=True, max_depth=1):
+    def __init__(self, query, engine="Google", num_results=20, verify_urls=True, max_depth=1,
+                 verify_workers=http_pool.DEFAULT_VERIFY_WORKERS, session=None,
+                 streaming=True, concurrency=search_pipeline.DEFAULT_CONCURRENCY,
+                 engine_timeout=search_pipeline.ENGINE_TIMEOUT, cache=None, use_cache=True,
+                 crawl_rate=crawl_scheduler.DEFAULT_RATE, crawl_seed=None, dedup=True):
         super().__init__()
         self.query = query
         self.engine = engine
         self.num_results = num_results
         self.verify_urls = verify_urls
         self.max_depth = max_depth
+        self.verify_workers = verify_workers  # Aynı anda doğrulanan en fazla URL sayısı
+        self.streaming = streaming            # asyncio hattı: sonuçlar doğrulandıkça result_found ile gelir
+        self.concurrency = concurrency        # Hat içinde aynı anda işlenen en fazla URL sayısı
+        self.engine_timeout = engine_timeout  # ALL_ENGINES modunda yavaş bir motorun beklenebileceği en uzun süre
+        # Kalıcı önbellek: tekrar eden aramalar ve doğrulamalar ağa çıkmadan yanıtlanır (sayaçlar: self.cache.stats())
+        self.cache = cache or (search_cache.get_shared_cache() if use_cache else None)
+        self.crawl_rate = crawl_rate          # Derin taramada sunucu başına saniyede en fazla istek
+        self.crawl_seed = crawl_seed          # Sabit tohum: testlerde aynı tarama sırası ve bekleme süreleri
+        self.dedup = dedup                    # Farklı URL'lerdeki aynı PDF'i içerik parmak iziyle tek sonuca indir
         self._is_running = True
-        self.session = requests.Session()
+        self._crawl_deadline = None  # Hat modunda derin taramanın motor zaman aşımından önce bitmesi gereken an
+        # Arama, doğrulama ve site taraması aynı sınırlı bağlantı havuzunu paylaşır
+        self.session = session or http_pool.get_shared_session()
         # Proxy kullanım desteği (ileride eklenebilir)
         # self.session.proxies = {"http": "http://proxy.example.com:8080", "https": "https://proxy.example.com:8080"}
 
@@ -184,24 +259,31 @@ class SearchWorker(QObject):
         try:
             self.progress_update.emit(f"{self.engine} arama motoru kullanılarak PDF'ler aranıyor...", 10)
             
-            if self.engine in SEARCH_ENGINES:
-                engine_config = SEARCH_ENGINES[self.engine]
-                initial_results = self._search_with_engine(
-                    engine_config["base_url"],
-                    engine_config["params"](self.query, self.num_results)
-                )
-            else:
-                # Varsayılan olarak Google'da ara
-                engine_config = SEARCH_ENGINES["Google"]
-                initial_results = self._search_with_engine(
-                    engine_config["base_url"],
-                    engine_config["params"](self.query, self.num_results)
-                )
+            if self.streaming:
+                self._run_pipeline()
+                return
+            
+            # Bilinmeyen motorlarda varsayılan olarak Google'da ara
+            engine = self.engine if self.engine in SEARCH_ENGINES else "Google"
+            engine_config = SEARCH_ENGINES[engine]
+            initial_results = self._search_with_engine(
+                engine,
+                engine_config["base_url"],
+                engine_config["params"](self.query, self.num_results)
+            )
             
             if not self._is_running:
                 self.finished.emit()
                 return
 
+            # Aynı dosyanın farklı URL'lerdeki kopyalarını önizlemeden önce ele
+            if self.dedup and initial_results:
+                self.progress_update.emit("Yinelenen sonuçlar ayıklanıyor...", 45)
+                deduplicator = content_dedup.ContentDeduplicator(
+                    self.session, random_headers, workers=self.verify_workers
+                )
+                initial_results = deduplicator.deduplicate(initial_results)
+
             # PDF URL'lerini doğrula ve detaylandır
             if self.verify_urls and initial_results:
                 self.progress_update.emit("PDF URL'leri doğrulanıyor ve ek bilgiler toplanıyor...", 50)
@@ -234,381 +316,260 @@ class SearchWorker(QObject):
             if self._is_running:
                 self.finished.emit()
 
-    def _search_with_engine(self, base_url, params):
-        """Belirtilen arama motoruyla arama yapar ve PDF sonuçlarını döndürür."""
-        headers = {
+    def _run_pipeline(self):
+        """
+        Arama, doğrulama ve önizlemeyi asyncio hattında üst üste yürütür.
+        Her sonuç hazır olur olmaz result_found ile, tamamı ise sonunda results_ready ile bildirilir.
+        engine ALL_ENGINES ise tüm motorlar aynı anda sorgulanır; sonuçlar tekilleştirilip ortak sıralamayla birleştirilir.
+        """
+        if self.engine == ALL_ENGINES:
+            engines = list(SEARCH_ENGINES)
+            engine_timeout = self.engine_timeout
+        else:
+            engines = [self.engine if self.engine in SEARCH_ENGINES else "Google"]
+            engine_timeout = search_pipeline.SEARCH_TIMEOUT
+        # Derin tarama parse içinde, motorun wait_for süresi içinde çalışır; süre dolarsa motorun tüm sonuçları
+        # atılacağından tarama bu süreden CRAWL_TIMEOUT_MARGIN saniye önce kesilir. Motorlar hat başlarken
+        # aynı anda sorgulandığından süre buradan ölçülür.
+        self._crawl_deadline = time.monotonic() + engine_timeout - CRAWL_TIMEOUT_MARGIN
+        pipeline = search_pipeline.SearchPipeline(
+            [
+                (engine, SEARCH_ENGINES[engine]["base_url"], SEARCH_ENGINES[engine]["params"](self.query, self.num_results))
+                for engine in engines
+            ],
+            self._parse_page,
+            on_result=self.result_found.emit,
+            on_progress=self.progress_update.emit,
+            on_error=self.error.emit,
+            should_continue=lambda: self._is_running,
+            verify=self.verify_urls,
+            num_results=self.num_results,
+            concurrency=self.concurrency,
+            search_headers=self._search_headers,
+            fetch_headers=random_headers,
+            session=self.session,
+            engine_timeout=engine_timeout,
+            cache=self.cache,
+            dedup=self.dedup,
+        )
+        results = asyncio.run(pipeline.run())
+        
+        if not self._is_running:
+            return
+        if results:
+            self.results_ready.emit(results)
+        elif self.verify_urls:
+            self.error.emit("Doğrulanmış PDF bulunamadı. Lütfen farklı anahtar kelimelerle tekrar deneyin.")
+        else:
+            self.error.emit("PDF bulunamadı. Lütfen farklı anahtar kelimelerle tekrar deneyin veya başka bir arama motoru seçin.")
+
+    def _search_headers(self):
+        return {
             'User-Agent': random.choice(USER_AGENTS),
             'Accept-Language': 'tr-TR,tr;q=0.9,en-US;q=0.8,en;q=0.7',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
         }
+
+    def _search_with_engine(self, engine, base_url, params):
+        """Belirtilen arama motoruyla arama yapar ve PDF sonuçlarını döndürür."""
+        cache_key = search_cache.engine_key(engine, params)
+        if self.cache is not None:
+            entry = self.cache.get(search_cache.ENGINE, cache_key)
+            if entry is not None and entry.fresh:
+                return [tuple(result) for result in entry.value]
         
         try:
             # Arama motoruna istek gönder
             response = self.session.get(
                 base_url, 
                 params=params, 
-                headers=headers, 
+                headers=self._search_headers(), 
                 timeout=20
             )
             response.raise_for_status()
             
-            # HTML'i ayrıştır
-            soup = BeautifulSoup(response.text, 'lxml')  # lxml daha hızlı
-            
-            results = []
-            processed_urls = set()
-            
-            # Arama motoruna göre seçicileri ayarla
-            if self.engine == "Google":
-                results = self._parse_google_results(soup, processed_urls)
-            elif self.engine == "Bing":
-                results = self._parse_bing_results(soup, processed_urls)
-            elif self.engine == "DuckDuckGo":
-                results = self._parse_duckduckgo_results(soup, processed_urls)
-            elif self.engine == "Yandex":
-                results = self._parse_yandex_results(soup, processed_urls)
-            else:
-                # Varsayılan olarak Google parser'ı kullan
-                results = self._parse_google_results(soup, processed_urls)
-                
-            # Yeterli sonuç bulunamadıysa ve max_depth > 1 ise, daha fazla derinlemesine ara
-            if len(results) < self.num_results and self.max_depth > 1:
-                self.progress_update.emit("Daha fazla PDF sonucu aranıyor...", 30)
-                
-                # Sayfadaki diğer bağlantıları tara (örn. akademik siteler, repositories vb.)
-                depth_results = self._search_deeper(soup, processed_urls)
-                results.extend(depth_results)
-                
-            return results[:min(len(results), self.num_results)]
+            results = self._parse_page(engine, response.text)
+            results = results[:min(len(results), self.num_results)]
+            if self.cache is not None and results:
+                self.cache.put(search_cache.ENGINE, cache_key, results)
+            return results
             
         except Exception as e:
             self.error.emit(f"Arama motoru sorgulanırken hata: {str(e)}")
             return []
 
-    def _parse_google_results(self, soup, processed_urls):
-        """Google arama sonuçlarından PDF URL'lerini ayrıştırır."""
-        results = []
-        
-        # Google'ın tipik sonuç kapsayıcıları değişebilir, birkaç olası varyasyonu dene
-        possible_containers = [
-            soup.select('div.g'), 
-            soup.select('div.MjjYud'),
-            soup.select('div.Gx5Zad'),
-            soup.select('div.tF2Cxc'),
-            soup.select('div[data-hveid]'),  # Genel bir seçici
-            soup.select('a[href*=".pdf"]')   # Doğrudan PDF bağlantıları
-        ]
-        
-        # Boş olmayan ilk kapsayıcıyı seç
-        containers = next((c for c in possible_containers if c), [])
-        
-        if not containers:
-            # Hiçbir kapsayıcı bulunamadıysa, HTML içindeki tüm bağlantıları kontrol et
-            all_links = soup.find_all('a', href=True)
-            for link in all_links:
-                if not self._is_running:
-                    break
-                    
-                href = link.get('href', '')
-                if self._is_pdf_url(href):
-                    actual_url = self._extract_actual_url_from_google(href)
-                    if actual_url and actual_url not in processed_urls:
-                        title = self._extract_title_from_link(link) or "Başlıksız PDF"
-                        description = self._extract_description_near_link(link) or "Açıklama yok"
-                        results.append((title, actual_url, description))
-                        processed_urls.add(actual_url)
-        
-        # Normal sonuç kapsayıcılarını işle
-        for container in containers:
-            if not self._is_running:
-                break
-                
-            # Kapsayıcı bir div ise bağlantıları ara
-            if container.name == 'div':
-                links = container.find_all('a', href=True)
-                for link in links:
-                    href = link.get('href', '')
-                    if self._is_pdf_url(href):
-                        actual_url = self._extract_actual_url_from_google(href)
-                        if actual_url and actual_url not in processed_urls:
-                            title = self._extract_title_from_container(container) or "Başlıksız PDF"
-                            description = self._extract_description_from_container(container) or "Açıklama yok"
-                            results.append((title, actual_url, description))
-                            processed_urls.add(actual_url)
+    def _parse_page(self, engine, html):
+        """Arama motoru sonuç sayfasını ayrıştırır; gerekirse sayfadaki diğer sitelerde de PDF arar."""
+        # Motora özgü kurallar serp_parser.ENGINE_SPECS içinde; sayfa tek geçişte ayrıştırılır
+        page = serp_parser.parse(engine, html)
+        results = page.results
+        processed_urls = {url for _, url, _ in results}
+            
+        # Yeterli sonuç bulunamadıysa ve max_depth > 1 ise, daha fazla derinlemesine ara
+        if len(results) < self.num_results and self.max_depth > 1 and self._is_running:
+            self.progress_update.emit("Daha fazla PDF sonucu aranıyor...", 30)
+            
+            # Sayfadaki diğer bağlantıları tara (örn. akademik siteler, repositories vb.)
+            depth_results = self._search_deeper(page.links, processed_urls)
+            results.extend(depth_results)
             
-            # Kapsayıcı doğrudan bir bağlantı ise
-            elif container.name == 'a':
-                href = container.get('href', '')
-                if self._is_pdf_url(href):
-                    actual_url = self._extract_actual_url_from_google(href)
-                    if actual_url and actual_url not in processed_urls:
-                        title = self._extract_title_from_link(container) or "Başlıksız PDF"
-                        description = self._extract_description_near_link(container) or "Açıklama yok"
-                        results.append((title, actual_url, description))
-                        processed_urls.add(actual_url)
-        
-        return results
-
-    def _parse_bing_results(self, soup, processed_urls):
-        """Bing arama sonuçlarından PDF URL'lerini ayrıştırır."""
-        results = []
-        
-        # Bing'in yaygın sonuç kapsayıcıları
-        containers = soup.select('li.b_algo') or soup.select('div.b_title') or soup.select('.b_algo')
-        
-        for container in containers:
-            if not self._is_running:
-                break
-                
-            links = container.find_all('a', href=True)
-            for link in links:
-                href = link.get('href', '')
-                if self._is_pdf_url(href) and href not in processed_urls:
-                    title = self._extract_title_from_link(link) or "Başlıksız PDF"
-                    # Bing genellikle bir açıklama paragrafı içerir
-                    description = container.select_one('.b_caption p') 
-                    description = description.get_text(strip=True) if description else "Açıklama yok"
-                    
-                    results.append((title, href, description))
-                    processed_urls.add(href)
-        
-        # Hiç sonuç bulunamadıysa, sayfa üzerindeki tüm PDF bağlantılarını ara
-        if not results:
-            all_links = soup.find_all('a', href=True)
-            for link in all_links:
-                if not self._is_running:
-                    break
-                    
-                href = link.get('href', '')
-                if self._is_pdf_url(href) and href not in processed_urls:
-                    title = self._extract_title_from_link(link) or "Başlıksız PDF"
-                    description = "Açıklama yok"
-                    results.append((title, href, description))
-                    processed_urls.add(href)
-        
-        return results
-
-    def _parse_duckduckgo_results(self, soup, processed_urls):
-        """DuckDuckGo arama sonuçlarından PDF URL'lerini ayrıştırır."""
-        results = []
-        
-        # DuckDuckGo'nun HTML yapısı
-        containers = soup.select('.result') or soup.select('.links_main') or soup.select('.result__body')
-        
-        for container in containers:
-            if not self._is_running:
-                break
-                
-            links = container.find_all('a', href=True)
-            for link in links:
-                href = link.get('href', '')
-                
-                # DDG genellikle yönlendirme URL'leri kullanır
-                if '/l/?kh=' in href or '/l/?uddg=' in href:
-                    # URL'yi çözümle
-                    parsed_url = parse_qs(urlparse(href).query)
-                    actual_url = parsed_url.get('uddg', [None])[0] or parsed_url.get('kh', [None])[0]
-                    
-                    if actual_url and self._is_pdf_url(actual_url) and actual_url not in processed_urls:
-                        title = self._extract_title_from_link(link) or "Başlıksız PDF"
-                        # DDG genellikle snippet/özet içerir
-                        description_elem = container.select_one('.result__snippet')
-                        description = description_elem.get_text(strip=True) if description_elem else "Açıklama yok"
-                        
-                        results.append((title, actual_url, description))
-                        processed_urls.add(actual_url)
-                
-                # Doğrudan PDF bağlantıları
-                elif self._is_pdf_url(href) and href not in processed_urls:
-                    title = self._extract_title_from_link(link) or "Başlıksız PDF"
-                    description = "Açıklama yok"
-                    results.append((title, href, description))
-                    processed_urls.add(href)
-        
-        # Hiç sonuç bulunamadıysa, sayfa üzerindeki tüm PDF bağlantılarını ara
-        if not results:
-            all_links = soup.find_all('a', href=True) 
-            for link in all_links:
-                if not self._is_running:
-                    break
-                    
-                href = link.get('href', '')
-                if '/l/?kh=' in href or '/l/?uddg=' in href:
-                    parsed_url = parse_qs(urlparse(href).query)
-                    actual_url = parsed_url.get('uddg', [None])[0] or parsed_url.get('kh', [None])[0]
-                    
-                    if actual_url and self._is_pdf_url(actual_url) and actual_url not in processed_urls:
-                        title = self._extract_title_from_link(link) or "Başlıksız PDF"
-                        results.append((title, actual_url, "Açıklama yok"))
-                        processed_urls.add(actual_url)
-                elif self._is_pdf_url(href) and href not in processed_urls:
-                    title = self._extract_title_from_link(link) or "Başlıksız PDF"
-                    results.append((title, href, "Açıklama yok"))
-                    processed_urls.add(href)
-        
         return results
 
-    def _parse_yandex_results(self, soup, processed_urls):
-        """Yandex arama sonuçlarından PDF URL'lerini ayrıştırır."""
-        results = []
-        
-        # Yandex'in yaygın sonuç kapsayıcıları
-        containers = soup.select('.serp-item') or soup.select('.organic') or soup.select('.search-result')
-        
-        for container in containers:
-            if not self._is_running:
-                break
-                
-            links = container.find_all('a', href=True)
-            for link in links:
-                href = link.get('href', '')
-                
-                # Yandex genellikle yönlendirme URL'leri kullanır
-                if '/r.xml?' in href:
-                    # URL'yi çözümle
-                    parsed_url = parse_qs(urlparse(href).query)
-                    actual_url = parsed_url.get('u', [None])[0]
-                    
-                    if actual_url and self._is_pdf_url(actual_url) and actual_url not in processed_urls:
-                        title = self._extract_title_from_link(link) or "Başlıksız PDF"
-                        # Yandex genellikle snippet/özet içerir
-                        description_elem = container.select_one('.organic__snippet')
-                        description = description_elem.get_text(strip=True) if description_elem else "Açıklama yok"
-                        
-                        results.append((title, actual_url, description))
-                        processed_urls.add(actual_url)
-                
-                # Doğrudan PDF bağlantıları
-                elif self._is_pdf_url(href) and href not in processed_urls:
-                    title = self._extract_title_from_link(link) or "Başlıksız PDF"
-                    description = "Açıklama yok"
-                    results.append((title, href, description))
-                    processed_urls.add(href)
-        
-        # Hiç sonuç bulunamadıysa, sayfa üzerindeki tüm PDF bağlantılarını ara
-        if not results:
-            all_links = soup.find_all('a', href=True)
-            for link in all_links:
-                if not self._is_running:
-                    break
-                    
-                href = link.get('href', '')
-                if '/r.xml?' in href:
-                    parsed_url = parse_qs(urlparse(href).query)
-                    actual_url = parsed_url.get('u', [None])[0]
-                    
-                    if actual_url and self._is_pdf_url(actual_url) and actual_url not in processed_urls:
-                        title = self._extract_title_from_link(link) or "Başlıksız PDF"
-                        results.append((title, actual_url, "Açıklama yok"))
-                        processed_urls.add(actual_url)
-                elif self._is_pdf_url(href) and href not in processed_urls:
-                    title = self._extract_title_from_link(link) or "Başlıksız PDF"
-                    results.append((title, href, "Açıklama yok"))
-                    processed_urls.add(href)
-        
-        return results
+    def _is_pdf_url(self, url):
+        """Bağlantının (arama motoru yönlendirmesi açıldıktan sonra) PDF dosyası olup olmadığını kontrol eder."""
+        return url_normalize.is_pdf_url(url)
 
-    def _search_deeper(self, soup, processed_urls):
-        """Sayfadaki diğer potansiyel PDF kaynağı olabilecek linkleri tarar."""
-        additional_results = []
-        
-        # Bir depo veya akademik site olabilecek bağlantıları topla
-        potential_sites = set()
-        domain_blacklist = {'google.com', 'bing.com', 'duckduckgo.com', 'yandex.com'}
+    def _search_deeper(self, links, processed_urls):
+        """
+        Sonuç sayfasındaki bağlantılar (href listesi) arasından PDF kaynağı olabilecek siteleri tarar.
+        Tarama crawl_scheduler ile yapılır: siteler öncelik puanına göre sırayla, sunucu başına hız sınırı ve
+        robots.txt kurallarıyla ziyaret edilir; site içi bağlantılar max_depth - 1 seviyeye kadar izlenir.
+        """
+        if self._crawl_deadline is None:
+            time_budget = crawl_scheduler.DEFAULT_TIME_BUDGET
+        else:
+            time_budget = self._crawl_deadline - time.monotonic()
+            if time_budget <= 0:
+                return []
+        scheduler = crawl_scheduler.CrawlScheduler(
+            self.session,
+            random.choice(USER_AGENTS),
+            max_depth=self.max_depth - 1,
+            rate=self.crawl_rate,
+            seed=self.crawl_seed,
+            should_continue=lambda: self._is_running,
+            time_budget=time_budget,
+        )
+        domain_blacklist = ('google.com', 'bing.com', 'duckduckgo.com', 'yandex.com', 'yandex.ru')
         
         # Tüm bağlantıları kontrol et
-        all_links = soup.find_all('a', href=True)
-        for link in all_links:
-            if not self._is_running or len(potential_sites) >= 5:  # En fazla 5 siteyi daha derin ara
-                break
-                
-            href = link.get('href', '')
-            
+        for href in links:
             # URL'nin domain'ini al
-            try:
-                parsed = urlparse(href)
-                if not parsed.netloc:  # Göreceli URL ise, tam URL oluştur
-                    continue
-                
-                domain = parsed.netloc
-                if domain in domain_blacklist or not domain:
-                    continue
-                    
-                # Akademik veya depo olabilecek sitelere öncelik ver
-                priority_keywords = [
-                    'academia', 'researchgate', 'sci-hub', 'repository', 'arxiv', 
-                    'library', 'kutuphane', 'edu', '.ac.', '.gov', 'research', 
-                    'journal', 'conference', 'dergi', 'makale', 'tez'
-                ]
-                
-                # Eğer domain öncelikli anahtar kelimelerden birini içeriyorsa veya şansa bağlı olarak ekle
-                if any(keyword in domain.lower() for keyword in priority_keywords) or random.random() < 0.2:
-                    potential_sites.add(href)
-            except:
+            parsed = urlparse(href)
+            domain = parsed.netloc.lower()
+            if parsed.scheme not in ('http', 'https') or not domain:  # Göreceli URL'ler arama motoruna aittir
+                continue
+            if any(domain == blocked or domain.endswith('.' + blocked) for blocked in domain_blacklist):
                 continue
+            if self._is_pdf_url(href):
+                continue
+            scheduler.add(href)
         
-        # Seçilen siteleri ara
-        with ThreadPoolExecutor(max_workers=3) as executor:
-            future_to_url = {
-                executor.submit(self._extract_pdfs_from_site, site): site 
-                for site in potential_sites
-            }
-            
-            for future in as_completed(future_to_url):
-                if not self._is_running:
-                    break
-                    
-                site = future_to_url[future]
-                try:
-                    site_results = future.result()
-                    for result in site_results:
-                        if result[1] not in processed_urls:
-                            additional_results.append(result)
-                            processed_urls.add(result[1])
-                except Exception as e:
-                    self.progress_update.emit(f"Ek site taranırken hata: {str(e)}", 40)
+        additional_results = []
+        try:
+            for result in scheduler.run():
+                if result[1] not in processed_urls:
+                    additional_results.append(result)
+                    processed_urls.add(result[1])
+        except Exception as e:
+            self.progress_update.emit(f"Ek site taranırken hata: {str(e)}", 40)
         
         return additional_results[:10]  # En fazla 10 ek sonuç döndür
 
-    def _extract_pdfs_from_site(self, url):
-        """Bir site içindeki PDF bağlantılarını tarar ve bulduklarını döndürür."""
-        results = []
-        try:
-            # Siteye istek gönder
-            headers = {
-                'User-Agent': random.choice(USER_AGENTS),
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    def _verify_pdf_urls(self, results):
+        """
+        Sonuçları eşzamanlı olarak doğrular; PDF olmayanları eler, açıklamayı önizleme metniyle değiştirir.
+        Sonuçların sırası korunur.
+        """
+        validator = PDFValidator(session=self.session, cache=self.cache)
+        verified = {}
+        checked = 0
+        
+        with ThreadPoolExecutor(max_workers=max(1, min(self.verify_workers, len(results)))) as executor:
+            future_to_index = {
+                executor.submit(validator.validate_and_preview, url): index
+                for index, (_, url, _) in enumerate(results)
             }
             
-            response = requests.get(url, headers=headers, timeout=10)
-            if response.status_code != 200:
-                return results
-                
-            soup = BeautifulSoup(response.text, 'lxml')
-            
-            # Sayfadaki tüm bağlantıları kontrol et
-            links = soup.find_all('a', href=True)
-            for link in links:
-                if not self._is_running or len(results) >= 10:  # En fazla 10 PDF al
+            for future in as_completed(future_to_index):
+                if not self._is_running:
+                    # Henüz başlamamış doğrulamaları iptal et
+                    for pending in future_to_index:
+                        pending.cancel()
                     break
                     
-                href = link.get('href', '')
-                
-                # Göreceli URL'leri mutlak URL'lere dönüştür
-                full_url = urljoin(url, href)
-                
-                if self._is_pdf_url(full_url):
-                    title = self._extract_title_from_link(link)
-                    if not title:
-                        # Dosya adını URL'den çıkarmayı dene
-                        parsed = urlparse(full_url)
-                        file_name = os.path.basename(unquote(parsed.path))
-                        title = file_name if file_name else "Başlıksız PDF"
-                    
-                    results.append((title, full_url, "Site taramasından bulundu"))
-            
-            return results
+                checked += 1
+                self.progress_update.emit(
+                    f"PDF URL'leri doğrulanıyor... ({checked}/{len(results)})",
+                    50 + checked * 40 // len(results)
+                )
                 
-        except Exception:
-            return results
-        
\ No newline at end of file
+                is_valid, _, message = future.result()
+                if is_valid:
+                    index = future_to_index[future]
+                    title, url, description = results[index]
+                    verified[index] = (title, url, message or description)
+        
+        return [verified[index] for index in sorted(verified)]
+        
+
+# --- Toplu PDF İndirici ---
+class DownloadWorker(QObject):
+    """
+    SearchWorker sonuçlarını download_manager ile indirir. Sonuçlar enqueue() ile eklenir;
+    search_worker.results_ready.connect(download_worker.enqueue) ile arama bitince indirme başlar.
+    Sinyaller indirme iş parçacıklarından yayılır ve Qt tarafından arayüz iş parçacığına iletilir.
+    """
+    file_progress = Signal(str, object, object)  # URL, indirilen bayt, toplam bayt (bilinmiyorsa None)
+    file_finished = Signal(object)               # download_manager.DownloadResult
+    progress_update = Signal(str, int)           # Durum mesajı, tamamlanan dosya yüzdesi
+    error = Signal(str)                          # Hata mesajı
+    finished = Signal()                          # Kuyruktaki tüm indirmeler bittiğinde
+
+    def __init__(self, dest_dir, session=None, max_files=download_manager.DEFAULT_MAX_FILES,
+                 max_connections=download_manager.DEFAULT_MAX_CONNECTIONS,
+                 per_host=download_manager.DEFAULT_PER_HOST, bandwidth=None, index=None):
+        super().__init__()
+        self.index = index  # pdf_index.PdfIndex verilirse indirilen her PDF tam metin dizinine eklenir
+        self._queued = 0
+        self._completed = 0
+        self._failed = 0
+        self._lock = threading.Lock()
+        self.manager = download_manager.DownloadManager(
+            dest_dir,
+            session=session or http_pool.get_shared_session(),
+            max_files=max_files,
+            max_connections=max_connections,
+            per_host=per_host,
+            bandwidth=bandwidth,  # Saniyede en fazla bayt; None ise sınırsız
+            headers={'User-Agent': random.choice(USER_AGENTS)},
+            on_progress=self.file_progress.emit,
+            on_finished=self._on_finished,
+        )
+
+    def enqueue(self, results):
+        """[(başlık, url, açıklama), ...] listesindeki PDF'leri indirme kuyruğuna ekler."""
+        with self._lock:
+            self._queued += len(results)
+        self.manager.submit_results(results)
+        self.progress_update.emit(f"{len(results)} PDF indirme kuyruğuna eklendi", self._percent())
+
+    def stop(self):
+        """İndirmeleri durdurur; yarım kalan dosyalar daha sonra kaldığı yerden sürdürülebilir."""
+        self.manager.cancel()
+
+    def _percent(self):
+        return self._completed * 100 // self._queued if self._queued else 0
+
+    def _on_finished(self, result):
+        if self.index is not None and not result.error:
+            try:
+                self.index.update([result.path], workers=1)
+            except Exception as e:
+                self.error.emit(f"{result.path} dizine eklenemedi: {str(e)}")
+        with self._lock:
+            self._completed += 1
+            if result.error:
+                self._failed += 1
+            done = self._completed == self._queued
+        if result.error:
+            self.error.emit(f"{result.url} indirilemedi: {result.error}")
+        self.file_finished.emit(result)
+        self.progress_update.emit(
+            f"PDF'ler indiriliyor... ({self._completed}/{self._queued})", self._percent()
+        )
+        if done:
+            self.progress_update.emit(
+                f"İndirme tamamlandı: {self._completed - self._failed} başarılı, {self._failed} başarısız", 100
+            )
+            self.finished.emit()
@@ -0,0 +1,40 @@
+# Gerekli kütüphaneler: requests
+# Kurulum: pip install requests
+#
+# Arama, doğrulama ve site taraması trafiğinin ortak bağlantı havuzu.
+# Aynı sunucuya giden istekler açık TCP/TLS bağlantılarını yeniden kullanır;
+# havuzun tuttuğu sunucu sayısı ve sunucu başına bağlantı sayısı sınırlıdır.
+
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+
+DEFAULT_MAX_HOSTS = 32        # havuzda bağlantısı tutulan en fazla sunucu sayısı
+DEFAULT_PER_HOST = 6          # sunucu başına en fazla eşzamanlı bağlantı
+DEFAULT_VERIFY_WORKERS = 16   # SearchWorker'ın varsayılan eşzamanlı URL doğrulama sayısı
+
+_shared_session = None
+_shared_lock = threading.Lock()
+
+
+def create_session(max_hosts=DEFAULT_MAX_HOSTS, per_host=DEFAULT_PER_HOST):
+    """
+    Boyutu sınırlı bağlantı havuzuna sahip bir requests.Session oluşturur.
+    pool_block=True sayesinde bir sunucuya per_host'tan fazla bağlantı açılmaz; fazla istekler sırada bekler.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=max_hosts, pool_maxsize=per_host, pool_block=True)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def get_shared_session():
+    """Süreç genelinde paylaşılan havuzlu oturumu döndürür."""
+    global _shared_session
+    with _shared_lock:
+        if _shared_session is None:
+            _shared_session = create_session()
+        return _shared_session
+
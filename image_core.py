@@ -0,0 +1,315 @@
+# Gerekli kütüphaneler: Pillow, PyPDF2
+# Kurulum: pip install Pillow PyPDF2
+#
+# Arayüzden bağımsız görsel -> PDF dönüştürücü. Görseller süreç havuzunda bir kez çözülür,
+# sayfa çözünürlüğüne (DPI) indirgenir ve önceden kodlanmış JPEG/Flate verisi olarak doğrudan
+# PDF'e gömülür; yazıcı görseli ikinci kez çözmez.
+
+import io
+import itertools
+import os
+import struct
+import time
+import zlib
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from PIL import Image
+from PyPDF2.generic import (
+    ArrayObject,
+    ByteStringObject,
+    DecodedStreamObject,
+    DictionaryObject,
+    EncodedStreamObject,
+    FloatObject,
+    NameObject,
+    NumberObject,
+)
+
+from pdf_stream import StreamingPdfWriter
+
+LETTER = (612.0, 792.0)  # nokta (1/72 inç)
+DEFAULT_DPI = 150
+DEFAULT_JPEG_QUALITY = 85
+
+# Kayıpsız formatlar Flate ile, fotoğraflar JPEG ile kodlanır
+LOSSLESS_FORMATS = {"PNG", "GIF", "BMP", "TIFF"}
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+PNG_COLORS = {0: 1, 2: 3, 3: 1}  # PNG renk tipi -> bileşen sayısı (gri, RGB, paletli)
+
+# Doğrudan aktarım (yeniden kodlamadan gömme) seçenekleri:
+#   "auto"   -> görsel hedef DPI'ı aşmıyorsa aktar, aşıyorsa küçült
+#   "always" -> desteklenen her JPEG/PNG'yi çözünürlüğüne bakmadan aktar
+#   "never"  -> her görseli çözüp yeniden kodla
+PASSTHROUGH_MODES = ("auto", "always", "never")
+
+
+def fit_size(width, height, page_width, page_height):
+    """Görsel sayfadan büyükse en-boy oranını koruyarak sayfaya sığdırır, küçükse olduğu gibi bırakır."""
+    scale = min(page_width / width, page_height / height, 1.0)
+    return width * scale, height * scale
+
+
+def _flatten(img):
+    """Saydamlığı beyaz zemine bastırır ve görseli RGB veya gri tonlamaya çevirir."""
+    if img.mode in ("RGBA", "LA") or (img.mode == "P" and "transparency" in img.info):
+        img = img.convert("RGBA")
+        background = Image.new("RGB", img.size, (255, 255, 255))
+        background.paste(img, mask=img.getchannel("A"))
+        return background
+    if img.mode in ("L", "RGB"):
+        return img
+    if img.mode in ("1", "I", "I;16", "F"):
+        return img.convert("L")
+    return img.convert("RGB")
+
+
+def _jpeg_passthrough(img, path):
+    """JPEG dosyasının DCT verisini olduğu gibi döndürür; desteklenmeyen durumda (None, sebep) verir."""
+    if img.mode not in ("L", "RGB"):
+        # CMYK/YCCK JPEG'lerde Adobe ters çevirme işaretleri ayrıca ele alınmalı; yeniden kodlamak daha güvenli
+        return None, f"{img.mode} JPEG needs re-encoding"
+    with open(path, "rb") as jpeg_file:
+        data = jpeg_file.read()
+    return {
+        "width": img.width,
+        "height": img.height,
+        "color_space": "/DeviceGray" if img.mode == "L" else "/DeviceRGB",
+        "filter": "/DCTDecode",
+        "data": data,
+    }, "original JPEG data"
+
+
+def _png_passthrough(path):
+    """
+    PNG'nin IDAT verisini PNG öngörücülü bir Flate akışı olarak döndürür.
+    Yalnızca 8 bitlik, taramalı (interlaced) olmayan, saydamlık içermeyen gri/RGB/paletli PNG'ler desteklenir.
+    """
+    with open(path, "rb") as png_file:
+        data = png_file.read()
+    if not data.startswith(PNG_SIGNATURE):
+        return None, "not a PNG file"
+
+    header, palette, idat = None, None, []
+    position = len(PNG_SIGNATURE)
+    while position + 8 <= len(data):
+        length, chunk_type = struct.unpack(">I4s", data[position:position + 8])
+        body = data[position + 8:position + 8 + length]
+        position += length + 12
+        if chunk_type == b"IHDR":
+            header = struct.unpack(">IIBBBBB", body)
+        elif chunk_type == b"PLTE":
+            palette = body
+        elif chunk_type == b"tRNS":
+            return None, "PNG transparency needs re-encoding"
+        elif chunk_type == b"IDAT":
+            idat.append(body)
+        elif chunk_type == b"IEND":
+            break
+
+    if header is None:
+        return None, "PNG header missing"
+    width, height, bit_depth, color_type, _, _, interlace = header
+    if color_type not in PNG_COLORS:
+        return None, "PNG alpha channel needs re-encoding"
+    if bit_depth != 8:
+        return None, f"{bit_depth}-bit PNG needs re-encoding"
+    if interlace:
+        return None, "interlaced PNG needs re-encoding"
+    if color_type == 3 and not palette:
+        return None, "PNG palette missing"
+
+    return {
+        "width": width,
+        "height": height,
+        "color_space": "/Indexed" if color_type == 3 else ("/DeviceGray" if color_type == 0 else "/DeviceRGB"),
+        "palette": palette if color_type == 3 else None,
+        "filter": "/FlateDecode",
+        "colors": PNG_COLORS[color_type],
+        "data": b"".join(idat),
+    }, "original PNG data"
+
+
+def prepare_image(path, page_size=LETTER, dpi=DEFAULT_DPI, quality=DEFAULT_JPEG_QUALITY, passthrough="auto"):
+    """
+    Görseli PDF'e gömülecek biçimde hazırlar. Uygunsa JPEG/PNG verisi çözülmeden aktarılır (passthrough);
+    değilse görsel çözülür, sayfadaki çizim boyutuna ve hedef DPI'a göre yeniden örneklenir ve kodlanır.
+    Sonuçtaki "method" ve "reason" alanları hangi yolun neden seçildiğini söyler.
+    Süreç havuzunda çalıştırılmak üzere yalnızca seçilebilir (picklable) değerler döndürür.
+    """
+    if passthrough not in PASSTHROUGH_MODES:
+        raise ValueError(f"Unknown passthrough mode: {passthrough!r}")
+
+    with Image.open(path) as img:
+        source_format = img.format
+        draw_width, draw_height = fit_size(img.width, img.height, *page_size)
+        target = (
+            max(1, round(draw_width * dpi / 72)),
+            max(1, round(draw_height * dpi / 72)),
+        )
+        needs_downscale = img.width > target[0] or img.height > target[1]
+
+        if passthrough == "never":
+            reason = "passthrough disabled"
+        elif passthrough == "auto" and needs_downscale:
+            reason = f"downscaled to {dpi} DPI"
+        elif source_format == "JPEG":
+            prepared, reason = _jpeg_passthrough(img, path)
+        elif source_format == "PNG":
+            prepared, reason = _png_passthrough(path)
+        else:
+            prepared, reason = None, f"{source_format} is not supported for passthrough"
+
+        if passthrough != "never" and reason in ("original JPEG data", "original PNG data"):
+            prepared.update({
+                "path": path,
+                "method": "passthrough",
+                "reason": reason,
+                "draw_width": draw_width,
+                "draw_height": draw_height,
+            })
+            return prepared
+
+        if needs_downscale:
+            # JPEG'lerde draft, çözme sırasında DCT ölçeklemesi yaparak tam çözünürlüğü hiç açmaz
+            img.draft("RGB", target)
+            img = img.resize(target, Image.LANCZOS)
+        img = _flatten(img)
+
+        if source_format in LOSSLESS_FORMATS:
+            data = zlib.compress(img.tobytes(), 6)
+            pdf_filter = "/FlateDecode"
+        else:
+            buffer = io.BytesIO()
+            img.save(buffer, "JPEG", quality=quality, optimize=True)
+            data = buffer.getvalue()
+            pdf_filter = "/DCTDecode"
+
+        return {
+            "path": path,
+            "method": "reencoded",
+            "reason": reason,
+            "width": img.width,
+            "height": img.height,
+            "color_space": "/DeviceGray" if img.mode == "L" else "/DeviceRGB",
+            "filter": pdf_filter,
+            "data": data,
+            "draw_width": draw_width,
+            "draw_height": draw_height,
+        }
+
+
+def add_image_page(writer, prepared, page_size=LETTER):
+    """Hazırlanmış görseli yeni bir sayfanın sol alt köşesine yerleştirir."""
+    image = EncodedStreamObject()
+    image._data = prepared["data"]
+    if prepared.get("palette"):
+        color_space = ArrayObject([
+            NameObject("/Indexed"),
+            NameObject("/DeviceRGB"),
+            NumberObject(len(prepared["palette"]) // 3 - 1),
+            ByteStringObject(prepared["palette"]),
+        ])
+    else:
+        color_space = NameObject(prepared["color_space"])
+    image.update({
+        NameObject("/Type"): NameObject("/XObject"),
+        NameObject("/Subtype"): NameObject("/Image"),
+        NameObject("/Width"): NumberObject(prepared["width"]),
+        NameObject("/Height"): NumberObject(prepared["height"]),
+        NameObject("/ColorSpace"): color_space,
+        NameObject("/BitsPerComponent"): NumberObject(8),
+        NameObject("/Filter"): NameObject(prepared["filter"]),
+    })
+    if prepared.get("colors"):
+        # PNG IDAT verisi satır başına öngörücü baytı içerir
+        image[NameObject("/DecodeParms")] = DictionaryObject({
+            NameObject("/Predictor"): NumberObject(15),
+            NameObject("/Colors"): NumberObject(prepared["colors"]),
+            NameObject("/BitsPerComponent"): NumberObject(8),
+            NameObject("/Columns"): NumberObject(prepared["width"]),
+        })
+    image_ref = writer.add_object(image)
+
+    contents = DecodedStreamObject()
+    contents._data = b"q %.4f 0 0 %.4f 0 0 cm /Im0 Do Q" % (prepared["draw_width"], prepared["draw_height"])
+    contents_ref = writer.add_object(contents)
+
+    page = DictionaryObject({
+        NameObject("/Type"): NameObject("/Page"),
+        NameObject("/MediaBox"): ArrayObject([NumberObject(0), NumberObject(0),
+                                              FloatObject(page_size[0]), FloatObject(page_size[1])]),
+        NameObject("/Resources"): DictionaryObject({
+            NameObject("/XObject"): DictionaryObject({NameObject("/Im0"): image_ref}),
+        }),
+        NameObject("/Contents"): contents_ref,
+    })
+    return writer.add_page(page)
+
+
+def iter_prepared_images(image_paths, page_size=LETTER, dpi=DEFAULT_DPI, quality=DEFAULT_JPEG_QUALITY,
+                         workers=None, window=None, passthrough="auto", mp_context=None):
+    """
+    Görselleri süreç havuzunda hazırlar ve giriş sırasıyla tek tek üretir (generator).
+    Aynı anda en fazla window kadar görsel hazırlanır ya da teslim edilmeyi bekler; böylece
+    bellek kullanımı görsel sayısından bağımsız kalır. image_paths bir generator da olabilir.
+    mp_context verilirse süreç havuzu bu multiprocessing bağlamıyla başlatılır.
+    """
+    workers = workers or os.cpu_count() or 1
+    window = window or workers * 2
+    prepare = partial(prepare_image, page_size=page_size, dpi=dpi, quality=quality, passthrough=passthrough)
+    paths = iter(image_paths)
+    in_flight = deque()
+
+    executor = ProcessPoolExecutor(max_workers=workers, mp_context=mp_context)
+    try:
+        for path in itertools.islice(paths, window):
+            in_flight.append(executor.submit(prepare, path))
+        while in_flight:
+            prepared = in_flight.popleft().result()
+            for path in itertools.islice(paths, 1):
+                in_flight.append(executor.submit(prepare, path))
+            yield prepared
+    finally:
+        # Tüketici erken durursa bekleyen işler iptal edilir
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def convert_images_to_pdf(image_paths, output, page_size=LETTER, dpi=DEFAULT_DPI,
+                          quality=DEFAULT_JPEG_QUALITY, workers=None, progress=None, window=None,
+                          passthrough="auto", mp_context=None):
+    """
+    Görselleri akış halinde hazırlayıp her birini ayrı bir sayfa olarak PDF'e yazar.
+    Her sayfa yazıldıktan hemen sonra diske aktarılır; bellekte yalnızca hazırlanma penceresindeki görseller bulunur.
+    progress(tamamlanan, toplam) her sayfa yazıldığında çağrılır (image_paths bir generator ise toplam None olur).
+    Görsel sayısı, yazılan bayt, süre ve her dosya için kullanılan yolu (passthrough/reencoded) döndürür.
+    """
+    total = len(image_paths) if hasattr(image_paths, "__len__") else None
+    if total == 0:
+        raise ValueError("No images to convert")
+    started = time.perf_counter()
+
+    count = 0
+    report = []
+    with StreamingPdfWriter(output) as writer:
+        for prepared in iter_prepared_images(image_paths, page_size, dpi, quality, workers, window, passthrough,
+                                             mp_context):
+            add_image_page(writer, prepared, page_size)
+            report.append({"path": prepared["path"], "method": prepared["method"], "reason": prepared["reason"]})
+            del prepared
+            writer.flush()
+            count += 1
+            if progress is not None:
+                progress(count, total)
+        if count == 0:
+            raise ValueError("No images to convert")
+
+    return {
+        "images": count,
+        "bytes_written": writer.bytes_written,
+        "seconds": time.perf_counter() - started,
+        "passthrough": sum(1 for entry in report if entry["method"] == "passthrough"),
+        "report": report,
+    }
@@ -1,11 +1,10 @@
+import os
 import sys
-from PyQt6.QtWidgets import QApplication, QFileDialog, QWidget, QVBoxLayout, QPushButton, QLabel, QListWidget, QMessageBox, QTabWidget, QLineEdit
+from PyQt6.QtWidgets import QApplication, QFileDialog, QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QListWidget, QMessageBox, QTabWidget, QLineEdit, QProgressBar, QCheckBox, QListWidgetItem, QSpinBox
 from PyQt6.QtCore import Qt
-from PyPDF2 import PdfReader, PdfWriter
+from pdf_jobs import JobRunner, split_job, batch_split_job, merge_job, images_to_pdf_job
 from PyQt6.QtGui import QFont
-from PIL import Image
-from reportlab.pdfgen import canvas
-from reportlab.lib.pagesizes import letter
+import image_core
 
 class PDFHandler(QWidget):
     def __init__(self):
@@ -57,6 +56,20 @@ class PDFHandler(QWidget):
         self.execute_split_button.clicked.connect(self.split_pdf)
         self.split_layout.addWidget(self.execute_split_button)
 
+        self.split_batch_label = QLabel("Batch ranges (e.g. 1-5,6-12,13- or every 10) or CSV manifest:")
+        self.split_layout.addWidget(self.split_batch_label)
+
+        self.split_batch_edit = QLineEdit()
+        self.split_layout.addWidget(self.split_batch_edit)
+
+        self.split_manifest_button = QPushButton("Load CSV manifest...")
+        self.split_manifest_button.clicked.connect(self.select_split_manifest)
+        self.split_layout.addWidget(self.split_manifest_button)
+
+        self.execute_batch_split_button = QPushButton("Batch Split PDF")
+        self.execute_batch_split_button.clicked.connect(self.batch_split_pdf)
+        self.split_layout.addWidget(self.execute_batch_split_button)
+
         self.tabs.addTab(self.split_widget, "Split")
 
         # Merge tab
@@ -82,6 +95,12 @@ class PDFHandler(QWidget):
         self.merge_pdf_list.setFont(font)
         self.merge_layout.addWidget(self.merge_pdf_list)
 
+        self.merge_streaming_check = QCheckBox("Low-memory merge (write pages to disk as they are read)")
+        self.merge_layout.addWidget(self.merge_streaming_check)
+
+        self.merge_dedup_check = QCheckBox("Deduplicate shared fonts and images across inputs")
+        self.merge_layout.addWidget(self.merge_dedup_check)
+
         self.execute_merge_button = QPushButton("Merge PDFs")
         self.execute_merge_button.clicked.connect(self.merge_pdfs)
         self.merge_layout.addWidget(self.execute_merge_button)
@@ -108,19 +127,62 @@ class PDFHandler(QWidget):
         self.image_list.setFont(font)
         self.image_layout.addWidget(self.image_list)
 
+        self.image_dpi_label = QLabel("Target image resolution (DPI):")
+        self.image_layout.addWidget(self.image_dpi_label)
+
+        self.image_dpi_spin = QSpinBox()
+        self.image_dpi_spin.setRange(72, 600)
+        self.image_dpi_spin.setValue(image_core.DEFAULT_DPI)
+        self.image_layout.addWidget(self.image_dpi_spin)
+
+        self.image_passthrough_check = QCheckBox("Embed JPEG/PNG files as-is (no re-encoding, keeps full resolution)")
+        self.image_layout.addWidget(self.image_passthrough_check)
+
         self.execute_image_button = QPushButton("Convert to PDF")
         self.execute_image_button.clicked.connect(self.convert_images_to_pdf)
         self.image_layout.addWidget(self.execute_image_button)
 
         self.tabs.addTab(self.image_widget, "Images to PDF")
 
-        self.setFixedSize(800, 600)
+        # Job queue shared by all tabs
+        self.job_items = {}
+        self.job_runner = JobRunner(max_concurrent=2, parent=self)
+        self.job_runner.job_added.connect(self.job_added)
+        self.job_runner.signals.started.connect(lambda job_id: self.set_job_status(job_id, "running"))
+        self.job_runner.signals.progress_update.connect(self.update_job_progress)
+        self.job_runner.signals.result.connect(lambda job_id, result: self.set_job_status(job_id, "done"))
+        self.job_runner.signals.error.connect(lambda job_id, message: self.set_job_status(job_id, f"failed ({message})"))
+        self.job_runner.signals.cancelled.connect(lambda job_id: self.set_job_status(job_id, "cancelled"))
+        self.job_runner.signals.finished.connect(self.job_finished)
+
+        self.job_list = QListWidget()
+        self.job_list.setSelectionMode(QListWidget.SelectionMode.ExtendedSelection)
+        self.job_list.setMaximumHeight(100)
+        self.main_layout.addWidget(self.job_list)
+
+        self.job_progress_bar = QProgressBar()
+        self.main_layout.addWidget(self.job_progress_bar)
+
+        self.job_controls_layout = QHBoxLayout()
+        self.max_jobs_label = QLabel("Max concurrent jobs:")
+        self.job_controls_layout.addWidget(self.max_jobs_label)
+        self.max_jobs_spin = QSpinBox()
+        self.max_jobs_spin.setRange(1, max(2, os.cpu_count() or 1))
+        self.max_jobs_spin.setValue(self.job_runner.max_concurrent)
+        self.max_jobs_spin.valueChanged.connect(self.job_runner.set_max_concurrent)
+        self.job_controls_layout.addWidget(self.max_jobs_spin)
+        self.cancel_job_button = QPushButton("Cancel Selected Jobs")
+        self.cancel_job_button.clicked.connect(self.cancel_selected_jobs)
+        self.job_controls_layout.addWidget(self.cancel_job_button)
+        self.main_layout.addLayout(self.job_controls_layout)
+
+        self.setFixedSize(800, 780)
         self.setLayout(self.main_layout)
 
     def select_input_pdf(self):
         file_name, _ = QFileDialog.getOpenFileName(self, "Open PDF", "", "PDF Files (*.pdf)")
         if file_name:
-            self.input_pdf = PdfReader(file_name)
+            self.input_pdf_path = file_name
             self.split_input_label.setText(file_name)
 
     def select_output_pdf(self):
@@ -145,40 +207,105 @@ class PDFHandler(QWidget):
         try:
             start_page = int(self.split_start_page_edit.text())
             end_page = int(self.split_end_page_edit.text())
-
+            input_file = self.input_pdf_path
             output_file = self.split_output_label.text()
-            self.input_pdf_writer = PdfWriter()
-            for page in range(start_page - 1, end_page):
-                self.input_pdf_writer.add_page(self.input_pdf.pages[page])
-
-            with open(output_file, "wb") as out_file:
-                self.input_pdf_writer.write(out_file)
-
-            QMessageBox.information(self, "Job done", "PDF splitting successfully!")
-            self.split_input_label.clear()
-            self.split_input_label.setText("Select input PDF:")
-            self.split_output_label.clear()
-            self.split_output_label.setText("Select output PDF:")
-            self.split_start_page_edit.clear()
-            self.split_end_page_edit.clear()
         except Exception as e:
             QMessageBox.information(self, "Job done", "PDF split wasn't successful because " + str(e))
+            return
+
+        self.job_runner.submit(f"Split {os.path.basename(input_file)}",
+                               split_job(input_file, start_page, end_page, output_file),
+                               on_result=self.split_done,
+                               on_error=lambda message: QMessageBox.information(
+                                   self, "Job done", "PDF split wasn't successful because " + message))
+
+    def split_done(self, output_file):
+        QMessageBox.information(self, "Job done", "PDF splitting successfully!")
+        self.split_input_label.clear()
+        self.split_input_label.setText("Select input PDF:")
+        self.split_output_label.clear()
+        self.split_output_label.setText("Select output PDF:")
+        self.split_start_page_edit.clear()
+        self.split_end_page_edit.clear()
+
+    def select_split_manifest(self):
+        file_name, _ = QFileDialog.getOpenFileName(self, "Open Manifest", "", "CSV Files (*.csv)")
+        if file_name:
+            self.split_batch_edit.setText(file_name)
+
+    def batch_split_pdf(self):
+        if not getattr(self, "input_pdf_path", None):
+            QMessageBox.information(self, "Job done", "PDF batch split wasn't successful because no input PDF is selected")
+            return
+
+        spec = self.split_batch_edit.text().strip()
+        output_dir = None
+        # Manifest satırları çıktı yollarını kendisi belirtir
+        if not spec.lower().endswith(".csv"):
+            output_dir = QFileDialog.getExistingDirectory(self, "Select Output Folder")
+            if not output_dir:
+                return
+
+        self.job_runner.submit(f"Batch split {os.path.basename(self.input_pdf_path)}",
+                               batch_split_job(self.input_pdf_path, spec, output_dir),
+                               on_result=self.batch_split_done,
+                               on_error=lambda message: QMessageBox.information(
+                                   self, "Job done", "PDF batch split wasn't successful because " + message))
+        self.split_batch_edit.clear()
+
+    def batch_split_done(self, stats):
+        QMessageBox.information(self, "Job done", f"{stats['files']} PDFs written, {stats['pages']} pages "
+                                                  f"({stats['pages_per_second']:.0f} pages/sec)")
 
     def merge_pdfs(self):
         output_file, _ = QFileDialog.getSaveFileName(self, "Save Merged PDF", "", "PDF Files (*.pdf)")
         if output_file:
-            output_pdf = PdfWriter()
-            for i in range(self.merge_pdf_list.count()):
-                file_name = self.merge_pdf_list.item(i).text()
-                input_pdf = PdfReader(file_name)
-                for page in range(len(input_pdf.pages)):
-                    output_pdf.add_page(input_pdf.pages[page])
+            file_names = [self.merge_pdf_list.item(i).text() for i in range(self.merge_pdf_list.count())]
+            self.job_runner.submit(f"Merge {len(file_names)} PDFs",
+                                   merge_job(file_names, output_file,
+                                             streaming=self.merge_streaming_check.isChecked(),
+                                             dedup=self.merge_dedup_check.isChecked()),
+                                   on_result=self.merge_done,
+                                   on_error=self.merge_error)
+            self.merge_pdf_list.clear()
 
-            with open(output_file, "wb") as out_file:
-                output_pdf.write(out_file)
+    def merge_done(self, stats):
+        message = "PDFs merged successfully!"
+        if stats.get("bytes_saved"):
+            message += f" Deduplication saved {stats['bytes_saved'] / (1024 * 1024):.1f} MB."
+        QMessageBox.information(self, "Job done", message)
 
-            QMessageBox.information(self, "Job done", "PDFs merged successfully!")
-            self.merge_pdf_list.clear()
+    def merge_error(self, message):
+        QMessageBox.critical(self, "Error", f"PDF merge wasn't successful because {message}")
+
+    def job_added(self, job_id, name):
+        item = QListWidgetItem(f"#{job_id} {name}: queued")
+        item.setData(Qt.ItemDataRole.UserRole, job_id)
+        self.job_list.addItem(item)
+        self.job_items[job_id] = (item, name)
+
+    def set_job_status(self, job_id, status):
+        if job_id in self.job_items:
+            item, name = self.job_items[job_id]
+            item.setText(f"#{job_id} {name}: {status}")
+
+    def update_job_progress(self, job_id, message, percent):
+        self.set_job_status(job_id, f"{message} {percent}%")
+        self.job_progress_bar.setFormat(f"#{job_id} {message}")
+        self.job_progress_bar.setValue(percent)
+
+    def job_finished(self, job_id):
+        if self.job_runner.running_count == 0 and self.job_runner.pending_count == 0:
+            self.job_progress_bar.reset()
+
+    def cancel_selected_jobs(self):
+        for item in self.job_list.selectedItems():
+            self.job_runner.cancel(item.data(Qt.ItemDataRole.UserRole))
+
+    def closeEvent(self, event):
+        self.job_runner.cancel_all()
+        self.job_runner.wait_for_done()
+        super().closeEvent(event)
 
     def convert_images_to_pdf(self):
         if self.image_list.count() == 0:
@@ -189,32 +316,24 @@ class PDFHandler(QWidget):
         if not output_file:
             return
 
-        try:
-            c = canvas.Canvas(output_file, pagesize=letter)
-            width, height = letter
-
-            for i in range(self.image_list.count()):
-                image_path = self.image_list.item(i).text()
-                img = Image.open(image_path)
-                img_width, img_height = img.size
-
-                aspect_ratio = img_width / img_height
-                if img_width > width or img_height > height:
-                    if aspect_ratio > 1:
-                        img_width = width
-                        img_height = width / aspect_ratio
-                    else:
-                        img_height = height
-                        img_width = height * aspect_ratio
-
-                c.drawImage(image_path, 0, 0, img_width, img_height)
-                c.showPage()
-
-            c.save()
-            QMessageBox.information(self, "Success", "Images have been converted to PDF successfully!")
-            self.image_list.clear()
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"An error occurred: {e}")
+        image_paths = [self.image_list.item(i).text() for i in range(self.image_list.count())]
+        self.job_runner.submit(f"Convert {len(image_paths)} images",
+                               images_to_pdf_job(image_paths, output_file, self.image_dpi_spin.value(),
+                                                 "always" if self.image_passthrough_check.isChecked() else "auto"),
+                               on_result=self.convert_done,
+                               on_error=lambda message: QMessageBox.critical(
+                                   self, "Error", f"An error occurred: {message}"))
+        self.image_list.clear()
+
+    def convert_done(self, stats):
+        reencoded = [entry for entry in stats["report"] if entry["method"] != "passthrough"]
+        message = (f"Images have been converted to PDF successfully! "
+                   f"{stats['passthrough']} embedded as-is, {len(reencoded)} re-encoded.")
+        if reencoded:
+            message += "\n\n" + "\n".join(f"{os.path.basename(entry['path'])}: {entry['reason']}"
+                                           for entry in reencoded[:20])
+        QMessageBox.information(self, "Success", message)
+
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
@@ -0,0 +1,325 @@
+# Gerekli kütüphaneler: PyPDF2, Pillow (görsel işleri için), PyYAML (opsiyonel, YAML manifestleri için)
+# Kurulum: pip install PyPDF2 Pillow PyYAML
+#
+# Bölme, birleştirme ve görsel -> PDF işlerini arayüz olmadan, bir manifestten toplu çalıştıran komut satırı aracı.
+# İşler süreç havuzunda yürütülür; her iş bittiğinde sonucu stdout'a bir JSON satırı olarak yazılır.
+# Herhangi bir iş başarısız olursa çıkış kodu 1, manifest okunamazsa 2 olur.
+#
+# Kullanım: python pdf_batch.py jobs.json --workers 8 > results.jsonl
+#
+# Manifest bir iş listesi ya da {"defaults": {...}, "jobs": [...]} sözlüğüdür; defaults her işe uygulanır.
+# Göreceli yollar manifestin bulunduğu klasöre göre çözülür. İş türleri:
+#   {"type": "split", "input": "a.pdf", "start": 1, "end": 5, "output": "a_1-5.pdf"}
+#   {"type": "split", "input": "a.pdf", "ranges": "1-5,6-" veya "every 10", "output_dir": "parts"}
+#   {"type": "split", "input": "a.pdf", "manifest": "ranges.csv"}
+#   {"type": "merge", "inputs": ["a.pdf", "b.pdf"], "output": "ab.pdf", "dedup": false}
+#   {"type": "images", "inputs": ["scans/*.jpg"], "output": "scans.pdf", "dpi": 150, "passthrough": "auto",
+#    "page_size": [612, 792]}   (passthrough: true/false ya da "auto"/"always"/"never")
+
+import argparse
+import glob
+import itertools
+import json
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+import pdf_core
+import pdf_lazy
+import pdf_stream
+
+# Görsel işleri Pillow gerektirir (opsiyonel)
+try:
+    import image_core
+    IMAGES_AVAILABLE = True
+except ImportError:
+    IMAGES_AVAILABLE = False
+
+# YAML manifestleri için PyYAML (opsiyonel)
+try:
+    import yaml
+    YAML_AVAILABLE = True
+except ImportError:
+    YAML_AVAILABLE = False
+
+EXIT_OK = 0
+EXIT_FAILED = 1
+EXIT_BAD_MANIFEST = 2
+
+JOB_FIELDS = {
+    "split": {"input"},
+    "merge": {"inputs", "output"},
+    "images": {"inputs", "output"},
+}
+PATH_FIELDS = ("input", "output", "output_dir", "manifest")
+INT_FIELDS = ("start", "end", "workers", "dpi", "quality")
+BOOL_FIELDS = ("dedup",)
+
+
+class ManifestError(ValueError):
+    """Manifest okunamadığında veya bir iş tanımı geçersiz olduğunda fırlatılır."""
+
+
+def load_manifest(path):
+    """Manifesti okur ve (iş listesi, göreceli yolların çözüleceği klasör) döndürür. "-" stdin'den JSON okur."""
+    if path == "-":
+        text, base_dir = sys.stdin.read(), os.getcwd()
+    else:
+        with open(path, encoding="utf-8") as manifest:
+            text = manifest.read()
+        base_dir = os.path.dirname(os.path.abspath(path))
+
+    if path.lower().endswith((".yaml", ".yml")):
+        if not YAML_AVAILABLE:
+            raise ManifestError("YAML manifests need PyYAML (pip install PyYAML)")
+        try:
+            data = yaml.safe_load(text)
+        except yaml.YAMLError as e:
+            raise ManifestError(f"Invalid YAML manifest: {e}") from e
+    else:
+        try:
+            data = json.loads(text)
+        except ValueError as e:
+            raise ManifestError(f"Invalid JSON manifest: {e}") from e
+
+    defaults = {}
+    if isinstance(data, dict):
+        defaults = data.get("defaults") or {}
+        data = data.get("jobs")
+    if not isinstance(data, list) or not isinstance(defaults, dict):
+        raise ManifestError('Manifest must be a list of jobs or {"defaults": {...}, "jobs": [...]}')
+    return [prepare_job({**defaults, **job} if isinstance(job, dict) else job, index, base_dir)
+            for index, job in enumerate(data, start=1)], base_dir
+
+
+def _expand_inputs(inputs, base_dir):
+    # Joker karakterli girişler (scans/*.jpg) sıralı dosya listesine açılır
+    paths = []
+    for pattern in inputs:
+        pattern = os.path.join(base_dir, os.path.expanduser(pattern))
+        if glob.has_magic(pattern):
+            matches = sorted(glob.glob(pattern))
+            if not matches:
+                raise ManifestError(f"No files match {pattern}")
+            paths.extend(matches)
+        else:
+            paths.append(pattern)
+    return paths
+
+
+def _is_int(value):
+    # Çalıştırıcılar int() ile çevirir: "3" kabul edilir, 2.5, true veya null edilmez
+    if isinstance(value, str):
+        try:
+            int(value)
+        except ValueError:
+            return False
+        return True
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def prepare_job(job, index, base_dir):
+    """İş tanımını doğrular, yollarını çözer ve "index"/"id" alanlarını ekler."""
+    if not isinstance(job, dict):
+        raise ManifestError(f"Job {index}: expected an object, got {type(job).__name__}")
+    job_type = job.get("type")
+    if job_type not in JOB_FIELDS:
+        raise ManifestError(f"Job {index}: unknown type {job_type!r} (expected one of {', '.join(JOB_FIELDS)})")
+    missing = JOB_FIELDS[job_type] - job.keys()
+    if missing:
+        raise ManifestError(f"Job {index}: missing {', '.join(sorted(missing))}")
+    if job_type == "split" and not ({"start", "output"} <= job.keys() or "ranges" in job or "manifest" in job):
+        raise ManifestError(f"Job {index}: split needs start/end/output, ranges or manifest")
+    if job_type == "images" and not IMAGES_AVAILABLE:
+        raise ManifestError(f"Job {index}: image jobs need Pillow (pip install Pillow)")
+
+    for field in PATH_FIELDS:
+        if field in job and not isinstance(job[field], str):
+            raise ManifestError(f"Job {index}: {field} must be a path, got {type(job[field]).__name__}")
+    inputs = job.get("inputs")
+    if "inputs" in job and not (isinstance(inputs, str)
+                                or isinstance(inputs, list) and all(isinstance(path, str) for path in inputs)):
+        raise ManifestError(f"Job {index}: inputs must be a path or a list of paths")
+    for field in INT_FIELDS:
+        if field in job and not _is_int(job[field]):
+            raise ManifestError(f"Job {index}: {field} must be an integer, got {job[field]!r}")
+    for field in BOOL_FIELDS:
+        if field in job and not isinstance(job[field], bool):
+            raise ManifestError(f"Job {index}: {field} must be true or false, got {job[field]!r}")
+    page_size = job.get("page_size")
+    if "page_size" in job and not (isinstance(page_size, list) and len(page_size) == 2
+                                   and all(_is_number(side) and side > 0 for side in page_size)):
+        raise ManifestError(f"Job {index}: page_size must be [width, height] in points, got {page_size!r}")
+    passthrough = job.get("passthrough")
+    if job_type == "images" and "passthrough" in job and not (
+            isinstance(passthrough, bool) or passthrough in image_core.PASSTHROUGH_MODES):
+        raise ManifestError(f"Job {index}: passthrough must be true, false or one of "
+                            f"{', '.join(image_core.PASSTHROUGH_MODES)}, got {passthrough!r}")
+
+    job = dict(job, index=index, id=str(job.get("id", index)))
+    for field in PATH_FIELDS:
+        if field in job:
+            job[field] = os.path.join(base_dir, os.path.expanduser(job[field]))
+    if "inputs" in job:
+        if isinstance(job["inputs"], str):
+            job["inputs"] = [job["inputs"]]
+        job["inputs"] = _expand_inputs(job["inputs"], base_dir)
+    return job
+
+
+# --- İş Çalıştırıcıları ---
+# Süreç havuzundaki işçilerde çalışırlar; dönüş değerleri JSON'a çevrilebilir olmalıdır.
+
+def _ensure_parent(path):
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    return path
+
+
+def _split(job):
+    if "start" in job:
+        # Tek aralık: yalnızca seçilen sayfaların nesneleri okunur
+        end_page = job.get("end", job["start"])
+        output = _ensure_parent(job["output"])
+        stats = pdf_lazy.extract_pages(job["input"], int(job["start"]), int(end_page), output)
+        return dict(stats, outputs=[job["output"]])
+
+    reader = pdf_core.open_pdf(job["input"])
+    total_pages = len(reader.pages)
+    if "manifest" in job:
+        ranges, outputs = pdf_core.read_range_manifest(job["manifest"], total_pages)
+    else:
+        ranges = pdf_core.parse_range_spec(str(job["ranges"]), total_pages)
+        output_dir = job.get("output_dir") or os.path.dirname(job["input"])
+        os.makedirs(output_dir, exist_ok=True)
+        stem = os.path.splitext(os.path.basename(job["input"]))[0]
+        outputs = pdf_core.range_output_names(ranges, output_dir, stem)
+    stats = pdf_core.split_pdf(reader, ranges, outputs, workers=int(job.get("workers", 1)))
+    return dict(stats, outputs=outputs)
+
+
+def _merge(job):
+    # Akış modu tek süreçte ve sınırlı bellekle çalışır; paralellik işler arasında sağlanır
+    output = _ensure_parent(job["output"])
+    return pdf_stream.stream_merge_pdfs(job["inputs"], output, dedup=job.get("dedup", False))
+
+
+def _passthrough_mode(value):
+    # true/false arayüzdeki onay kutusuyla aynı anlamdadır: true -> "always", false -> "auto"
+    if isinstance(value, bool):
+        return "always" if value else "auto"
+    return value
+
+
+def _images(job):
+    page_size = tuple(job.get("page_size", image_core.LETTER))
+    return image_core.convert_images_to_pdf(
+        job["inputs"],
+        _ensure_parent(job["output"]),
+        page_size=page_size,
+        dpi=int(job.get("dpi", image_core.DEFAULT_DPI)),
+        quality=int(job.get("quality", image_core.DEFAULT_JPEG_QUALITY)),
+        workers=int(job.get("workers", 1)),
+        passthrough=_passthrough_mode(job.get("passthrough", "auto")),
+    )
+
+
+RUNNERS = {"split": _split, "merge": _merge, "images": _images}
+
+
+def run_job(job):
+    """Tek bir işi çalıştırır ve sonuç satırını döndürür; hatalar satıra yazılır, fırlatılmaz."""
+    started = time.perf_counter()
+    try:
+        line = _status_line(job, "ok", result=RUNNERS[job["type"]](job))
+    except Exception as e:
+        line = _status_line(job, "error", error=f"{type(e).__name__}: {e}")
+    line["seconds"] = round(time.perf_counter() - started, 6)
+    return line
+
+
+def _status_line(job, status, **fields):
+    return dict({"index": job["index"], "id": job["id"], "type": job["type"], "status": status}, **fields)
+
+
+def run_batch(jobs, workers=None, fail_fast=False, on_result=None):
+    """
+    İşleri en fazla workers süreçte çalıştırır ve sonuç satırlarını bitiş sırasıyla on_result'a verir.
+    Havuza aynı anda en fazla workers iş verilir; böylece büyük manifestler belleği doldurmaz ve
+    fail_fast=True ise ilk hatadan sonra başlamamış işler havuza hiç gitmeden "cancelled" olarak bildirilir.
+    Başarısız (veya iptal edilen) iş sayısını döndürür.
+    """
+    jobs = list(jobs)
+    workers = max(1, min(workers or os.cpu_count() or 1, len(jobs) or 1))
+    failed = 0
+    stopped = False
+
+    def report(line):
+        nonlocal failed, stopped
+        if line["status"] != "ok":
+            failed += 1
+            stopped = stopped or fail_fast
+        if on_result is not None:
+            on_result(line)
+
+    queue = iter(jobs)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        in_flight = {}
+        for job in itertools.islice(queue, workers):
+            in_flight[executor.submit(run_job, job)] = job
+        while in_flight:
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                job = in_flight.pop(future)
+                try:
+                    report(future.result())
+                except Exception as e:  # İşçi süreç çöktü (BrokenProcessPool vb.)
+                    report(_status_line(job, "error", error=f"{type(e).__name__}: {e}"))
+                if not stopped:
+                    for next_job in itertools.islice(queue, 1):
+                        in_flight[executor.submit(run_job, next_job)] = next_job
+    for job in queue:
+        report(_status_line(job, "cancelled"))
+    return failed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run split/merge/image-to-PDF jobs from a JSON or YAML manifest")
+    parser.add_argument("manifest", help="JSON or YAML manifest ('-' reads JSON from stdin)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="number of worker processes (default: CPU count)")
+    parser.add_argument("--output", help="write JSON lines to this file instead of stdout")
+    parser.add_argument("--fail-fast", action="store_true", help="cancel jobs that have not started after a failure")
+    args = parser.parse_args(argv)
+
+    try:
+        jobs, _ = load_manifest(args.manifest)
+    except (OSError, ManifestError) as e:
+        print(f"pdf_batch: {e}", file=sys.stderr)
+        return EXIT_BAD_MANIFEST
+
+    out = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    started = time.perf_counter()
+
+    def emit(line):
+        out.write(json.dumps(line, ensure_ascii=False, default=str) + "\n")
+        out.flush()
+
+    try:
+        failed = run_batch(jobs, workers=args.workers, fail_fast=args.fail_fast, on_result=emit)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    print(f"pdf_batch: {len(jobs)} jobs, {failed} failed or cancelled in {time.perf_counter() - started:.1f}s",
+          file=sys.stderr)
+    return EXIT_FAILED if failed else EXIT_OK
+
+
+if __name__ == "__main__":
+    sys.exit(main())
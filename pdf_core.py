@@ -0,0 +1,299 @@
+# Gerekli kütüphaneler: PyPDF2
+# Kurulum: pip install PyPDF2
+#
+# Arayüzden bağımsız PDF çekirdeği. Bu modül hiçbir koşulda Qt içe aktarmaz;
+# böylece sunucu tarafındaki toplu işler GUI araç takımı yüklemeden çalışabilir.
+
+import csv
+import io
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+
+from PyPDF2 import PdfReader, PdfWriter
+
+
+def open_pdf(source):
+    """Dosya yolu, bayt dizisi, dosya nesnesi veya hazır bir PdfReader'dan okuyucu döndürür."""
+    if isinstance(source, PdfReader):
+        return source
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return PdfReader(io.BytesIO(bytes(source)))
+    if isinstance(source, (str, os.PathLike)):
+        return PdfReader(os.fspath(source))
+    if hasattr(source, "read") and hasattr(source, "seek"):
+        return PdfReader(source)
+    raise TypeError(f"Unsupported PDF source: {type(source).__name__}")
+
+
+class ReaderCache:
+    """
+    Dosya yoluna göre ayrıştırılmış PdfReader nesnelerini saklar.
+    Dosyanın değiştirilme zamanı veya boyutu değişirse kayıt geçersiz sayılır ve dosya yeniden ayrıştırılır.
+    """
+
+    def __init__(self, max_entries=4):
+        self.max_entries = max_entries
+        self._entries = {}  # yol -> (imza, dosya nesnesi, okuyucu)
+
+    @staticmethod
+    def _signature(path):
+        stat = os.stat(path)
+        return stat.st_mtime_ns, stat.st_size
+
+    def get(self, path):
+        """Yol için güncel okuyucuyu döndürür, gerekiyorsa dosyayı yeniden ayrıştırır."""
+        path = os.path.abspath(os.fspath(path))
+        signature = self._signature(path)
+        entry = self._entries.pop(path, None)
+        if entry is not None and entry[0] != signature:
+            entry[1].close()
+            entry = None
+        if entry is None:
+            # PdfReader'a yol yerine açık dosya veriyoruz; yol verilirse dosyanın tamamı belleğe kopyalanır
+            pdf_file = open(path, "rb")
+            try:
+                entry = (signature, pdf_file, PdfReader(pdf_file))
+            except Exception:
+                pdf_file.close()
+                raise
+        # En son kullanılan kayıt sözlüğün sonunda kalır
+        self._entries[path] = entry
+        while len(self._entries) > self.max_entries:
+            oldest = next(iter(self._entries))
+            self._entries.pop(oldest)[1].close()
+        return entry[2]
+
+    def invalidate(self, path):
+        entry = self._entries.pop(os.path.abspath(os.fspath(path)), None)
+        if entry is not None:
+            entry[1].close()
+
+    def clear(self):
+        for entry in self._entries.values():
+            entry[1].close()
+        self._entries.clear()
+
+
+def page_count(source):
+    """Kaynaktaki sayfa sayısını döndürür."""
+    return len(open_pdf(source).pages)
+
+
+def check_page_range(start_page, end_page, total_pages):
+    """1 tabanlı, iki ucu dahil sayfa aralığını doğrular."""
+    if start_page < 1 or end_page < start_page or end_page > total_pages:
+        raise ValueError(
+            f"Invalid page range {start_page}-{end_page} (document has {total_pages} pages)"
+        )
+
+
+def write_pdf(writer, output=None):
+    """PdfWriter'ı yola veya akışa yazar; çıktı verilmezse baytları döndürür."""
+    if output is None:
+        buffer = io.BytesIO()
+        writer.write(buffer)
+        return buffer.getvalue()
+    if isinstance(output, (str, os.PathLike)):
+        with open(output, "wb") as out_file:
+            writer.write(out_file)
+    else:
+        writer.write(output)
+    return None
+
+
+def extract_pages(source, start_page, end_page, output=None):
+    """start_page ile end_page (dahil) arasındaki sayfaları yeni bir PDF olarak yazar."""
+    reader = open_pdf(source)
+    check_page_range(start_page, end_page, len(reader.pages))
+
+    writer = PdfWriter()
+    for page_num in range(start_page - 1, end_page):
+        writer.add_page(reader.pages[page_num])
+    return write_pdf(writer, output)
+
+
+def parse_range_spec(spec, total_pages):
+    """
+    "1-5,6-12,13-" veya "every 10" biçimindeki aralık tanımını (başlangıç, bitiş) listesine çevirir.
+    Bitişi boş bırakılan aralık son sayfaya kadar uzanır.
+    """
+    spec = spec.strip()
+    every = re.fullmatch(r"every\s+(\d+)(\s+pages?)?", spec, re.IGNORECASE)
+    if every:
+        return every_n_pages(int(every.group(1)), total_pages)
+
+    ranges = []
+    for part in spec.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        match = re.fullmatch(r"(\d+)\s*(?:(-)\s*(\d*))?", part)
+        if not match:
+            raise ValueError(f"Invalid page range: {part!r}")
+        start_page = int(match.group(1))
+        if match.group(2) is None:
+            end_page = start_page
+        else:
+            end_page = int(match.group(3)) if match.group(3) else total_pages
+        check_page_range(start_page, end_page, total_pages)
+        ranges.append((start_page, end_page))
+    if not ranges:
+        raise ValueError("Empty page range specification")
+    return ranges
+
+
+def every_n_pages(n, total_pages):
+    """Belgeyi n sayfalık ardışık parçalara böler."""
+    if n < 1:
+        raise ValueError("Chunk size must be at least 1 page")
+    return [(start, min(start + n - 1, total_pages)) for start in range(1, total_pages + 1, n)]
+
+
+def read_range_manifest(manifest_path, total_pages):
+    """
+    "başlangıç,bitiş,çıktı" satırlarından oluşan CSV manifestini okur.
+    Başlık satırı isteğe bağlıdır; göreceli çıktı yolları manifestin bulunduğu klasöre göre çözülür.
+    """
+    base_dir = os.path.dirname(os.path.abspath(manifest_path))
+    ranges, outputs = [], []
+    with open(manifest_path, newline="", encoding="utf-8") as manifest:
+        for row in csv.reader(manifest):
+            row = [cell.strip() for cell in row]
+            if not row or not row[0] or row[0].startswith("#"):
+                continue
+            if not row[0].isdigit():
+                continue  # başlık satırı
+            if len(row) < 3 or not row[2]:
+                raise ValueError(f"Manifest row needs start, end and output: {row}")
+            start_page = int(row[0])
+            end_page = int(row[1]) if row[1] else total_pages
+            check_page_range(start_page, end_page, total_pages)
+            ranges.append((start_page, end_page))
+            outputs.append(os.path.join(base_dir, row[2]))
+    return ranges, outputs
+
+
+def range_output_names(ranges, directory, stem):
+    """Her aralık için "<stem>_<başlangıç>-<bitiş>.pdf" biçiminde çıktı yolu üretir."""
+    return [os.path.join(directory, f"{stem}_{start}-{end}.pdf") for start, end in ranges]
+
+
+def split_pdf(source, ranges, outputs, workers=1, progress=None):
+    """
+    Kaynağı bir kez ayrıştırır ve her (başlangıç, bitiş) aralığını karşılık gelen çıktıya yazar.
+    workers > 1 ise sayfalar kopyalandıktan sonra çıktılar paralel yazılır.
+    progress(tamamlanan, toplam) her çıktı hazırlandığında çağrılır.
+    Dosya sayısı, sayfa sayısı, süre ve sayfa/saniye değerlerini içeren bir sözlük döndürür.
+    """
+    ranges = list(ranges)
+    outputs = list(outputs)
+    if len(ranges) != len(outputs):
+        raise ValueError("Each page range needs exactly one output")
+
+    started = time.perf_counter()
+    reader = open_pdf(source)
+    total_pages = len(reader.pages)
+    for start_page, end_page in ranges:
+        check_page_range(start_page, end_page, total_pages)
+
+    def build(start_page, end_page):
+        # PdfWriter.add_page sayfayı kopyaladığından yazma aşaması okuyucuya dokunmaz
+        writer = PdfWriter()
+        for page_num in range(start_page - 1, end_page):
+            writer.add_page(reader.pages[page_num])
+        return writer
+
+    def report(done):
+        if progress is not None:
+            progress(done, len(ranges))
+
+    jobs = enumerate(zip(ranges, outputs), start=1)
+    if workers > 1:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = []
+            for index, ((start_page, end_page), output) in jobs:
+                futures.append(executor.submit(write_pdf, build(start_page, end_page), output))
+                report(index)
+            results = [future.result() for future in futures]
+    else:
+        results = []
+        for index, ((start_page, end_page), output) in jobs:
+            results.append(write_pdf(build(start_page, end_page), output))
+            report(index)
+
+    elapsed = time.perf_counter() - started
+    pages = sum(end_page - start_page + 1 for start_page, end_page in ranges)
+    return {
+        "files": len(ranges),
+        "pages": pages,
+        "seconds": elapsed,
+        "pages_per_second": pages / elapsed if elapsed > 0 else float(pages),
+        "outputs": results,
+    }
+
+
+def merge_pdfs(sources, output=None):
+    """Kaynakların tüm sayfalarını verilen sırada tek bir PDF'te birleştirir."""
+    writer = PdfWriter()
+    for source in sources:
+        reader = open_pdf(source)
+        for page in reader.pages:
+            writer.add_page(page)
+    return write_pdf(writer, output)
+
+
+def _count_pages(source):
+    """İşçi süreçte kaynağı açar; bozuk dosyalar birleştirme başlamadan burada elenir."""
+    return page_count(source)
+
+
+def _source_name(source):
+    return os.fspath(source) if isinstance(source, (str, os.PathLike)) else type(source).__name__
+
+
+def parallel_merge_pdfs(sources, output, workers=None, progress=None, mp_context=None):
+    """
+    Kaynakları süreç havuzunda paralel olarak açıp doğrular (bozuk dosyalar yazma başlamadan elenir),
+    ardından pdf_stream ile tek geçişte doğrudan çıktıya yazar. Ara PDF'ler üretilmez ve süreçler arasında
+    PDF baytları taşınmaz. progress(tamamlanan, toplam) ile ilerleme bildirilir.
+    mp_context verilirse süreç havuzu bu multiprocessing bağlamıyla başlatılır.
+    Birleştirilen toplam sayfa sayısını döndürür.
+    """
+    # pdf_stream bu modülü içe aktardığından döngüsel içe aktarmayı önlemek için burada yüklenir
+    import pdf_stream
+
+    sources = list(sources)
+    if not sources:
+        raise ValueError("No PDFs to merge")
+    workers = min(workers or os.cpu_count() or 1, len(sources))
+    total_steps = 2 * len(sources)  # doğrulama + her kaynağın yazılması
+    done_steps = 0
+
+    def step():
+        nonlocal done_steps
+        done_steps += 1
+        if progress is not None:
+            progress(done_steps, total_steps)
+
+    def validated(source, count):
+        try:
+            return count()
+        except Exception as e:
+            raise ValueError(f"Cannot read {_source_name(source)}: {e}") from e
+
+    total_pages = 0
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers, mp_context=mp_context) as executor:
+            futures = {executor.submit(_count_pages, source): source for source in sources}
+            for future in as_completed(futures):
+                total_pages += validated(futures[future], future.result)
+                step()
+    else:
+        for source in sources:
+            total_pages += validated(source, lambda: _count_pages(source))
+            step()
+
+    pdf_stream.stream_merge_pdfs(sources, output, progress=lambda done, total: step())
+    return total_pages
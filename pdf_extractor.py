@@ -2,7 +2,9 @@ import sys
 from PySide6.QtWidgets import QApplication, QMainWindow, QPushButton, QFileDialog, QLineEdit, QComboBox, QMessageBox
 from PySide6 import QtGui, QtCore
 from PySide6.QtGui import QGuiApplication, QScreen
-from PyPDF2 import PdfReader, PdfWriter
+
+import pdf_core
+import pdf_lazy
 
 class PDFMergerApp(QMainWindow):
     def dilDegistir(self, index):
@@ -67,6 +69,8 @@ class PDFMergerApp(QMainWindow):
         self.create_button.setGeometry(50, 270, 250, 50)
 
         self.selected_file = ""
+        # Seçilen dosya bir kez ayrıştırılır; doğrulama ve sayfa çıkarma aynı okuyucuyu kullanır
+        self.reader_cache = pdf_core.ReaderCache(max_entries=1)
         button_style = ("QPushButton {"
                         "background-color: black;"
                         "border: 2px solid white;"
@@ -88,9 +92,7 @@ class PDFMergerApp(QMainWindow):
         self.setStyleSheet(button_style + entry_style)
 
     def sayfa_sayisi(self,pdf_yolu):
-        with open(pdf_yolu, 'rb') as pdfDosyasi:
-            pdf_okuyucu = PdfReader(pdfDosyasi)
-            return len(pdf_okuyucu.pages)
+        return pdf_lazy.page_count(self.reader_cache.get(pdf_yolu))
 
     def select_pdf(self):
         file_dialog = QFileDialog()
@@ -104,7 +106,8 @@ class PDFMergerApp(QMainWindow):
             start_page_text = self.start_page_input.text()
             end_page_text = self.end_page_input.text()
             output_name = self.output_name_input.text()
-            sayfa_sayi = self.sayfa_sayisi(self.selected_file)
+            pdf_reader = self.reader_cache.get(self.selected_file)
+            sayfa_sayi = pdf_lazy.page_count(pdf_reader)
 
             if (start_page_text.isdigit() and end_page_text.isdigit() and output_name and int(start_page_text) > 0
                 and int(start_page_text) < sayfa_sayi and int(end_page_text) > 0 and int(end_page_text) > int(start_page_text)
@@ -113,18 +116,11 @@ class PDFMergerApp(QMainWindow):
                 end_page = int(end_page_text)
                 output_file = output_name + ".pdf"
 
-                pdf_reader = PdfReader(self.selected_file)
-                pdf_writer = PdfWriter()
-
-                for page_num in range(start_page - 1, min(end_page, len(pdf_reader.pages))):
-                    pdf_writer.add_page(pdf_reader.pages[page_num])
-
-                with open(output_file, 'wb') as output:
-                    pdf_writer.write(output)
-                    if self.comboBox.currentText() == "Türkçe":
-                        QMessageBox.information(self, "Bilgi", f"Kayıt Başarılı. Yeni PDF {output_file} olarak kaydedildi.")
-                    elif self.comboBox.currentText() == "English":
-                        QMessageBox.information(self, "INFO", f"Successfully Saved. New PDF saved as {output_file}")
+                pdf_lazy.extract_pages(pdf_reader, start_page, end_page, output_file)
+                if self.comboBox.currentText() == "Türkçe":
+                    QMessageBox.information(self, "Bilgi", f"Kayıt Başarılı. Yeni PDF {output_file} olarak kaydedildi.")
+                elif self.comboBox.currentText() == "English":
+                    QMessageBox.information(self, "INFO", f"Successfully Saved. New PDF saved as {output_file}")
             else:
                 if self.comboBox.currentText() == "Türkçe":
                     QMessageBox.warning(self, "Hata", "Başlangıç ve bitiş sayfa numaraları geçerli sayılar olmalıdır ve yeni PDF dosya adı gerekli.")
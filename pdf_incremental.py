@@ -0,0 +1,394 @@
+# Gerekli kütüphaneler: PyPDF2
+# Kurulum: pip install PyPDF2
+#
+# Var olan bir PDF'e artımlı güncelleme (incremental update) yazar: yalnızca değişen ve yeni nesneler,
+# bunları listeleyen yeni bir xref bölümü ve /Prev ile önceki xref'e bağlanan trailer dosyanın sonuna eklenir.
+# Özgün baytlara dokunulmaz; sayfa ekleme/silme ve üst veri değişikliği dosyanın boyutundan bağımsız olarak
+# birkaç KB yazar. Kaynak belleğe okunmaz, açık dosya üzerinden yalnızca gereken nesneler çözülür.
+
+import hashlib
+import os
+import shutil
+import time
+
+from PyPDF2.errors import PdfReadError
+from PyPDF2.generic import (
+    ArrayObject,
+    DictionaryObject,
+    IndirectObject,
+    NameObject,
+    NumberObject,
+    TextStringObject,
+    read_object,
+)
+
+import pdf_core
+import pdf_lazy
+import pdf_stream
+
+STARTXREF_SEARCH = 1024  # startxref anahtar kelimesinin aranacağı son bayt sayısı
+
+
+def find_startxref(stream):
+    """Dosyanın sonundaki startxref değerini (son xref bölümünün ofseti) döndürür."""
+    stream.seek(0, os.SEEK_END)
+    size = stream.tell()
+    stream.seek(max(0, size - STARTXREF_SEARCH))
+    tail = stream.read()
+    position = tail.rfind(b"startxref")
+    if position < 0:
+        raise PdfReadError("startxref not found")
+    try:
+        return int(tail[position + len(b"startxref"):].split()[0])
+    except (IndexError, ValueError) as e:
+        raise PdfReadError("Invalid startxref") from e
+
+
+def _ref(number, generation=0):
+    return IndirectObject(number, generation, None)
+
+
+class IncrementalPdfWriter(pdf_stream.StreamingPdfWriter):
+    """
+    Bir PDF dosyasını yerinde güncelleyen yazıcı. Değişiklikler bellekte biriktirilir, yeni sayfalar
+    eklendikçe dosyanın sonuna yazılır; close() değişen sayfa ağacı düğümlerini, bilgi sözlüğünü,
+    xref bölümünü ve trailer'ı ekler. Hata olursa dosya özgün boyutuna geri kesilir.
+    Özgün belge xref akışı (PDF 1.5+) kullanıyorsa yeni bölüm de xref akışı olarak yazılır.
+    """
+
+    def __init__(self, path):
+        self.path = os.fspath(path)
+        # Okuyucu ayrı bir tanıtıcı üzerinden çalışır; PdfReader(yol) dosyanın tamamını belleğe kopyalar
+        self._source = open(self.path, "rb")
+        try:
+            self.reader = pdf_lazy.LazyPdfReader(self._source)
+            if self.reader.is_encrypted:
+                raise PdfReadError("Incremental updates of encrypted PDFs are not supported")
+            self._prev = find_startxref(self._source)
+            self._source.seek(self._prev)
+            self._xref_stream = not self._source.read(4).startswith(b"xref")
+            trailer = self.reader.trailer
+            if self._xref_stream:
+                # PyPDF2 xref akışının yalnızca /Root, /Info, /ID ve /Encrypt girdilerini trailer'a taşır
+                self._source.seek(self._prev)
+                self.reader.read_object_header(self._source)
+                trailer = read_object(self._source, self.reader)
+            self._next_number = int(trailer["/Size"])
+            self._root = trailer.raw_get("/Root")
+            self._info = trailer.raw_get("/Info") if "/Info" in trailer else None
+            self._id = trailer.get("/ID")
+            self.original_size = os.path.getsize(self.path)
+        except Exception:
+            self._source.close()
+            raise
+
+        self._stream = open(self.path, "ab")
+        self._owns_stream = True
+        self._position = self.original_size
+        self._changed = {}  # nesne numarası -> (nesil, ofset)
+        self._dirty = {}    # nesne numarası -> (nesil, değiştirilmiş sözlük); close() sırasında yazılır
+        self._page_numbers = []
+        self._target_parent = None  # eklenen sayfaların /Parent'ı
+        self._closed = False
+        self.memory_limit = None
+        self.dedup = False
+        self._digests = {}
+        self.duplicates = 0
+        self.bytes_saved = 0
+        self.bytes_written = 0
+        self.started = time.perf_counter()
+        # Önceki bölüm satır sonuyla bitmiyorsa yeni nesneler "%%EOF" ile aynı satıra düşmesin
+        self._source.seek(self.original_size - 1)
+        if self._source.read(1) not in (b"\n", b"\r"):
+            self._write(b"\n")
+
+    @property
+    def object_count(self):
+        return len(self._changed)
+
+    @property
+    def bytes_appended(self):
+        return self._position - self.original_size
+
+    def reserve(self):
+        number = self._next_number
+        self._next_number += 1
+        return number
+
+    def write_serialized(self, number, body, generation=0):
+        self._changed[number] = (generation, self._position)
+        self._write(b"%d %d obj\n" % (number, generation))
+        self._write(body)
+        self._write(b"\nendobj\n")
+
+    def write_page(self, number, page):
+        page[NameObject("/Parent")] = _ref(self._target_parent)
+        self.write_object(number, page)
+        self._page_numbers.append(number)
+
+    # Sayfa ağacı
+
+    def _node(self, ref):
+        """Düğümün bu güncellemedeki (değiştirilmişse) hâlini döndürür."""
+        dirty = self._dirty.get(ref.idnum)
+        if dirty is not None:
+            return dirty[1]
+        return self.reader.get_object(IndirectObject(ref.idnum, ref.generation, self.reader))
+
+    def _edit(self, ref):
+        """Düğümün değiştirilebilir bir kopyasını döndürür; kopya close() sırasında aynı numarayla yazılır."""
+        dirty = self._dirty.get(ref.idnum)
+        if dirty is None:
+            node = self._node(ref)
+            copy = DictionaryObject()
+            for name in node:
+                copy[NameObject(name)] = node.raw_get(name)
+            dirty = self._dirty[ref.idnum] = (ref.generation, copy)
+        return dirty[1]
+
+    def _pages_ref(self):
+        ref = self._node(self._root).raw_get("/Pages")
+        if not isinstance(ref, IndirectObject):
+            raise PdfReadError("Page tree root is not an indirect object")
+        return ref
+
+    @property
+    def page_count(self):
+        return int(self._node(self._pages_ref())["/Count"])
+
+    def _locate(self, index):
+        """
+        0 tabanlı index'teki sayfaya giden yolu [(düğüm referansı, çocuk sırası), ...] olarak döndürür.
+        Son eleman sayfanın üst düğümü ve sayfanın /Kids içindeki sırasıdır.
+        """
+        ref = self._pages_ref()
+        remaining = index
+        path = []
+        for _ in range(pdf_lazy.MAX_TREE_DEPTH):
+            node = self._node(ref)
+            for position, kid_ref in enumerate(node["/Kids"].get_object()):
+                kid = self._node(kid_ref)
+                count = 1 if pdf_lazy._is_leaf(kid) else int(kid.get("/Count", 0))
+                if remaining < count:
+                    path.append((ref, position))
+                    if pdf_lazy._is_leaf(kid):
+                        return path
+                    ref = kid_ref
+                    break
+                remaining -= count
+            else:
+                break
+        raise PdfReadError(f"Page {index + 1} not found in page tree")
+
+    def _add_count(self, path, delta):
+        for ref, _ in path:
+            node = self._edit(ref)
+            node[NameObject("/Count")] = NumberObject(int(node["/Count"]) + delta)
+
+    def _kids(self, ref):
+        node = self._edit(ref)
+        kids = ArrayObject(node["/Kids"].get_object())
+        node[NameObject("/Kids")] = kids
+        return kids
+
+    def remove_pages(self, indices):
+        """0 tabanlı sayfaları sayfa ağacından çıkarır; sayfa nesneleri dosyada kalır ama erişilemez olur."""
+        indices = sorted(set(indices), reverse=True)
+        count = self.page_count
+        for index in indices:
+            if not 0 <= index < count:
+                raise ValueError(f"Page {index + 1} is out of range (1-{count})")
+        if len(indices) == count:
+            raise ValueError("Cannot remove every page of a document")
+        # Sondan başa silinir; böylece kalan sayfaların numaraları kaymaz
+        for index in indices:
+            path = self._locate(index)
+            parent, position = path[-1]
+            del self._kids(parent)[position]
+            self._add_count(path, -1)
+
+    def insert_pages(self, reader, pages=None, index=None):
+        """
+        reader içindeki sayfaları (verilmezse tümünü) index'teki sayfanın önüne, index verilmezse sona ekler.
+        Sayfalar ve onlardan ulaşılabilen nesneler yeni numaralarla hemen dosyanın sonuna yazılır.
+        """
+        count = self.page_count
+        if index is None or index >= count:
+            # Sona ekleme: son sayfanın üst düğümüne, boş belgede köke
+            path = self._locate(count - 1) if count else [(self._pages_ref(), -1)]
+            path[-1] = (path[-1][0], path[-1][1] + 1)
+        else:
+            if index < 0:
+                raise ValueError(f"Page {index + 1} is out of range (1-{count})")
+            path = self._locate(index)
+        parent, position = path[-1]
+        self._target_parent = parent.idnum
+        first = len(self._page_numbers)
+        self.copy_pages(reader, pages)
+        new_pages = self._page_numbers[first:]
+        self._kids(parent)[position:position] = [_ref(number) for number in new_pages]
+        self._add_count(path, len(new_pages))
+        return len(new_pages)
+
+    # Üst veri
+
+    def update_metadata(self, metadata):
+        """Bilgi sözlüğüne (/Title, /Author, ...) verilen alanları yazar; değeri None olan alanlar silinir."""
+        if isinstance(self._info, IndirectObject):
+            info = self._edit(self._info)
+        else:
+            info = DictionaryObject()
+            if self._info is not None:
+                for name in self._info:
+                    info[NameObject(name)] = self._info.raw_get(name)
+            self._info = _ref(self.reserve())
+            self._dirty[self._info.idnum] = (0, info)
+        for name, value in metadata.items():
+            name = NameObject(name if name.startswith("/") else "/" + name)
+            if value is None:
+                info.pop(name, None)
+            else:
+                info[name] = TextStringObject(str(value))
+
+    # Kapatma
+
+    def _sections(self):
+        """Değişen numaraları ardışık alt bölümlere ayırır: [(ilk numara, [(numara, nesil, ofset), ...]), ...]."""
+        sections = []
+        for number in sorted(self._changed):
+            generation, offset = self._changed[number]
+            if sections and sections[-1][0] + len(sections[-1][1]) == number:
+                sections[-1][1].append((number, generation, offset))
+            else:
+                sections.append((number, [(number, generation, offset)]))
+        return sections
+
+    def _trailer_entries(self):
+        entries = b"/Size %d /Root %d %d R /Prev %d" % (
+            self._next_number, self._root.idnum, self._root.generation, self._prev,
+        )
+        if self._info is not None:
+            entries += b" /Info %d %d R" % (self._info.idnum, self._info.generation)
+        if self._id:
+            # İlk tanımlayıcı belgeyi, ikincisi bu sürümü tanımlar
+            original = self._id[0].get_object().original_bytes
+            version = hashlib.md5(b"%s%d%d" % (original, self._position, time.time_ns())).digest()
+            entries += b" /ID [ <%s> <%s> ]" % (original.hex().encode(), version.hex().encode())
+        return entries
+
+    def _write_xref_table(self):
+        xref_offset = self._position
+        # 0 numaralı boş kayıt da listelenir; aksi hâlde PyPDF2 tabloyu kaymış sayıp her nesneyi yeniden doğrular
+        self._write(b"xref\n0 1\n0000000000 65535 f\r\n")
+        for first, entries in self._sections():
+            self._write(b"%d %d\n" % (first, len(entries)))
+            for _, generation, offset in entries:
+                self._write(b"%010d %05d n\r\n" % (offset, generation))
+        self._write(b"trailer\n<< " + self._trailer_entries() + b" >>\n")
+        return xref_offset
+
+    def _write_xref_stream(self):
+        # Akışın kendisi de listelenir; numarası /Size hesaplanmadan önce ayrılır
+        number = self.reserve()
+        xref_offset = self._position
+        self._changed[number] = (0, xref_offset)
+        width = max(1, (xref_offset.bit_length() + 7) // 8)
+        index = []
+        data = bytearray()
+        for first, entries in self._sections():
+            index.append(b"%d %d" % (first, len(entries)))
+            for _, generation, offset in entries:
+                data += b"\x01" + offset.to_bytes(width, "big") + generation.to_bytes(2, "big")
+        body = b"<< /Type /XRef /W [ 1 %d 2 ] /Index [ %s ] %s /Length %d >>\nstream\n" % (
+            width, b" ".join(index), self._trailer_entries(), len(data),
+        )
+        self._write(b"%d 0 obj\n" % number)
+        self._write(body + bytes(data) + b"\nendstream\nendobj\n")
+        return xref_offset
+
+    def close(self):
+        """Değişen düğümleri, xref bölümünü ve trailer'ı dosyanın sonuna ekler."""
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            for number, (generation, node) in sorted(self._dirty.items()):
+                self.write_serialized(number, self.serialize(node), generation)
+            if self._changed:
+                if self._xref_stream:
+                    xref_offset = self._write_xref_stream()
+                else:
+                    xref_offset = self._write_xref_table()
+                self._write(b"startxref\n%d\n%%%%EOF\n" % xref_offset)
+            self.bytes_written = self.bytes_appended
+        finally:
+            self._stream.close()
+            self._source.close()
+
+    def abort(self):
+        """Eklenen baytları atar ve dosyayı özgün boyutuna geri keser."""
+        if self._closed:
+            return
+        self._closed = True
+        self._stream.close()
+        self._source.close()
+        os.truncate(self.path, self.original_size)
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+def _prepare(path, output):
+    # Çıktı verilirse özgün dosya önce kopyalanır (dosya boyutunda iş); verilmezse yerinde güncellenir
+    if output is None:
+        return path
+    shutil.copyfile(path, output)
+    return output
+
+
+def _run(path, output, edit):
+    started = time.perf_counter()
+    with IncrementalPdfWriter(_prepare(path, output)) as writer:
+        edit(writer)
+        pages = writer.page_count
+    return {
+        "pages": pages,
+        "objects": writer.object_count,
+        "bytes_written": writer.bytes_written,
+        "seconds": time.perf_counter() - started,
+    }
+
+
+def update_metadata(path, metadata, output=None):
+    """
+    Bilgi sözlüğünü artımlı güncellemeyle değiştirir. output verilmezse dosya yerinde güncellenir.
+    Sayfa, yazılan nesne ve bayt sayısı ile süreyi döndürür.
+    """
+    return _run(path, output, lambda writer: writer.update_metadata(metadata))
+
+
+def remove_pages(path, pages, output=None):
+    """1 tabanlı sayfa numaralarını belgeden artımlı güncellemeyle çıkarır."""
+    return _run(path, output, lambda writer: writer.remove_pages(page - 1 for page in pages))
+
+
+def insert_pages(path, source, pages=None, at=None, output=None):
+    """
+    source'taki sayfaları (1 tabanlı numaralar, verilmezse tümü) path'teki belgenin at numaralı sayfasının
+    önüne, at verilmezse sonuna ekler. Yalnızca eklenen sayfalar ve kullandıkları nesneler yazılır.
+    """
+    def edit(writer):
+        if isinstance(source, (str, os.PathLike)):
+            with pdf_lazy.open_mapped(source) as reader:
+                _insert(writer, reader)
+        else:
+            _insert(writer, pdf_core.open_pdf(source))
+
+    def _insert(writer, reader):
+        selected = None if pages is None else pdf_lazy.find_pages(reader, [page - 1 for page in pages])
+        writer.insert_pages(reader, selected, None if at is None else at - 1)
+
+    return _run(path, output, edit)
@@ -0,0 +1,305 @@
+# Gerekli kütüphaneler: PyPDF2 (pdfminer.six opsiyonel)
+# Kurulum: pip install PyPDF2 pdfminer.six
+#
+# Yerel PDF'ler için tam metin dizini. Metin süreç havuzunda sayfa sayfa çıkarılır ve SQLite FTS5 tablosunda
+# saklanır; her satır tek bir sayfadır, böylece sorgular belge ve sayfa numarası döndürür.
+# Dizin artımlı güncellenir: değiştirilme zamanı ve boyutu aynı olan dosyalar açılmaz, değişenlerin yalnızca
+# SHA-256 özeti farklıysa metni yeniden çıkarılır. Bu modül Qt içe aktarmaz.
+
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from PyPDF2 import PdfReader
+
+# pdfminer.six daha iyi metin sırası verir ama PyPDF2'den yavaştır (opsiyonel)
+try:
+    from pdfminer.high_level import extract_pages
+    from pdfminer.layout import LTTextContainer
+    PDFMINER_AVAILABLE = True
+except ImportError:
+    PDFMINER_AVAILABLE = False
+
+PYPDF2 = "pypdf2"
+PDFMINER = "pdfminer"
+
+# FTS5 satır numarası = belge numarası << PAGE_BITS | sayfa indeksi.
+# Bir belgenin sayfaları ardışık satırlarda durur; silme ve güncelleme tabloyu taramadan aralıkla yapılır.
+PAGE_BITS = 20
+PAGE_MASK = (1 << PAGE_BITS) - 1
+COMMIT_EVERY = 64          # Bu kadar belgede bir işlem (transaction) kaydedilir
+SNIPPET_TOKENS = 12
+DEFAULT_LIMIT = 50
+
+Hit = namedtuple("Hit", "path page snippet score")                    # page 1'den başlar
+DocumentHit = namedtuple("DocumentHit", "path pages score")          # pages: eşleşen sayfalar, en iyisi önce
+
+
+def default_index_path():
+    data_home = os.environ.get("XDG_DATA_HOME") or os.path.join(os.path.expanduser("~"), ".local", "share")
+    return os.path.join(data_home, "pdf-works", "pdf_index.sqlite3")
+
+
+def file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for block in iter(lambda: file.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def extract_page_texts(path, extractor=PYPDF2):
+    """Her sayfanın metnini liste olarak döndürür; okunamayan sayfalar boş metin olur."""
+    if extractor == PDFMINER:
+        if not PDFMINER_AVAILABLE:
+            raise RuntimeError("pdfminer.six is not installed")
+        return [
+            "".join(element.get_text() for element in layout if isinstance(element, LTTextContainer))
+            for layout in extract_pages(path)
+        ]
+    texts = []
+    with open(path, "rb") as file:
+        for page in PdfReader(file).pages:
+            try:
+                texts.append(page.extract_text() or "")
+            except Exception:
+                texts.append("")
+    return texts
+
+
+def _scan_file(path, known_sha256, extractor):
+    """İşçi süreçte çalışır: özet öncekiyle aynıysa metin çıkarılmaz (pages None döner)."""
+    sha256 = file_sha256(path)
+    if sha256 == known_sha256:
+        return path, sha256, None
+    return path, sha256, extract_page_texts(path, extractor)
+
+
+def fts_query(text):
+    """
+    Kullanıcı sorgusunu FTS5 sözdizimine çevirir: tırnak içindeki ifadeler öbek olarak, diğer sözcükler
+    ayrı ayrı aranır ve tümü eşleşmelidir. Sonu * ile biten sözcük önek olarak aranır.
+    """
+    terms = []
+    for phrase, word, prefix in re.findall(r'"([^"]*)"|(\w+)(\*?)', text):
+        if phrase:
+            words = re.findall(r"\w+", phrase)
+            if words:
+                terms.append('"' + " ".join(words) + '"')
+        elif word:
+            terms.append(f'"{word}"{prefix}')
+    return " ".join(terms)
+
+
+def iter_pdf_paths(paths):
+    """Dosya ve klasörlerden (alt klasörler dahil) .pdf dosyalarının mutlak yollarını üretir."""
+    for path in paths:
+        path = os.path.abspath(os.fspath(path))
+        if os.path.isdir(path):
+            for root, _, names in os.walk(path):
+                for name in sorted(names):
+                    if name.lower().endswith(".pdf"):
+                        yield os.path.join(root, name)
+        elif os.path.isfile(path):
+            yield path
+
+
+class PdfIndex:
+    """
+    SQLite FTS5 tabanlı tam metin dizini. Farklı iş parçacıklarından aynı anda kullanılabilir.
+    update() ile dosya ve klasörler eklenir/güncellenir, search() ve search_documents() ile sorgulanır.
+    """
+
+    def __init__(self, path=None, extractor=PYPDF2):
+        self.path = path or default_index_path()
+        self.extractor = extractor
+        self._lock = threading.Lock()
+        if self.path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self._db = sqlite3.connect(self.path, check_same_thread=False)
+        with self._lock, self._db:
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS documents ("
+                " id INTEGER PRIMARY KEY, path TEXT UNIQUE NOT NULL, mtime_ns INTEGER NOT NULL,"
+                " size INTEGER NOT NULL, sha256 TEXT, pages INTEGER NOT NULL DEFAULT 0,"
+                " indexed REAL NOT NULL, error TEXT)"
+            )
+            # Türkçe karakterler için aksanlar yok sayılır: "ogrenci" sorgusu "öğrenci" ile eşleşir
+            self._db.execute(
+                "CREATE VIRTUAL TABLE IF NOT EXISTS page_text USING fts5(text, tokenize='unicode61 remove_diacritics 2')"
+            )
+
+    def update(self, paths, workers=None, progress=None, prune=False, mp_context=None):
+        """
+        Dosya ve klasörleri dizine ekler veya günceller. prune=True ise diskte artık bulunmayan belgeler silinir.
+        progress(tamamlanan, toplam) ile ilerleme bildirilir; mp_context verilirse süreç havuzu bu
+        multiprocessing bağlamıyla başlatılır. Sayaçları içeren bir sözlük döndürür.
+        """
+        stats = {"added": 0, "updated": 0, "unchanged": 0, "removed": 0, "failed": 0}
+        with self._lock:
+            known = {
+                row[0]: row[1:]
+                for row in self._db.execute("SELECT path, id, mtime_ns, size, sha256, error FROM documents")
+            }
+
+        pending = {}  # yol -> (mtime_ns, size)
+        for path in iter_pdf_paths(paths):
+            stat = os.stat(path)
+            entry = known.get(path)
+            if entry is not None and entry[1:3] == (stat.st_mtime_ns, stat.st_size):
+                stats["unchanged"] += 1
+                continue
+            pending[path] = (stat.st_mtime_ns, stat.st_size)
+
+        total = len(pending)
+        done = 0
+        try:
+            # Kilit yalnızca yazarken tutulur; metin çıkarılırken sorgular yanıtlanmaya devam eder
+            for path, sha256, pages, error in self._scan(pending, known, workers, mp_context):
+                entry = known.get(path)
+                if error is not None:
+                    stats["failed"] += 1
+                elif entry is None:
+                    stats["added"] += 1
+                elif pages is None:
+                    stats["unchanged"] += 1
+                else:
+                    stats["updated"] += 1
+                done += 1
+                with self._lock:
+                    self._store(path, entry[0] if entry else None, pending[path], sha256, pages, error)
+                    if done % COMMIT_EVERY == 0:
+                        self._db.commit()
+                if progress is not None:
+                    progress(done, total)
+            if prune:
+                with self._lock:
+                    for path, entry in known.items():
+                        if not os.path.exists(path):
+                            self._delete(entry[0])
+                            stats["removed"] += 1
+        finally:
+            # Yarıda kesilse bile tamamlanan belgeler korunur; kalanlar sonraki güncellemede işlenir
+            with self._lock:
+                self._db.commit()
+        return stats
+
+    def _scan(self, pending, known, workers, mp_context=None):
+        """(yol, özet, sayfa metinleri veya None, hata) dörtlülerini tamamlandıkça üretir."""
+        jobs = [(path, known[path][3] if path in known else None) for path in pending]
+        workers = workers or os.cpu_count() or 1
+        if workers == 1 or len(jobs) <= 1:
+            for path, sha256 in jobs:
+                try:
+                    yield _scan_file(path, sha256, self.extractor) + (None,)
+                except Exception as e:
+                    yield path, None, None, str(e) or type(e).__name__
+            return
+        with ProcessPoolExecutor(max_workers=workers, mp_context=mp_context) as executor:
+            futures = {executor.submit(_scan_file, path, sha256, self.extractor): path for path, sha256 in jobs}
+            for future in as_completed(futures):
+                try:
+                    yield future.result() + (None,)
+                except Exception as e:
+                    yield futures[future], None, None, str(e) or type(e).__name__
+
+    def _store(self, path, doc_id, signature, sha256, pages, error):
+        mtime_ns, size = signature
+        now = time.time()
+        if pages is None and error is None:
+            # İçerik değişmemiş (yalnızca dosya zamanı değişmiş)
+            self._db.execute(
+                "UPDATE documents SET mtime_ns = ?, size = ?, indexed = ? WHERE id = ?", (mtime_ns, size, now, doc_id)
+            )
+            return
+        if doc_id is None:
+            doc_id = self._db.execute(
+                "INSERT INTO documents (path, mtime_ns, size, indexed) VALUES (?, ?, ?, ?)", (path, mtime_ns, size, now)
+            ).lastrowid
+        else:
+            self._delete_pages(doc_id)
+        pages = (pages or [])[:PAGE_MASK + 1]
+        self._db.execute(
+            "UPDATE documents SET mtime_ns = ?, size = ?, sha256 = ?, pages = ?, indexed = ?, error = ? WHERE id = ?",
+            (mtime_ns, size, sha256, len(pages), now, error, doc_id),
+        )
+        self._db.executemany(
+            "INSERT INTO page_text (rowid, text) VALUES (?, ?)",
+            ((doc_id << PAGE_BITS | index, text) for index, text in enumerate(pages) if text.strip()),
+        )
+
+    def _delete_pages(self, doc_id):
+        self._db.execute(
+            "DELETE FROM page_text WHERE rowid BETWEEN ? AND ?", (doc_id << PAGE_BITS, doc_id << PAGE_BITS | PAGE_MASK)
+        )
+
+    def _delete(self, doc_id):
+        self._delete_pages(doc_id)
+        self._db.execute("DELETE FROM documents WHERE id = ?", (doc_id,))
+
+    def remove(self, path):
+        """Belgeyi dizinden siler; belge dizinde yoksa False döndürür."""
+        path = os.path.abspath(os.fspath(path))
+        with self._lock, self._db:
+            row = self._db.execute("SELECT id FROM documents WHERE path = ?", (path,)).fetchone()
+            if row is None:
+                return False
+            self._delete(row[0])
+        return True
+
+    def search(self, query, limit=DEFAULT_LIMIT, raw=False):
+        """
+        Sorguyla eşleşen sayfaları en ilgiliden başlayarak Hit listesi olarak döndürür.
+        raw=True ise sorgu FTS5 sözdizimiyle olduğu gibi kullanılır.
+        """
+        match = query if raw else fts_query(query)
+        if not match:
+            return []
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT d.path, p.rowid & ?, snippet(page_text, 0, '[', ']', '…', ?), p.rank"
+                " FROM page_text AS p JOIN documents AS d ON d.id = p.rowid >> ?"
+                " WHERE page_text MATCH ? ORDER BY p.rank LIMIT ?",
+                (PAGE_MASK, SNIPPET_TOKENS, PAGE_BITS, match, limit),
+            ).fetchall()
+        return [Hit(path, page + 1, snippet, -score) for path, page, snippet, score in rows]
+
+    def search_documents(self, query, limit=DEFAULT_LIMIT, raw=False):
+        """Sorguyla eşleşen belgeleri, en iyi sayfalarının puanına göre sıralı DocumentHit listesi olarak döndürür."""
+        match = query if raw else fts_query(query)
+        if not match:
+            return []
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT d.path, m.pages, m.score FROM ("
+                "  SELECT doc_id, group_concat(page) AS pages, MIN(score) AS score FROM ("
+                "   SELECT rowid >> ? AS doc_id, (rowid & ?) + 1 AS page, rank AS score"
+                "   FROM page_text WHERE page_text MATCH ? ORDER BY rank)"
+                "  GROUP BY doc_id ORDER BY score LIMIT ?) AS m"
+                " JOIN documents AS d ON d.id = m.doc_id ORDER BY m.score",
+                (PAGE_BITS, PAGE_MASK, match, limit),
+            ).fetchall()
+        return [DocumentHit(path, [int(page) for page in pages.split(",")], -score) for path, pages, score in rows]
+
+    def stats(self):
+        with self._lock:
+            documents, pages, failed = self._db.execute(
+                "SELECT COUNT(*), COALESCE(SUM(pages), 0), COUNT(error) FROM documents"
+            ).fetchone()
+        return {"documents": documents, "pages": pages, "failed": failed}
+
+    def optimize(self):
+        """FTS5 b-ağacı parçalarını birleştirir; büyük güncellemelerden sonra sorguları hızlandırır."""
+        with self._lock, self._db:
+            self._db.execute("INSERT INTO page_text (page_text) VALUES ('optimize')")
+
+    def close(self):
+        with self._lock:
+            self._db.close()
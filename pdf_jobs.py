@@ -0,0 +1,271 @@
+# Gerekli kütüphaneler: PyQt6, PyPDF2, Pillow (opsiyonel, görsel -> PDF işleri için)
+# Kurulum: pip install PyQt6 PyPDF2 Pillow
+#
+# PDFHandler pencerelerinin (miracleX.py, Pdf Stuff.py) ağır işlerini GUI iş parçacığı dışında
+# yürüten iş kuyruğu. Sinyal düzeni enhanced_pdf_searcher.py içindeki SearchWorker'ı izler.
+
+import itertools
+import multiprocessing
+import os
+from collections import deque
+
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+import pdf_core
+import pdf_index
+import pdf_lazy
+import pdf_stream
+
+# Görsel -> PDF işleri Pillow gerektirir (opsiyonel)
+try:
+    import image_core
+    IMAGES_AVAILABLE = True
+except ImportError:
+    IMAGES_AVAILABLE = False
+
+
+# İşler QThreadPool iş parçacıklarında çalışır; Qt iş parçacıkları varken fork edilen süreçler kilitlenebileceğinden
+# süreç havuzları her zaman spawn ile başlatılır
+PROCESS_CONTEXT = multiprocessing.get_context("spawn")
+
+
+class JobCancelled(Exception):
+    """İptal edilen işin ilerleme bildirimi sırasında fırlatılır ve işi sonlandırır."""
+
+
+class JobSignals(QObject):
+    """
+    Tüm işlerin ortak sinyalleri; her sinyalin ilk argümanı iş numarasıdır.
+    """
+    started = pyqtSignal(int)                    # İş numarası
+    progress_update = pyqtSignal(int, str, int)  # İş numarası, durum mesajı, ilerleme yüzdesi
+    result = pyqtSignal(int, object)             # İş numarası, işin dönüş değeri
+    error = pyqtSignal(int, str)                 # İş numarası, hata mesajı
+    cancelled = pyqtSignal(int)                  # İş numarası
+    finished = pyqtSignal(int)                   # İşin (başarılı ya da değil) bittiğini bildirir
+
+
+class Job(QRunnable):
+    """
+    Thread havuzunda çalışan tek bir iş. func(progress) biçiminde çağrılır;
+    progress(mesaj, yüzde) hem ilerlemeyi bildirir hem de iş iptal edildiyse JobCancelled fırlatır.
+    """
+
+    def __init__(self, job_id, name, func, signals):
+        super().__init__()
+        self.setAutoDelete(False)
+        self.job_id = job_id
+        self.name = name
+        self.func = func
+        self.signals = signals
+        self._is_cancelled = False
+
+    def cancel(self):
+        self._is_cancelled = True
+
+    @property
+    def is_cancelled(self):
+        return self._is_cancelled
+
+    def report(self, message, percent):
+        if self._is_cancelled:
+            raise JobCancelled()
+        self.signals.progress_update.emit(self.job_id, message, int(percent))
+
+    def run(self):
+        try:
+            if self._is_cancelled:
+                raise JobCancelled()
+            self.signals.started.emit(self.job_id)
+            result = self.func(self.report)
+            if self._is_cancelled:
+                raise JobCancelled()
+            self.signals.result.emit(self.job_id, result)
+        except JobCancelled:
+            self.signals.cancelled.emit(self.job_id)
+        except Exception as e:
+            self.signals.error.emit(self.job_id, str(e))
+        finally:
+            self.signals.finished.emit(self.job_id)
+
+
+class JobRunner(QObject):
+    """
+    Bölme, birleştirme ve görsel dönüştürme işleri için ortak iş kuyruğu.
+    En fazla max_concurrent iş aynı anda çalışır, diğerleri sırada bekler ve iptal edilebilir.
+    """
+    job_added = pyqtSignal(int, str)  # İş numarası, iş adı
+
+    def __init__(self, max_concurrent=2, parent=None):
+        super().__init__(parent)
+        self.signals = JobSignals()
+        self.signals.result.connect(self._deliver_result)
+        self.signals.error.connect(self._deliver_error)
+        self.signals.finished.connect(self._job_finished)
+        self._pool = QThreadPool()
+        self._pending = deque()
+        self._running = {}
+        self._callbacks = {}
+        self._ids = itertools.count(1)
+        self.set_max_concurrent(max_concurrent)
+
+    @property
+    def max_concurrent(self):
+        return self._max_concurrent
+
+    def set_max_concurrent(self, max_concurrent):
+        self._max_concurrent = max(1, max_concurrent)
+        self._pool.setMaxThreadCount(self._max_concurrent)
+        self._dispatch()
+
+    @property
+    def pending_count(self):
+        return len(self._pending)
+
+    @property
+    def running_count(self):
+        return len(self._running)
+
+    def submit(self, name, func, on_result=None, on_error=None):
+        """
+        İşi kuyruğa ekler ve iş numarasını döndürür. on_result/on_error GUI iş parçacığında çağrılır.
+        """
+        job = Job(next(self._ids), name, func, self.signals)
+        self._callbacks[job.job_id] = (on_result, on_error)
+        self._pending.append(job)
+        self.job_added.emit(job.job_id, name)
+        self._dispatch()
+        return job.job_id
+
+    def cancel(self, job_id):
+        """Bekleyen işi kuyruktan çıkarır; çalışan işe ise bir sonraki ilerleme bildiriminde durmasını söyler."""
+        for job in self._pending:
+            if job.job_id == job_id:
+                self._pending.remove(job)
+                self.signals.cancelled.emit(job_id)
+                self.signals.finished.emit(job_id)
+                return True
+        job = self._running.get(job_id)
+        if job is not None:
+            job.cancel()
+            return True
+        return False
+
+    def cancel_all(self):
+        for job in list(self._pending):
+            self.cancel(job.job_id)
+        for job in self._running.values():
+            job.cancel()
+
+    def wait_for_done(self, msecs=-1):
+        return self._pool.waitForDone(msecs)
+
+    def _dispatch(self):
+        while self._pending and len(self._running) < self._max_concurrent:
+            job = self._pending.popleft()
+            self._running[job.job_id] = job
+            self._pool.start(job)
+
+    def _deliver_result(self, job_id, result):
+        on_result = self._callbacks.get(job_id, (None, None))[0]
+        if on_result is not None:
+            on_result(result)
+
+    def _deliver_error(self, job_id, message):
+        on_error = self._callbacks.get(job_id, (None, None))[1]
+        if on_error is not None:
+            on_error(message)
+
+    def _job_finished(self, job_id):
+        self._running.pop(job_id, None)
+        self._callbacks.pop(job_id, None)
+        self._dispatch()
+
+
+# --- İş Tanımları ---
+# Aşağıdaki fonksiyonlar JobRunner.submit'e verilecek func(progress) çağrılabilirlerini üretir.
+
+def split_job(input_file, start_page, end_page, output_file):
+    def run(progress):
+        progress("Splitting PDF...", 0)
+        # Yalnızca seçilen sayfaların nesneleri okunur; büyük dosyalar belleğe alınmaz
+        pdf_lazy.extract_pages(input_file, start_page, end_page, output_file)
+        return output_file
+    return run
+
+
+def batch_split_job(input_file, spec, output_dir=None, workers=None):
+    """output_dir verilmezse spec bir CSV manifest yolu olarak okunur."""
+    def run(progress):
+        progress("Reading PDF...", 0)
+        reader = pdf_core.open_pdf(input_file)
+        total_pages = len(reader.pages)
+        if output_dir is None:
+            ranges, outputs = pdf_core.read_range_manifest(spec, total_pages)
+        else:
+            ranges = pdf_core.parse_range_spec(spec, total_pages)
+            stem = os.path.splitext(os.path.basename(input_file))[0]
+            outputs = pdf_core.range_output_names(ranges, output_dir, stem)
+        return pdf_core.split_pdf(
+            reader,
+            ranges,
+            outputs,
+            workers=workers or os.cpu_count() or 1,
+            progress=lambda done, total: progress(f"Splitting PDF... ({done}/{total})", done * 100 / total),
+        )
+    return run
+
+
+def merge_job(file_names, output_file, streaming=False, dedup=False, memory_limit=None, workers=None):
+    """
+    streaming=True ise sınırlı bellekli akış modunda (pdf_stream) birleştirir; dedup=True ise
+    kaynaklar arasında ortak fontlar ve görseller tek kopya yazılır (akış modunu gerektirir).
+    """
+    def run(progress):
+        def report(done, total):
+            progress(f"Merging PDFs... ({done}/{total})", done * 100 / total)
+
+        progress("Merging PDFs...", 0)
+        if streaming or dedup:
+            return pdf_stream.stream_merge_pdfs(
+                file_names, output_file, memory_limit=memory_limit, progress=report, dedup=dedup
+            )
+        total_pages = pdf_core.parallel_merge_pdfs(
+            file_names, output_file, workers=workers, progress=report, mp_context=PROCESS_CONTEXT
+        )
+        return {"pages": total_pages}
+    return run
+
+
+def images_to_pdf_job(image_paths, output_file, dpi, passthrough):
+    def run(progress):
+        if not IMAGES_AVAILABLE:
+            raise RuntimeError("Converting images needs Pillow (pip install Pillow)")
+        progress("Converting images...", 0)
+        return image_core.convert_images_to_pdf(
+            image_paths,
+            output_file,
+            dpi=dpi,
+            passthrough=passthrough,
+            mp_context=PROCESS_CONTEXT,
+            progress=lambda done, total: progress(f"Converting images... ({done}/{total})", done * 100 / total),
+        )
+    return run
+
+
+def index_job(paths, index_path=None, workers=None, prune=False):
+    """Dosya ve klasörleri tam metin dizinine ekler; yalnızca yeni ve değişmiş PDF'lerin metni çıkarılır."""
+    def run(progress):
+        progress("Indexing PDFs...", 0)
+        index = pdf_index.PdfIndex(index_path)
+        try:
+            return index.update(
+                paths,
+                workers=workers,
+                progress=lambda done, total: progress(f"Indexing PDFs... ({done}/{total})", done * 100 / total),
+                prune=prune,
+                mp_context=PROCESS_CONTEXT,
+            )
+        finally:
+            index.close()
+    return run
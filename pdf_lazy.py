@@ -0,0 +1,313 @@
+# Gerekli kütüphaneler: PyPDF2
+# Kurulum: pip install PyPDF2
+#
+# Çok büyük PDF'lerden sayfa aralığı çıkarmak için tembel (lazy) okuma yolu.
+# Kaynak dosya belleğe kopyalanmaz, mmap ile eşlenir; PdfReader.pages sayfa ağacının tamamını düzleştirdiği
+# (her sayfayı okuyup PageObject'e çevirdiği) için kullanılmaz. İstenen sayfalar ağaçta /Count değerlerine
+# bakılarak bulunur ve yalnızca bu sayfalardan ulaşılabilen nesneler StreamingPdfWriter ile kopyalanır.
+# Klasik xref tablolarında LazyPdfReader yalnızca alt bölüm başlıklarını okur; her kayıt 20 bayt olduğundan
+# bir nesnenin ofseti ilk istendiğinde doğrudan konumundan okunur. Açılış süresi nesne sayısına bağlı kalmaz.
+
+import mmap
+import os
+import re
+import time
+from contextlib import contextmanager
+
+from PyPDF2 import PdfReader
+from PyPDF2.errors import PdfReadError
+from PyPDF2.generic import DictionaryObject, read_object
+
+import pdf_core
+import pdf_stream
+
+MAX_TREE_DEPTH = 64  # Bozuk veya döngülü sayfa ağaçlarına karşı üst sınır
+XREF_ENTRY_SIZE = 20
+XREF_ENTRY = re.compile(rb"\d{10} \d{5} [nf][ \r\n]{2}")
+XREF_SUBSECTION = re.compile(rb"\s*(\d+)[ \t]+(\d+)[ \t]*(?:\r\n|\r|\n)")
+XREF_TRAILER = re.compile(rb"\s*trailer\s*")
+
+
+class _XrefSections:
+    """
+    Klasik xref tablolarının alt bölümleri [(ilk numara, kayıt sayısı, ilk kaydın ofseti), ...], en yenisi önce.
+    Kayıtlar ilk istendiklerinde okunur ve önbelleğe alınır.
+    """
+
+    def __init__(self, stream, sections):
+        self.stream = stream
+        self.sections = sections
+        self._entries = {}  # numara -> (nesil, ofset, boş mu) veya None
+        self._loaded = False
+
+    def entry(self, idnum):
+        if idnum not in self._entries:
+            self._entries[idnum] = None
+            for first, count, position in self.sections:
+                if first <= idnum < first + count:
+                    self.stream.seek(position + (idnum - first) * XREF_ENTRY_SIZE)
+                    self._entries[idnum] = self._parse(self.stream.read(XREF_ENTRY_SIZE))
+                    break
+        return self._entries[idnum]
+
+    @staticmethod
+    def _parse(line):
+        return int(line[11:16]), int(line[:10]), line[17:18] == b"f"
+
+    def all_entries(self):
+        """Tüm kayıtları okur; yalnızca PyPDF2 tabloyu dolaşmak istediğinde (bozuk akış uzunluğu vb.) gerekir."""
+        if not self._loaded:
+            self._loaded = True
+            for first, count, position in self.sections:
+                self.stream.seek(position)
+                block = self.stream.read(count * XREF_ENTRY_SIZE)
+                for index in range(count):
+                    if first + index not in self._entries:
+                        line = block[index * XREF_ENTRY_SIZE:(index + 1) * XREF_ENTRY_SIZE]
+                        self._entries[first + index] = self._parse(line)
+        return {idnum: entry for idnum, entry in self._entries.items() if entry is not None}
+
+
+class _LazyGeneration(dict):
+    """
+    PyPDF2'nin xref[nesil] sözlüğünün tembel karşılığı: numara -> ofset (free=True ise numara -> boş mu).
+    Sözlüğe doğrudan yazılan (PyPDF2'nin onardığı) kayıtlar tablodakilerden önce gelir.
+    """
+
+    def __init__(self, sections, generation, free):
+        super().__init__()
+        self._sections = sections
+        self._generation = generation
+        self._free = free
+        self._loaded = False
+
+    def _value(self, entry):
+        return entry[2] if self._free else entry[1]
+
+    def __contains__(self, idnum):
+        if dict.__contains__(self, idnum):
+            return True
+        entry = self._sections.entry(idnum)
+        return entry is not None and entry[0] == self._generation
+
+    def __getitem__(self, idnum):
+        if dict.__contains__(self, idnum):
+            return dict.__getitem__(self, idnum)
+        entry = self._sections.entry(idnum)
+        if entry is None or entry[0] != self._generation:
+            raise KeyError(idnum)
+        return self._value(entry)
+
+    def get(self, idnum, default=None):
+        try:
+            return self[idnum]
+        except KeyError:
+            return default
+
+    def _load(self):
+        if not self._loaded:
+            self._loaded = True
+            for idnum, entry in self._sections.all_entries().items():
+                if entry[0] == self._generation:
+                    self.setdefault(idnum, self._value(entry))
+
+    def __iter__(self):
+        self._load()
+        return dict.__iter__(self)
+
+    def __len__(self):
+        self._load()
+        return dict.__len__(self)
+
+    def keys(self):
+        self._load()
+        return dict.keys(self)
+
+    def values(self):
+        self._load()
+        return dict.values(self)
+
+    def items(self):
+        self._load()
+        return dict.items(self)
+
+
+class _LazyXref(_LazyGeneration):
+    """PyPDF2'nin xref (veya xref_free_entry) sözlüğünün tembel karşılığı: nesil -> _LazyGeneration."""
+
+    def __init__(self, sections, free=False):
+        super().__init__(sections, None, free)
+
+    def __contains__(self, generation):
+        return True
+
+    def __getitem__(self, generation):
+        if not dict.__contains__(self, generation):
+            dict.__setitem__(self, generation, _LazyGeneration(self._sections, generation, self._free))
+        return dict.__getitem__(self, generation)
+
+    def _load(self):
+        if not self._loaded:
+            self._loaded = True
+            for generation, _, _ in self._sections.all_entries().values():
+                self[generation]
+
+
+def _scan_xref_tables(reader, stream, startxref):
+    """
+    startxref'ten başlayıp /Prev zinciri boyunca klasik xref tablolarının alt bölüm başlıklarını ve trailer'ları okur.
+    Zincirde xref akışı, biçimi bozuk bir kayıt veya 0'dan başlamayan ilk tablo varsa None döndürür.
+    """
+    sections = []
+    trailer = DictionaryObject()
+    seen = set()
+    while startxref is not None:
+        if startxref in seen:
+            return None
+        seen.add(startxref)
+        stream.seek(startxref)
+        if stream.read(4) != b"xref":
+            return None
+        position = startxref + 4
+        table = []
+        while True:
+            stream.seek(position)
+            head = stream.read(64)
+            trailer_match = XREF_TRAILER.match(head)
+            if trailer_match:
+                position += trailer_match.end()
+                break
+            match = XREF_SUBSECTION.match(head)
+            if match is None:
+                return None
+            first, count = int(match.group(1)), int(match.group(2))
+            position += match.end()
+            for index in {0, count - 1} if count else ():
+                stream.seek(position + index * XREF_ENTRY_SIZE)
+                if not XREF_ENTRY.fullmatch(stream.read(XREF_ENTRY_SIZE)):
+                    return None
+            table.append((first, count, position))
+            position += count * XREF_ENTRY_SIZE
+        stream.seek(position)
+        new_trailer = read_object(stream, reader)
+        if not isinstance(new_trailer, DictionaryObject) or "/XRefStm" in new_trailer:
+            return None
+        for name in new_trailer:
+            if name not in trailer:
+                trailer[name] = new_trailer.raw_get(name)
+        sections.extend(table)
+        startxref = new_trailer.get("/Prev")
+        if startxref is None and (not table or table[0][0] != 0):
+            return None
+    return sections, trailer
+
+
+class LazyPdfReader(PdfReader):
+    """
+    Klasik xref tablolu dosyalarda tabloyu açılışta ayrıştırmayan PdfReader.
+    Xref akışı kullanan veya onarım gerektiren dosyalarda PyPDF2'nin kendi okumasına geri döner.
+    """
+
+    def _read_xref_tables_and_trailers(self, stream, startxref, xref_issue_nr):
+        scanned = None
+        if not xref_issue_nr and startxref is not None:
+            try:
+                scanned = _scan_xref_tables(self, stream, startxref)
+            except Exception:
+                scanned = None
+        if scanned is None:
+            return super()._read_xref_tables_and_trailers(stream, startxref, xref_issue_nr)
+        sections, self.trailer = scanned
+        xref_sections = _XrefSections(stream, sections)
+        self.xref = _LazyXref(xref_sections)
+        self.xref_free_entry = _LazyXref(xref_sections, free=True)
+        self.xref_objStm = {}
+
+
+@contextmanager
+def open_mapped(path):
+    """Dosyayı salt okunur olarak belleğe eşler ve üzerinde bir PdfReader döndürür."""
+    with open(path, "rb") as pdf_file:
+        try:
+            mapped = mmap.mmap(pdf_file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError as e:  # Boş dosya eşlenemez
+            raise PdfReadError(f"Cannot map {path}: {e}") from e
+        try:
+            yield LazyPdfReader(mapped)
+        finally:
+            mapped.close()
+
+
+def page_count(reader):
+    """Sayfa sayısını kök düğümün /Count değerinden okur; ağaç düzleştirilmez."""
+    return int(reader.trailer["/Root"]["/Pages"]["/Count"])
+
+
+def _is_leaf(node):
+    return node.get("/Type") == "/Page" or "/Kids" not in node
+
+
+def find_page(reader, index):
+    """
+    0 tabanlı index'teki sayfa sözlüğünü, kökten başlayıp her düğümde çocukların /Count değerleriyle
+    doğru dala inerek bulur. Yalnızca yol üzerindeki ağaç düğümleri ve kardeş düğümlerin başlıkları okunur.
+    """
+    node = reader.trailer["/Root"]["/Pages"].get_object()
+    remaining = index
+    for _ in range(MAX_TREE_DEPTH):
+        if _is_leaf(node):
+            if remaining == 0:
+                return node
+            break
+        for kid in node["/Kids"]:
+            kid = kid.get_object()
+            if not isinstance(kid, DictionaryObject):
+                continue
+            count = 1 if _is_leaf(kid) else int(kid.get("/Count", 0))
+            if remaining < count:
+                node = kid
+                break
+            remaining -= count
+        else:
+            break
+    raise PdfReadError(f"Page {index + 1} not found in page tree")
+
+
+def find_pages(reader, indices):
+    """
+    0 tabanlı sayfa numaralarının sayfa sözlüklerini sırayla döndürür.
+    /Count değerleri tutarsız bir ağaçta PyPDF2'nin düzleştiren yoluna geri dönülür.
+    """
+    try:
+        return [find_page(reader, index) for index in indices]
+    except (PdfReadError, KeyError, TypeError, ValueError):
+        return [reader.pages[index] for index in indices]
+
+
+def extract_pages(source, start_page, end_page, output, buffer_size=1024 * 1024):
+    """
+    start_page ile end_page (dahil, 1 tabanlı) arasındaki sayfaları belleğe eşlenmiş kaynaktan okuyup
+    output'a yazar. Kaynak yol değilse pdf_core.open_pdf ile açılır (eşleme yapılmaz, sayfa ağacı yine düzleştirilmez).
+    Sayfa, nesne ve bayt sayısı, süre ve tepe bellek kullanımını döndürür.
+    """
+    started = time.perf_counter()
+    if isinstance(source, (str, os.PathLike)):
+        with open_mapped(source) as reader:
+            stats = _extract(reader, start_page, end_page, output, buffer_size)
+    else:
+        stats = _extract(pdf_core.open_pdf(source), start_page, end_page, output, buffer_size)
+    stats["seconds"] = time.perf_counter() - started
+    stats["peak_rss"] = pdf_stream.peak_rss()
+    return stats
+
+
+def _extract(reader, start_page, end_page, output, buffer_size):
+    pdf_core.check_page_range(start_page, end_page, page_count(reader))
+    pages = find_pages(reader, range(start_page - 1, end_page))
+    with pdf_stream.StreamingPdfWriter(output, buffer_size=buffer_size) as writer:
+        writer.copy_pages(reader, pages)
+    return {
+        "pages": writer.page_count,
+        "objects": writer.object_count,
+        "bytes_written": writer.bytes_written,
+    }
@@ -0,0 +1,192 @@
+# Gerekli kütüphaneler: requests
+# Kurulum: pip install requests
+#
+# Uzaktaki bir PDF'i HTTP Range istekleriyle, yalnızca okunan kısımlarını indirerek açar.
+# RangeFile, pdfminer gibi dosya nesnesi bekleyen kütüphanelere verilebilir: önce dosyanın sonundaki
+# xref/trailer bölümü, ardından yalnızca ilk sayfanın ihtiyaç duyduğu nesneler indirilir.
+# Doğrulama sırasında indirilmiş baytlar (probe) yeniden istenmez; doğrusallaştırılmış (linearized)
+# dosyalarda ilk sayfanın tamamı tek istekte alınır.
+
+import io
+import re
+
+BLOCK_SIZE = 1024             # Önbellek bloğu; doğrulama örneği (1 KB) tam bir blok olarak saklanır
+READAHEAD = 16 * 1024         # Eksik bloklar için tek istekte indirilen en az bayt sayısı
+TAIL_SIZE = 32 * 1024         # İlk istekte indirilen dosya sonu (startxref, trailer ve çoğu xref tablosu)
+MAX_TRANSFER = 2 * 1024 * 1024  # Bir önizleme için indirilebilecek en fazla bayt sayısı
+MAX_FIRST_PAGE = 1024 * 1024    # Doğrusallaştırılmış dosyada ilk sayfa için tek seferde indirilen en fazla bayt
+
+CONTENT_RANGE_RE = re.compile(r"bytes\s+(\d+)-(\d+)/(\d+|\*)")
+LINEARIZED_RE = re.compile(rb"<<\s*/Linearized\s[^>]*>>", re.DOTALL)
+
+
+class RangeNotSupported(Exception):
+    """Sunucu Range isteklerini desteklemiyor (206 yerine başka bir yanıt döndü)."""
+
+
+def range_header(start, length):
+    """start None ise dosyanın son length baytını isteyen başlık değerini üretir."""
+    if start is None:
+        return f"bytes=-{length}"
+    return f"bytes={start}-{start + length - 1}"
+
+
+def parse_content_range(value):
+    """"bytes 100-199/5000" biçimindeki Content-Range değerini (başlangıç, bitiş, toplam) olarak döndürür."""
+    match = CONTENT_RANGE_RE.match(value or "")
+    if not match or match.group(3) == "*":
+        raise RangeNotSupported(f"Invalid Content-Range: {value!r}")
+    return int(match.group(1)), int(match.group(2)), int(match.group(3))
+
+
+def http_range_request(session, url, headers=None, timeout=20):
+    """
+    requests oturumu için request(start, length) -> (veri, Content-Range) çağrılabilirini döndürür.
+    Sunucu 206 dışında yanıt verirse gövdeyi indirmeden RangeNotSupported fırlatır.
+    """
+    def request(start, length):
+        range_headers = dict(headers or {})
+        range_headers["Range"] = range_header(start, length)
+        range_headers["Accept-Encoding"] = "identity"  # Bayt konumları sıkıştırılmamış dosyaya göre olmalı
+        response = session.get(url, headers=range_headers, timeout=timeout, stream=True)
+        try:
+            if response.status_code != 206:
+                raise RangeNotSupported(f"HTTP {response.status_code}")
+            return response.content, response.headers.get("Content-Range")
+        finally:
+            response.close()
+    return request
+
+
+def linearization_info(head):
+    """
+    Dosyanın ilk baytlarında doğrusallaştırma sözlüğü varsa {"length": /L, "first_page_end": /E} döndürür.
+    """
+    match = LINEARIZED_RE.search(head[:BLOCK_SIZE])
+    if not match:
+        return None
+    values = dict(re.findall(rb"/([LE])\s+(\d+)", match.group(0)))
+    if b"L" not in values or b"E" not in values:
+        return None
+    return {"length": int(values[b"L"]), "first_page_end": int(values[b"E"])}
+
+
+class RangeFile(io.RawIOBase):
+    """
+    Okunan bölümleri Range istekleriyle indiren, salt okunur ve konumlanabilir dosya nesnesi.
+    request(start, length) -> (veri, Content-Range) çağrılabiliri ile çalışır; indirilen bloklar bellekte tutulur.
+    """
+
+    def __init__(self, request, size, block_size=BLOCK_SIZE, readahead=READAHEAD, max_transfer=MAX_TRANSFER):
+        super().__init__()
+        self._request = request
+        self.size = size
+        self.block_size = block_size
+        self.readahead = readahead
+        self.max_transfer = max_transfer
+        self.bytes_fetched = 0
+        self.requests = 0
+        self.linearized = False
+        self._blocks = {}
+        self._pos = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        return self._pos
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_SET:
+            self._pos = offset
+        elif whence == io.SEEK_CUR:
+            self._pos += offset
+        elif whence == io.SEEK_END:
+            self._pos = self.size + offset
+        else:
+            raise ValueError(f"Invalid whence: {whence}")
+        self._pos = max(0, self._pos)
+        return self._pos
+
+    def store(self, start, data):
+        """start konumundan başlayan, önceden indirilmiş baytları önbelleğe ekler (yalnızca tam bloklar saklanır)."""
+        first = -(-start // self.block_size)
+        end = start + len(data)
+        for index in range(first, self._block_count()):
+            block_start = index * self.block_size
+            block_end = min(block_start + self.block_size, self.size)
+            if block_end > end:
+                break
+            self._blocks[index] = bytes(data[block_start - start:block_end - start])
+
+    def prefetch(self, start, end):
+        """[start, end) aralığındaki eksik blokları tek istekte indirir."""
+        self._ensure(start // self.block_size, -(-min(end, self.size) // self.block_size))
+
+    def readinto(self, buffer):
+        if self._pos >= self.size:
+            return 0
+        end = min(self._pos + len(buffer), self.size)
+        first, last = self._pos // self.block_size, -(-end // self.block_size)
+        self._ensure(first, last)
+        data = b"".join(self._blocks[index] for index in range(first, last))
+        offset = self._pos - first * self.block_size
+        count = end - self._pos
+        buffer[:count] = data[offset:offset + count]
+        self._pos = end
+        return count
+
+    def _block_count(self):
+        return -(-self.size // self.block_size)
+
+    def _ensure(self, first, last):
+        index = first
+        while index < last:
+            if index in self._blocks:
+                index += 1
+                continue
+            # Eksik blok dizisini ileri okuma payıyla birlikte tek istekte indir
+            run_end = index
+            minimum_end = index + -(-self.readahead // self.block_size)
+            while run_end < self._block_count() and run_end not in self._blocks and (
+                run_end < last or run_end < minimum_end
+            ):
+                run_end += 1
+            start = index * self.block_size
+            length = min(run_end * self.block_size, self.size) - start
+            if self.bytes_fetched + length > self.max_transfer:
+                raise IOError(f"Range transfer limit of {self.max_transfer} bytes exceeded")
+            data, _ = self._request(start, length)
+            self.requests += 1
+            self.bytes_fetched += len(data)
+            if len(data) < length:
+                raise IOError(f"Short range response: {len(data)} of {length} bytes")
+            self.store(start, data)
+            index = run_end
+
+
+def open_remote(request, probe=b"", tail_size=TAIL_SIZE, **kwargs):
+    """
+    Uzaktaki PDF için RangeFile döndürür. İlk istek dosyanın sonunu indirir ve toplam boyutu öğrenir;
+    probe dosyanın başından zaten indirilmiş baytlardır ve yeniden istenmez.
+    Dosya doğrusallaştırılmışsa ilk sayfanın tamamı (/E konumuna kadar) tek istekte önceden indirilir.
+    """
+    tail, content_range = request(None, tail_size)
+    tail_start, _, size = parse_content_range(content_range)
+    pdf_file = RangeFile(request, size, **kwargs)
+    pdf_file.requests += 1
+    pdf_file.bytes_fetched += len(tail)
+    pdf_file.store(tail_start, tail)
+    if probe:
+        pdf_file.store(0, probe)
+
+    pdf_file.seek(0)
+    linearized = linearization_info(pdf_file.read(BLOCK_SIZE))
+    if linearized and linearized["length"] == size:
+        pdf_file.prefetch(0, min(linearized["first_page_end"], MAX_FIRST_PAGE))
+        pdf_file.linearized = True
+    pdf_file.seek(0)
+    return pdf_file
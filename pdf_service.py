@@ -0,0 +1,548 @@
+# Gerekli kütüphaneler: PyPDF2, Pillow (görsel işleri için)
+# Kurulum: pip install PyPDF2 Pillow
+#
+# Bölme, birleştirme ve görsel -> PDF işlerini yerel bir HTTP servisi olarak sunar (yalnızca standart kütüphane).
+# İşler önceden ısıtılmış (PyPDF2 ve iş modülleri yüklenmiş) bir süreç havuzunda pdf_batch.run_job ile çalışır.
+# Yüklemeler (Content-Length veya chunked) parça parça geçici dosyalara, çıktılar da geçici dosyadan parça parça
+# istemciye aktarılır; hiçbir dosya bütünüyle bellekte tutulmaz. Çalışan ve bekleyen iş sayısı sınırlıdır;
+# kuyruk doluysa istek gövdesi okunmadan 503 döndürülür. /metrics Prometheus metin biçiminde gecikme
+# histogramlarını ve çalışan iş sayısını verir.
+#
+# Kullanım: python pdf_service.py --port 8765 --workers 4 --queue 16
+#   curl --data-binary @a.pdf "http://127.0.0.1:8765/split?start=1&end=5" -o part.pdf
+#   curl --data-binary @a.pdf "http://127.0.0.1:8765/split?ranges=every%2010" -o parts.zip
+#   curl -F f=@a.pdf -F f=@b.pdf http://127.0.0.1:8765/merge -o merged.pdf
+#   curl -F f=@1.jpg -F f=@2.png "http://127.0.0.1:8765/images?dpi=150" -o images.pdf
+
+import argparse
+import bisect
+import itertools
+import json
+import os
+import re
+import shutil
+import tempfile
+import threading
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import pdf_batch
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+DEFAULT_QUEUE = 16                         # Çalışan işlere ek olarak kabul edilen bekleyen istek sayısı
+DEFAULT_MAX_UPLOAD = 2 * 1024 ** 3         # İstek başına en fazla yüklenecek bayt
+CHUNK_SIZE = 256 * 1024
+RETRY_AFTER = 1                            # 503 yanıtlarında önerilen bekleme (saniye)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+JOB_ENDPOINTS = ("/split", "/merge", "/images")
+
+
+class HttpError(Exception):
+    """İstemciye status koduyla döndürülecek hata."""
+
+    def __init__(self, status, message, headers=None):
+        super().__init__(message)
+        self.status = status
+        self.headers = headers or {}
+
+
+# --- Metrikler ---
+
+class Histogram:
+    """Prometheus biçiminde birikimli (cumulative) gecikme histogramı; iş parçacıkları arasında paylaşılabilir."""
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = tuple(buckets)
+        self._counts = [0] * (len(self.buckets) + 1)  # son kova +Inf
+        self._sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value):
+        with self._lock:
+            self._counts[bisect.bisect_left(self.buckets, value)] += 1
+            self._sum += value
+
+    def render(self, name, labels):
+        with self._lock:
+            counts, total = list(self._counts), self._sum
+        lines = []
+        cumulative = 0
+        for bound, count in zip(self.buckets + (float("inf"),), counts):
+            cumulative += count
+            le = "+Inf" if bound == float("inf") else repr(bound)
+            lines.append(f'{name}_bucket{{{labels},le="{le}"}} {cumulative}')
+        lines.append(f"{name}_sum{{{labels}}} {total}")
+        lines.append(f"{name}_count{{{labels}}} {cumulative}")
+        return lines
+
+
+class Metrics:
+    def __init__(self):
+        self.latency = {endpoint: Histogram() for endpoint in JOB_ENDPOINTS}
+        self.requests = {}   # (uç nokta, durum kodu) -> sayı
+        self.in_flight = 0   # havuza verilmiş, henüz bitmemiş işler
+        self.active = 0      # kuyruk hakkı almış (yükleme, bekleme, çalışma veya yanıt aşamasındaki) istekler
+        self.rejected = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self._lock = threading.Lock()
+
+    def add(self, **deltas):
+        with self._lock:
+            for name, delta in deltas.items():
+                setattr(self, name, getattr(self, name) + delta)
+
+    def count_request(self, endpoint, status):
+        with self._lock:
+            self.requests[endpoint, status] = self.requests.get((endpoint, status), 0) + 1
+
+    def render(self, workers, capacity):
+        with self._lock:
+            requests = sorted(self.requests.items())
+            gauges = (self.in_flight, self.active, self.rejected, self.bytes_in, self.bytes_out)
+        in_flight, active, rejected, bytes_in, bytes_out = gauges
+        lines = [
+            "# HELP pdfworks_request_duration_seconds Time from request start to the end of the response.",
+            "# TYPE pdfworks_request_duration_seconds histogram",
+        ]
+        for endpoint, histogram in self.latency.items():
+            lines.extend(histogram.render("pdfworks_request_duration_seconds", f'endpoint="{endpoint}"'))
+        lines += [
+            "# HELP pdfworks_requests_total Requests by endpoint and status code.",
+            "# TYPE pdfworks_requests_total counter",
+        ]
+        lines += [f'pdfworks_requests_total{{endpoint="{endpoint}",code="{status}"}} {count}'
+                  for (endpoint, status), count in requests]
+        lines += [
+            "# HELP pdfworks_jobs_in_flight Jobs submitted to the worker pool and not finished yet.",
+            "# TYPE pdfworks_jobs_in_flight gauge",
+            f"pdfworks_jobs_in_flight {in_flight}",
+            "# HELP pdfworks_jobs_queued Jobs waiting for a free worker.",
+            "# TYPE pdfworks_jobs_queued gauge",
+            f"pdfworks_jobs_queued {max(0, in_flight - workers)}",
+            "# HELP pdfworks_requests_active Admitted job requests (uploading, queued, running or streaming).",
+            "# TYPE pdfworks_requests_active gauge",
+            f"pdfworks_requests_active {active}",
+            "# HELP pdfworks_queue_capacity Job requests admitted at the same time before 503 is returned.",
+            "# TYPE pdfworks_queue_capacity gauge",
+            f"pdfworks_queue_capacity {capacity}",
+            "# HELP pdfworks_workers Worker processes in the pool.",
+            "# TYPE pdfworks_workers gauge",
+            f"pdfworks_workers {workers}",
+            "# HELP pdfworks_rejected_total Requests rejected with 503 because the queue was full.",
+            "# TYPE pdfworks_rejected_total counter",
+            f"pdfworks_rejected_total {rejected}",
+            "# HELP pdfworks_upload_bytes_total Request body bytes received.",
+            "# TYPE pdfworks_upload_bytes_total counter",
+            f"pdfworks_upload_bytes_total {bytes_in}",
+            "# HELP pdfworks_download_bytes_total Response body bytes sent.",
+            "# TYPE pdfworks_download_bytes_total counter",
+            f"pdfworks_download_bytes_total {bytes_out}",
+        ]
+        return "\n".join(lines) + "\n"
+
+
+# --- İstek gövdesi ---
+
+def iter_body(rfile, headers, max_size=DEFAULT_MAX_UPLOAD):
+    """İstek gövdesini Content-Length'e veya chunked kodlamaya göre CHUNK_SIZE'lık parçalar hâlinde verir."""
+    if headers.get("Transfer-Encoding", "").lower() == "chunked":
+        total = 0
+        while True:
+            size_line = rfile.readline(1024)
+            try:
+                size = int(size_line.split(b";")[0].strip(), 16)
+            except ValueError:
+                raise HttpError(400, "Invalid chunk size")
+            if size == 0:
+                # Son parçadan sonraki (varsa) trailer başlıkları boş satıra kadar atlanır
+                while rfile.readline(1024) not in (b"\r\n", b"\n", b""):
+                    pass
+                return
+            total += size
+            if total > max_size:
+                raise HttpError(413, f"Upload exceeds {max_size} bytes")
+            while size:
+                data = rfile.read(min(size, CHUNK_SIZE))
+                if not data:
+                    raise HttpError(400, "Truncated chunked body")
+                size -= len(data)
+                yield data
+            rfile.readline(1024)  # parçayı bitiren CRLF
+
+    length = headers.get("Content-Length")
+    if length is None:
+        raise HttpError(411, "Content-Length or chunked Transfer-Encoding required")
+    try:
+        remaining = int(length)
+    except ValueError:
+        raise HttpError(400, "Invalid Content-Length")
+    if remaining > max_size:
+        raise HttpError(413, f"Upload exceeds {max_size} bytes")
+    while remaining:
+        data = rfile.read(min(remaining, CHUNK_SIZE))
+        if not data:
+            raise HttpError(400, "Truncated request body")
+        remaining -= len(data)
+        yield data
+
+
+def _safe_name(name, index):
+    name = os.path.basename(name or "").strip() or f"part{index}"
+    return f"{index:04d}_" + re.sub(r"[^\w.\-]", "_", name)
+
+
+def save_multipart(chunks, boundary, directory):
+    """
+    multipart/form-data gövdesindeki dosya alanlarını sırayla directory'ye yazar ve yollarını döndürür.
+    Gövde akış hâlinde işlenir; bellekte yalnızca sınır (boundary) uzunluğu kadar bir kuyruk tutulur.
+    """
+    delimiter = b"\r\n--" + boundary
+    paths = []
+    buffer = b"\r\n"  # ilk sınırın önünde CRLF yoktur; tüm sınırlar aynı biçimde aransın
+    output = None
+    chunks = iter(chunks)
+    state = "preamble"
+    try:
+        while True:
+            if state == "headers":
+                end = buffer.find(b"\r\n\r\n")
+                if end < 0:
+                    if len(buffer) > 16 * 1024:
+                        raise HttpError(400, "Multipart headers too long")
+                else:
+                    header_block = buffer[:end].decode("latin-1")
+                    buffer = buffer[end + 4:]
+                    match = re.search(r'filename="([^"]*)"', header_block, re.IGNORECASE)
+                    path = os.path.join(directory, _safe_name(match.group(1) if match else "", len(paths)))
+                    output = open(path, "wb")
+                    if match:
+                        paths.append(path)
+                    state = "data"
+                    continue
+            else:
+                position = buffer.find(delimiter)
+                if position >= 0:
+                    if output is not None:
+                        output.write(buffer[:position])
+                        output.close()
+                        output = None
+                    rest = buffer[position + len(delimiter):]
+                    if len(rest) < 2:
+                        more = next(chunks, None)
+                        if more is None:
+                            raise HttpError(400, "Truncated multipart body")
+                        buffer = buffer[:position + len(delimiter)] + rest + more
+                        continue
+                    if rest.startswith(b"--"):
+                        return paths
+                    buffer = rest[2:] if rest.startswith(b"\r\n") else rest
+                    state = "headers"
+                    continue
+                # Sınırın bir parçası olabilecek kuyruk dışındaki veri yazılır
+                keep = len(delimiter) - 1
+                if output is not None and len(buffer) > keep:
+                    output.write(buffer[:-keep])
+                    buffer = buffer[-keep:]
+                elif state == "preamble" and len(buffer) > keep:
+                    buffer = buffer[-keep:]
+            more = next(chunks, None)
+            if more is None:
+                raise HttpError(400, "Truncated multipart body")
+            buffer += more
+    finally:
+        if output is not None:
+            output.close()
+
+
+# --- İşçi süreçler ---
+
+def _warm_up():
+    # PyPDF2, Pillow ve iş modülleri ilk istekten önce her işçide bir kez yüklenir
+    import pdf_batch  # noqa: F401
+    return os.getpid()
+
+
+class _ChunkedWriter:
+    """Boyutu önceden bilinmeyen yanıtlar (zip) için HTTP/1.1 chunked kodlamalı yazma akışı."""
+
+    def __init__(self, wfile, metrics):
+        self._wfile = wfile
+        self._metrics = metrics
+
+    def write(self, data):
+        if data:
+            self._wfile.write(b"%x\r\n" % len(data) + bytes(data) + b"\r\n")
+            self._metrics.add(bytes_out=len(data))
+        return len(data)
+
+    def flush(self):
+        self._wfile.flush()
+
+    def close(self):
+        self._wfile.write(b"0\r\n\r\n")
+        self._wfile.flush()
+
+
+class PdfService(ThreadingHTTPServer):
+    """
+    İşçi havuzunu, kuyruk sınırını ve metrikleri tutan HTTP sunucusu.
+    Aynı anda en fazla workers + queue_size iş isteği kabul edilir; fazlası 503 ve Retry-After ile reddedilir.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, address, workers=None, queue_size=DEFAULT_QUEUE, max_upload=DEFAULT_MAX_UPLOAD,
+                 temp_dir=None):
+        self.workers = max(1, workers or os.cpu_count() or 1)
+        self.capacity = self.workers + max(0, queue_size)
+        self.max_upload = max_upload
+        self.temp_dir = temp_dir
+        self.metrics = Metrics()
+        self._slots = threading.BoundedSemaphore(self.capacity)
+        self._ids = itertools.count(1)
+        self.executor = ProcessPoolExecutor(max_workers=self.workers, initializer=_warm_up)
+        # Tüm işçiler sunucu dinlemeye başlamadan önce başlatılır
+        for future in [self.executor.submit(_warm_up) for _ in range(self.workers)]:
+            future.result()
+        super().__init__(address, PdfRequestHandler)
+
+    def try_admit(self):
+        if self._slots.acquire(blocking=False):
+            self.metrics.add(active=1)
+            return True
+        self.metrics.add(rejected=1)
+        return False
+
+    def release(self):
+        self.metrics.add(active=-1)
+        self._slots.release()
+
+    def run_job(self, job):
+        """İşi havuzda çalıştırır ve pdf_batch.run_job'un sonuç satırını döndürür."""
+        job = dict(job, index=next(self._ids))
+        job.setdefault("id", str(job["index"]))
+        self.metrics.add(in_flight=1)
+        try:
+            return self.executor.submit(pdf_batch.run_job, job).result()
+        finally:
+            self.metrics.add(in_flight=-1)
+
+    def server_close(self):
+        super().server_close()
+        self.executor.shutdown(wait=True, cancel_futures=True)
+
+
+class PdfRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server_version = "PDFWorks/1.0"
+
+    _admitted = False
+
+    def log_message(self, format, *args):
+        pass  # Erişim günlüğü yerine /metrics kullanılır
+
+    def handle_expect_100(self):
+        # "Expect: 100-continue" gönderen istemci kuyruk doluysa gövdeyi hiç yüklemez. Hakkı yalnızca do_POST
+        # geri verdiğinden diğer yöntemler (GET, HEAD...) kuyruk hakkı almaz
+        if self.command == "POST" and urlsplit(self.path).path in JOB_ENDPOINTS:
+            if not self.server.try_admit():
+                self._reject_busy(urlsplit(self.path).path)
+                return False
+            self._admitted = True
+        return super().handle_expect_100()
+
+    def _reject_busy(self, endpoint):
+        self._discard_body()
+        self._send_json(503, {"error": "Server busy, try again later"}, {"Retry-After": str(RETRY_AFTER)})
+        self.server.metrics.count_request(endpoint, 503)
+
+    # Yardımcılar
+
+    def _send_json(self, status, payload, headers=None):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_file(self, path, content_type, filename):
+        size = os.path.getsize(path)
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(size))
+        self.send_header("Content-Disposition", f'attachment; filename="{filename}"')
+        self.end_headers()
+        with open(path, "rb") as source:
+            shutil.copyfileobj(source, self.wfile, CHUNK_SIZE)
+        self.server.metrics.add(bytes_out=size)
+
+    def _send_zip(self, paths, filename):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/zip")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.send_header("Content-Disposition", f'attachment; filename="{filename}"')
+        self.end_headers()
+        stream = _ChunkedWriter(self.wfile, self.server.metrics)
+        # PDF'ler zaten sıkıştırılmış olduğundan arşive sıkıştırmadan eklenir
+        with zipfile.ZipFile(stream, "w", zipfile.ZIP_STORED) as archive:
+            for path in paths:
+                archive.write(path, os.path.basename(path))
+        stream.close()
+
+    def _body(self):
+        def counted():
+            for chunk in iter_body(self.rfile, self.headers, self.server.max_upload):
+                self.server.metrics.add(bytes_in=len(chunk))
+                yield chunk
+        return counted()
+
+    def _discard_body(self):
+        # Keep-alive bağlantısında okunmamış gövde sonraki isteğe karışmasın diye bağlantı kapatılır
+        self.close_connection = True
+
+    def _save_upload(self, directory):
+        """Gövdeyi kaydeder ve yüklenen dosyaların yollarını döndürür (multipart veya tek ham dosya)."""
+        content_type = self.headers.get("Content-Type", "")
+        if content_type.lower().startswith("multipart/form-data"):
+            match = re.search(r'boundary="?([^";]+)"?', content_type)
+            if not match:
+                raise HttpError(400, "Multipart boundary missing")
+            paths = save_multipart(self._body(), match.group(1).encode("latin-1"), directory)
+        else:
+            path = os.path.join(directory, "0000_upload")
+            with open(path, "wb") as output:
+                for chunk in self._body():
+                    output.write(chunk)
+            paths = [path]
+        if not paths or (len(paths) == 1 and os.path.getsize(paths[0]) == 0):
+            raise HttpError(400, "No file uploaded")
+        return paths
+
+    # Uç noktalar
+
+    def do_GET(self):
+        path = urlsplit(self.path).path
+        if path == "/metrics":
+            body = self.server.metrics.render(self.server.workers, self.server.capacity).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        elif path == "/health":
+            self._send_json(200, {"status": "ok", "workers": self.server.workers})
+        else:
+            self._send_json(404, {"error": f"Unknown path {path}"})
+
+    def do_POST(self):
+        url = urlsplit(self.path)
+        endpoint = url.path
+        if endpoint not in JOB_ENDPOINTS:
+            self._discard_body()
+            self._send_json(404, {"error": f"Unknown path {endpoint}"})
+            return
+        started = time.perf_counter()
+        status = 500
+        admitted, self._admitted = self._admitted, False
+        if not admitted and not self.server.try_admit():
+            # Yükleme okunmadan reddedilir; istemci Retry-After kadar bekleyip yeniden dener
+            self._reject_busy(endpoint)
+            return
+        try:
+            with tempfile.TemporaryDirectory(prefix="pdfworks-", dir=self.server.temp_dir) as directory:
+                status = self._handle_job(endpoint, parse_qs(url.query), directory)
+        except HttpError as e:
+            status = e.status
+            self._discard_body()
+            try:
+                self._send_json(e.status, {"error": str(e)}, e.headers)
+            except (BrokenPipeError, ConnectionResetError):
+                pass
+        except (BrokenPipeError, ConnectionResetError):
+            status = 499  # istemci bağlantıyı kapattı
+            self.close_connection = True
+        finally:
+            self.server.release()
+            self.server.metrics.count_request(endpoint, status)
+            self.server.metrics.latency[endpoint].observe(time.perf_counter() - started)
+
+    def _handle_job(self, endpoint, query, directory):
+        def param(name, default=None):
+            return query.get(name, [default])[0]
+
+        upload_dir = os.path.join(directory, "in")
+        os.mkdir(upload_dir)
+        inputs = self._save_upload(upload_dir)
+        output = os.path.join(directory, "output.pdf")
+
+        if endpoint == "/split":
+            job = {"type": "split", "input": inputs[0]}
+            try:
+                if param("ranges") is not None:
+                    job.update(ranges=param("ranges"), output_dir=os.path.join(directory, "parts"))
+                else:
+                    start = int(param("start", "1"))
+                    job.update(start=start, end=int(param("end", start)), output=output)
+            except ValueError:
+                raise HttpError(400, "start and end must be page numbers")
+            # Parça adları yüklenen dosyanın değil "document" kökünün adıyla üretilir
+            os.rename(inputs[0], os.path.join(upload_dir, "document.pdf"))
+            job["input"] = os.path.join(upload_dir, "document.pdf")
+        elif endpoint == "/merge":
+            job = {"type": "merge", "inputs": inputs, "output": output, "dedup": param("dedup", "0") in ("1", "true")}
+        else:
+            if not pdf_batch.IMAGES_AVAILABLE:
+                raise HttpError(501, "Image conversion needs Pillow (pip install Pillow)")
+            job = {"type": "images", "inputs": inputs, "output": output,
+                   "passthrough": param("passthrough", "auto")}
+            for name in ("dpi", "quality"):
+                if param(name) is not None:
+                    if not param(name).isdigit():
+                        raise HttpError(400, f"{name} must be a number")
+                    job[name] = int(param(name))
+
+        line = self.server.run_job(job)
+        if line["status"] != "ok":
+            raise HttpError(422, line.get("error", "Job failed"))
+        outputs = line["result"].get("outputs", [output])
+        if len(outputs) > 1 or "ranges" in job:
+            self._send_zip(outputs, "parts.zip")
+        else:
+            self._send_file(outputs[0], "application/pdf", endpoint.strip("/") + ".pdf")
+        return 200
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Local HTTP service for PDF split/merge/images-to-PDF")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="worker processes")
+    parser.add_argument("--queue", type=int, default=DEFAULT_QUEUE,
+                        help="requests accepted beyond the running ones before returning 503")
+    parser.add_argument("--max-upload", type=int, default=DEFAULT_MAX_UPLOAD, help="maximum request body in bytes")
+    parser.add_argument("--temp-dir", help="directory for uploads and outputs (default: system temp)")
+    args = parser.parse_args(argv)
+
+    server = PdfService((args.host, args.port), workers=args.workers, queue_size=args.queue,
+                        max_upload=args.max_upload, temp_dir=args.temp_dir)
+    print(f"pdf_service: listening on http://{args.host}:{server.server_address[1]} "
+          f"({server.workers} workers, queue {args.queue})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
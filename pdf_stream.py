@@ -0,0 +1,472 @@
+# Gerekli kütüphaneler: PyPDF2
+# Kurulum: pip install PyPDF2
+#
+# Nesneleri kaynaktan okundukları anda diske yazan, sınırlı bellekli PDF yazıcısı.
+# PdfWriter tüm sayfaları write() çağrılana kadar bellekte tutar; burada yalnızca xref ofsetleri
+# ve o an kopyalanan kaynağın nesne numarası eşlemesi bellekte kalır.
+
+import gc
+import hashlib
+import io
+import os
+import sys
+import time
+from array import array
+
+from PyPDF2 import PdfReader
+from PyPDF2.generic import (
+    ArrayObject,
+    DecodedStreamObject,
+    DictionaryObject,
+    EncodedStreamObject,
+    IndirectObject,
+    NameObject,
+    NullObject,
+    StreamObject,
+)
+
+import pdf_core
+
+# Tepe bellek (RSS) ölçümü için resource modülü (Windows'ta yok, opsiyonel)
+try:
+    import resource
+    RSS_AVAILABLE = True
+except ImportError:
+    RSS_AVAILABLE = False
+
+# Sayfa ağacında üst düğümden devralınabilen öznitelikler
+INHERITABLE_PAGE_ATTRIBUTES = ("/Resources", "/MediaBox", "/CropBox", "/Rotate")
+
+CATALOG_NUMBER = 1
+PAGES_NUMBER = 2
+
+
+def peak_rss():
+    """Sürecin şimdiye kadarki en yüksek bellek kullanımını bayt olarak döndürür (ölçülemiyorsa None)."""
+    if not RSS_AVAILABLE:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux kilobayt, macOS bayt cinsinden raporlar
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def current_rss():
+    """Sürecin şu anki bellek kullanımını bayt olarak döndürür (ölçülemiyorsa None)."""
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        return peak_rss()
+
+
+class StreamingPdfWriter:
+    """
+    Sayfaları ve onlardan ulaşılabilen nesneleri kaynaktan okundukça çıktıya yazan PDF yazıcısı.
+    Kullanım: copy_pages() ile kaynaklar sırayla eklenir, close() sayfa ağacını, xref tablosunu ve trailer'ı yazar.
+    dedup=True ise içeriği aynı olan nesneler (aynı şablondan gelen fontlar, logolar, ICC profilleri)
+    tüm kaynaklar boyunca içerik özetine göre eşlenir ve yalnızca bir kez yazılır.
+    """
+
+    def __init__(self, output, buffer_size=1024 * 1024, memory_limit=None, dedup=False):
+        if isinstance(output, (str, os.PathLike)):
+            self._stream = open(output, "wb", buffering=buffer_size)
+            self._owns_stream = True
+        else:
+            self._stream = output
+            self._owns_stream = False
+        self.memory_limit = memory_limit
+        self.dedup = dedup
+        self._digests = {}  # içerik özeti -> nesne numarası
+        self.duplicates = 0
+        self.bytes_saved = 0
+        self._position = 0
+        # Nesne numarası -> dosya ofseti; 0 numaralı nesne xref tablosundaki boş kayıttır
+        self._offsets = array("q", [0])
+        self._page_numbers = array("q")
+        self._closed = False
+        self.bytes_written = 0
+        self.started = time.perf_counter()
+
+        self._write(b"%PDF-1.7\n%\xe2\xe3\xcf\xd3\n")
+        # Katalog ve sayfa ağacı kökü için numaralar baştan ayrılır, close() sırasında yazılır
+        self.reserve()
+        self.reserve()
+
+    @property
+    def page_count(self):
+        return len(self._page_numbers)
+
+    @property
+    def object_count(self):
+        return len(self._offsets) - 1
+
+    def _write(self, data):
+        self._stream.write(data)
+        self._position += len(data)
+
+    def flush(self):
+        """Tamponda bekleyen baytları işletim sistemine aktarır."""
+        self._stream.flush()
+
+    def reserve(self):
+        """Henüz yazılmamış bir nesne için numara ayırır."""
+        self._offsets.append(-1)
+        return len(self._offsets) - 1
+
+    def write_object(self, number, obj):
+        """Ayrılmış numaraya sahip nesneyi serileştirip hemen çıktıya yazar."""
+        self.write_serialized(number, self.serialize(obj))
+
+    def write_serialized(self, number, body):
+        self._offsets[number] = self._position
+        self._write(b"%d 0 obj\n" % number)
+        self._write(body)
+        self._write(b"\nendobj\n")
+
+    @staticmethod
+    def serialize(obj):
+        buffer = io.BytesIO()
+        obj.write_to_stream(buffer, None)
+        return buffer.getvalue()
+
+    def write_unique(self, obj):
+        """
+        Nesneyi yeni bir numarayla yazar; dedup açıksa ve aynı içerik daha önce yazılmışsa onun numarasını döndürür.
+        Referanslar önceden yeni numaralara çevrildiği için eşit serileştirme eşit nesne demektir.
+        """
+        body = self.serialize(obj)
+        if not self.dedup:
+            number = self.reserve()
+            self.write_serialized(number, body)
+            return number
+        digest = hashlib.sha256(body).digest()
+        number = self._digests.get(digest)
+        if number is not None:
+            self.duplicates += 1
+            self.bytes_saved += len(body)
+            return number
+        number = self._digests[digest] = self.reserve()
+        self.write_serialized(number, body)
+        return number
+
+    def add_object(self, obj):
+        """Nesneyi yeni bir numarayla yazar ve ona işaret eden dolaylı referansı döndürür."""
+        number = self.reserve()
+        self.write_object(number, obj)
+        return IndirectObject(number, 0, None)
+
+    def add_page(self, page):
+        """Referansları bu yazıcıya göre düzenlenmiş bir sayfa sözlüğünü sayfa ağacına ekler."""
+        number = self.reserve()
+        self.write_page(number, page)
+        return IndirectObject(number, 0, None)
+
+    def write_page(self, number, page):
+        page[NameObject("/Parent")] = IndirectObject(PAGES_NUMBER, 0, None)
+        self.write_object(number, page)
+        self._page_numbers.append(number)
+
+    def copy_pages(self, reader, pages=None, progress=None):
+        """
+        reader içindeki sayfaları (verilmezse tümünü) ve onlardan ulaşılabilen nesneleri kopyalar.
+        Her nesne ilk kez ulaşıldığında okunur, yazılır ve okuyucunun önbelleğinden atılır.
+        """
+        pages = list(reader.pages if pages is None else pages)
+        copier = _SourceCopier(self, reader)
+        # Sayfalara numaralar baştan ayrılır; böylece sayfalar arası bağlantılar korunur
+        copier.reserve_pages(pages)
+        for page in pages:
+            copier.copy_page(page)
+            if progress is not None:
+                progress(self.page_count)
+            self._check_memory(reader)
+
+    def _check_memory(self, reader):
+        # Sayfa yazıldıktan sonra okuyucunun nesne önbelleğine ihtiyaç kalmaz
+        reader.resolved_objects.clear()
+        if self.memory_limit is None:
+            return
+        rss = current_rss()
+        if rss is not None and rss > self.memory_limit:
+            self._stream.flush()
+            gc.collect()
+            rss = current_rss()
+            if rss is not None and rss > self.memory_limit:
+                raise MemoryError(
+                    f"Memory use {rss // (1024 * 1024)} MB exceeds the limit of "
+                    f"{self.memory_limit // (1024 * 1024)} MB"
+                )
+
+    def close(self):
+        """Sayfa ağacını, kataloğu, xref tablosunu ve trailer'ı yazar; çıktı dosyasını kapatır."""
+        if self._closed:
+            return
+        self._closed = True
+
+        kids = b" ".join(b"%d 0 R" % number for number in self._page_numbers)
+        self.write_serialized(
+            PAGES_NUMBER,
+            b"<< /Type /Pages /Kids [ " + kids + b" ] /Count %d >>" % len(self._page_numbers),
+        )
+        self.write_serialized(
+            CATALOG_NUMBER, b"<< /Type /Catalog /Pages %d 0 R >>" % PAGES_NUMBER
+        )
+
+        xref_offset = self._position
+        self._write(b"xref\n0 %d\n" % len(self._offsets))
+        self._write(b"0000000000 65535 f\r\n")
+        for offset in self._offsets[1:]:
+            if offset < 0:
+                self._write(b"0000000000 00000 f\r\n")
+            else:
+                self._write(b"%010d 00000 n\r\n" % offset)
+        self._write(
+            b"trailer\n<< /Size %d /Root %d 0 R >>\nstartxref\n%d\n%%%%EOF\n"
+            % (len(self._offsets), CATALOG_NUMBER, xref_offset)
+        )
+        self.bytes_written = self._position
+
+        if self._owns_stream:
+            self._stream.close()
+        else:
+            self._stream.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        elif self._owns_stream:
+            self._stream.close()
+
+
+class _SourceCopier:
+    """
+    Tek bir kaynağın nesne grafiğini StreamingPdfWriter'a kopyalar.
+    Kaynaktaki (numara, nesil) çiftlerinin yazıcıdaki yeni numaralarını tutar.
+    """
+
+    def __init__(self, writer, reader):
+        self.writer = writer
+        self.reader = reader
+        self.numbers = {}     # (idnum, nesil) -> yazıcıdaki numara
+        self.done = set()     # yazılmış nesneler
+        self.excluded = set() # sayfa ağacı düğümleri gibi kopyalanmayacak nesneler
+        self.inherited = {}   # /Pages düğümü -> sayfalara devrettiği öznitelikler
+
+    @staticmethod
+    def _key(ref):
+        return ref.idnum, ref.generation
+
+    def _resolve(self, key):
+        return self.reader.get_object(IndirectObject(key[0], key[1], self.reader))
+
+    def reserve_pages(self, pages):
+        for page in pages:
+            if page.indirect_reference is not None:
+                key = self._key(page.indirect_reference)
+                if key not in self.numbers:
+                    self.numbers[key] = self.writer.reserve()
+
+    def copy_page(self, page):
+        if page.indirect_reference is None:
+            number = self.writer.reserve()
+        else:
+            key = self._key(page.indirect_reference)
+            if key in self.done:
+                # Aynı sayfa /Kids içinde birden çok kez geçiyor: her geçiş yeni bir sayfa olur, içerik ve
+                # kaynaklar paylaşılır. Sayfaya işaret eden bağlantılar ilk kopyaya gider.
+                number = self.writer.reserve()
+            else:
+                number = self.numbers.get(key) or self.writer.reserve()
+                self.numbers[key] = number
+                self.done.add(key)
+
+        page_dict = DictionaryObject()
+        for name, value in page.items():
+            if name not in ("/Parent", "/StructParents"):
+                page_dict[NameObject(name)] = value
+        # Üst düğümlerden devralınan öznitelikleri sayfaya taşı; yeni sayfa ağacında üst düğüm yoktur
+        for name, value in self._inherited_attributes(page).items():
+            if name not in page_dict:
+                page_dict[NameObject(name)] = value
+
+        self._copy_children(page_dict)
+        self.writer.write_page(number, self._remap(page_dict))
+
+    def _inherited_attributes(self, page):
+        """
+        Sayfanın üst düğümlerinden devralınan öznitelikleri (en yakın düğümünkü geçerli) döndürür.
+        Okuyucunun önbelleği her sayfadan sonra temizlendiği için sonuç /Pages düğümü başına saklanır;
+        böylece ortak üst düğümler her sayfa için yeniden ayrıştırılmaz.
+        """
+        chain = []
+        attributes = {}
+        parent_ref = page.raw_get("/Parent") if "/Parent" in page else None
+        while isinstance(parent_ref, IndirectObject):
+            key = self._key(parent_ref)
+            if key in self.inherited:
+                attributes = self.inherited[key]
+                break
+            if any(key == seen for seen, _ in chain):
+                break  # Bozuk ağaç: /Parent zinciri döngü oluşturuyor
+            node = self._resolve(key)
+            if not isinstance(node, DictionaryObject):
+                break
+            chain.append((key, node))
+            parent_ref = node.raw_get("/Parent") if "/Parent" in node else None
+        for key, node in reversed(chain):
+            attributes = dict(attributes)
+            for name in INHERITABLE_PAGE_ATTRIBUTES:
+                if name in node:
+                    attributes[name] = node.raw_get(name)
+            self.inherited[key] = attributes
+        return attributes
+
+    def _child_refs(self, obj):
+        """Bir nesnenin doğrudan içeriğindeki dolaylı referansları verir."""
+        pending = [obj]
+        while pending:
+            item = pending.pop()
+            kind = _kind(item)
+            if kind is _REFERENCE:
+                yield self._key(item)
+            elif kind is _DICTIONARY or kind is _STREAM:
+                pending.extend(dict.values(item))
+            elif kind is _ARRAY:
+                pending.extend(item)
+
+    def _is_excluded(self, key, obj):
+        # Seçilmemiş sayfalar ve sayfa ağacı düğümleri bütün belgeyi sürüklememesi için null yapılır
+        if isinstance(obj, DictionaryObject) and obj.get("/Type") in ("/Page", "/Pages"):
+            self.excluded.add(key)
+            return True
+        return False
+
+    def _copy_children(self, root):
+        """
+        root'tan ulaşılabilen nesneleri alt nesneler önce olacak şekilde (post-order) yazar.
+        Döngüde kalan bir nesneye numara erkenden ayrılır ve nesne bitince o numarayla yazılır.
+        """
+        in_progress = set()
+        stack = [key for key in self._child_refs(root) if self._needs_copy(key, in_progress)]
+        while stack:
+            key = stack[-1]
+            if key in self.done or key in self.excluded:
+                stack.pop()
+                continue
+            obj = self._resolve(key)
+            if key not in in_progress:
+                if obj is None or self._is_excluded(key, obj):
+                    stack.pop()
+                    continue
+                in_progress.add(key)
+                children = []
+                for child in self._child_refs(obj):
+                    if child in in_progress:
+                        # Döngü: nesne işlenmekte olan bir üst nesneye (veya kendisine) işaret ediyor.
+                        # Numara, nesne ilk ziyaretinde yazılabileceği için burada ayrılmalıdır.
+                        if child not in self.numbers:
+                            self.numbers[child] = self.writer.reserve()
+                    elif self._needs_copy(child, in_progress):
+                        children.append(child)
+                if children:
+                    stack.extend(children)
+                    continue
+
+            stack.pop()
+            in_progress.discard(key)
+            self._write_copied(key, self._remap(obj))
+            self.done.add(key)
+
+    def _needs_copy(self, key, in_progress):
+        return key not in self.done and key not in self.excluded and key not in in_progress and key not in self.numbers
+
+    def _write_copied(self, key, obj):
+        number = self.numbers.get(key)
+        if number is None:
+            self.numbers[key] = self.writer.write_unique(obj)
+        else:
+            # Numarası erkenden ayrılmış (döngüdeki) nesneler tekilleştirilmez
+            self.writer.write_object(number, obj)
+
+    def _remap(self, obj):
+        """Nesnenin, referansları yazıcıdaki numaralara çevrilmiş bir kopyasını döndürür."""
+        kind = _kind(obj)
+        if kind is _REFERENCE:
+            number = self.numbers.get(self._key(obj))
+            if number is None:
+                return NullObject()
+            return IndirectObject(number, 0, None)
+        if kind is _STREAM:
+            copy = EncodedStreamObject() if isinstance(obj, EncodedStreamObject) else DecodedStreamObject()
+            copy._data = obj._data
+            dict.update(copy, ((name, self._remap(value)) for name, value in dict.items(obj) if name != "/Length"))
+            return copy
+        if kind is _DICTIONARY:
+            # Anahtarlar zaten NameObject'tir; DictionaryObject.__setitem__'in tür denetimleri atlanır
+            copy = DictionaryObject()
+            dict.update(copy, ((name, self._remap(value)) for name, value in dict.items(obj)))
+            return copy
+        if kind is _ARRAY:
+            return ArrayObject(self._remap(item) for item in obj)
+        return obj
+
+
+# PyPDF2'nin nesne sınıfları typing.Protocol'den türediği için isinstance çağrıları yavaştır; kopyalama sırasında
+# her nesne için birkaç kez sorulan tür sınıfı başına bir kez belirlenip saklanır.
+_REFERENCE, _STREAM, _DICTIONARY, _ARRAY, _OTHER = "reference", "stream", "dictionary", "array", "other"
+_KINDS = {}
+
+
+def _kind(obj):
+    cls = type(obj)
+    kind = _KINDS.get(cls)
+    if kind is None:
+        if issubclass(cls, IndirectObject):
+            kind = _REFERENCE
+        elif issubclass(cls, StreamObject):
+            kind = _STREAM
+        elif issubclass(cls, DictionaryObject):
+            kind = _DICTIONARY
+        elif issubclass(cls, ArrayObject):
+            kind = _ARRAY
+        else:
+            kind = _OTHER
+        _KINDS[cls] = kind
+    return kind
+
+
+def stream_merge_pdfs(sources, output, memory_limit=None, buffer_size=1024 * 1024, progress=None, dedup=False):
+    """
+    Kaynakları sırayla açıp sayfalarını StreamingPdfWriter ile doğrudan çıktıya yazar.
+    Aynı anda yalnızca bir kaynak açık kalır. Sayfa, nesne, bayt sayısı, tekilleştirmeyle kazanılan bayt
+    ve tepe bellek kullanımını döndürür.
+    progress(tamamlanan_kaynak, toplam_kaynak) ile ilerleme bildirilir.
+    """
+    sources = list(sources)
+    if not sources:
+        raise ValueError("No PDFs to merge")
+
+    with StreamingPdfWriter(output, buffer_size=buffer_size, memory_limit=memory_limit, dedup=dedup) as writer:
+        for index, source in enumerate(sources, start=1):
+            if isinstance(source, (str, os.PathLike)):
+                # Yol verilirse PyPDF2 dosyanın tamamını belleğe kopyalar; açık dosyadan okumak bunu önler
+                with open(source, "rb") as pdf_file:
+                    writer.copy_pages(PdfReader(pdf_file))
+            else:
+                writer.copy_pages(pdf_core.open_pdf(source))
+            if progress is not None:
+                progress(index, len(sources))
+
+    elapsed = time.perf_counter() - writer.started
+    return {
+        "pages": writer.page_count,
+        "objects": writer.object_count,
+        "bytes_written": writer.bytes_written,
+        "duplicates": writer.duplicates,
+        "bytes_saved": writer.bytes_saved,
+        "seconds": elapsed,
+        "peak_rss": peak_rss(),
+    }
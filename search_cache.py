@@ -0,0 +1,188 @@
+# Gerekli kütüphaneler: yok (yalnızca standart kütüphane)
+#
+# enhanced_pdf_searcher.py için kalıcı disk önbelleği. Arama motoru sonuçlarını (motor + sorgu parametreleri)
+# ve URL doğrulama sonuçlarını (PDF mi, önizleme metni, ETag/Last-Modified) SQLite'ta saklar.
+# Süresi dolan doğrulama kayıtları koşullu istekle (If-None-Match / If-Modified-Since) yenilenebilir;
+# toplam boyut sınırı aşılınca en uzun süredir kullanılmayan kayıtlar silinir.
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import namedtuple
+
+ENGINE = "engine"          # Arama motoru sonuçları: [(başlık, url, açıklama), ...]
+VALIDATION = "validation"  # URL doğrulama sonuçları: {"is_pdf": bool, "message": önizleme veya None}
+
+DEFAULT_TTLS = {
+    ENGINE: 60 * 60,            # Arama sonuçları 1 saat taze kalır
+    VALIDATION: 24 * 60 * 60,   # Doğrulama sonuçları 1 gün taze kalır, sonra koşullu istekle yenilenir
+}
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+MAX_AGE = 30 * 24 * 60 * 60     # Bu süreden eski kayıtlar yenilenmeden silinir
+
+
+def default_cache_path():
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(cache_home, "pdf-works", "search_cache.sqlite3")
+
+
+class CacheEntry(namedtuple("CacheEntry", "value etag last_modified fresh")):
+    __slots__ = ()
+
+    @property
+    def revalidatable(self):
+        """Kayıt koşullu istekle yenilenebiliyorsa True."""
+        return bool(self.etag or self.last_modified)
+
+    def conditional_headers(self):
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+def response_validators(headers):
+    """Yanıt başlıklarından put() için etag ve last_modified değerlerini çıkarır."""
+    return {"etag": headers.get("etag"), "last_modified": headers.get("last-modified")}
+
+
+def engine_key(engine, params):
+    """Motor adı ve sorgu parametrelerinden (sorgu, sonuç sayısı, ...) önbellek anahtarı üretir."""
+    return f"{engine}\n{json.dumps(params, sort_keys=True, ensure_ascii=False)}"
+
+
+class SearchCache:
+    """
+    SQLite tabanlı, süre (TTL) ve boyut sınırlı önbellek. Farklı iş parçacıklarından aynı anda kullanılabilir.
+    get/put/touch çağrıları isabet, ıska, süresi dolmuş kayıt ve koşullu istekle yenileme sayaçlarını günceller.
+    """
+
+    def __init__(self, path=None, max_bytes=DEFAULT_MAX_BYTES, ttls=None):
+        self.path = path or default_cache_path()
+        self.max_bytes = max_bytes
+        self.ttls = dict(DEFAULT_TTLS, **(ttls or {}))
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0
+        self.revalidated = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        if self.path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self._db = sqlite3.connect(self.path, check_same_thread=False)
+        with self._lock, self._db:
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                " namespace TEXT NOT NULL, key TEXT NOT NULL, value TEXT NOT NULL,"
+                " etag TEXT, last_modified TEXT, created REAL NOT NULL, accessed REAL NOT NULL,"
+                " size INTEGER NOT NULL, PRIMARY KEY (namespace, key))"
+            )
+            self._db.execute("CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed)")
+            self._db.execute("DELETE FROM entries WHERE created < ?", (time.time() - MAX_AGE,))
+            # Toplam boyut bir kez hesaplanır, sonra put/evict ile güncel tutulur
+            self._size = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+
+    def get(self, namespace, key):
+        """Kaydı CacheEntry olarak döndürür; kayıt yoksa None. Süresi dolmuş kayıtlar fresh=False ile döner."""
+        now = time.time()
+        with self._lock, self._db:
+            row = self._db.execute(
+                "SELECT value, etag, last_modified, created FROM entries WHERE namespace = ? AND key = ?",
+                (namespace, key),
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self._db.execute(
+                "UPDATE entries SET accessed = ? WHERE namespace = ? AND key = ?", (now, namespace, key)
+            )
+            fresh = now - row[3] < self.ttls.get(namespace, 0)
+            if fresh:
+                self.hits += 1
+            else:
+                self.stale += 1
+        return CacheEntry(json.loads(row[0]), row[1], row[2], fresh)
+
+    def put(self, namespace, key, value, etag=None, last_modified=None):
+        text = json.dumps(value, ensure_ascii=False)
+        size = len(key) + len(text)
+        now = time.time()
+        with self._lock, self._db:
+            old = self._db.execute(
+                "SELECT size FROM entries WHERE namespace = ? AND key = ?", (namespace, key)
+            ).fetchone()
+            self._db.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (namespace, key, text, etag, last_modified, now, now, size),
+            )
+            self._size += size - (old[0] if old else 0)
+            if self._size > self.max_bytes:
+                self._evict()
+
+    def touch(self, namespace, key):
+        """Sunucu 304 Not Modified döndürdüğünde kaydın süresini yeniler."""
+        now = time.time()
+        with self._lock, self._db:
+            self._db.execute(
+                "UPDATE entries SET created = ?, accessed = ? WHERE namespace = ? AND key = ?",
+                (now, now, namespace, key),
+            )
+            self.revalidated += 1
+
+    def _evict(self):
+        # En uzun süredir kullanılmayan kayıtları sınırın %90'ına inene kadar sil. Bu yol yalnızca sınır
+        # aşıldığında çalışır; dosyayı paylaşan başka süreçlerin yazdıkları burada toplam yeniden sayılarak eşitlenir.
+        self._size = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        target = self.max_bytes * 9 // 10
+        while self._size > target:
+            rows = self._db.execute(
+                "SELECT namespace, key, size FROM entries ORDER BY accessed LIMIT 256"
+            ).fetchall()
+            if not rows:
+                break
+            for namespace, key, size in rows:
+                if self._size <= target:
+                    break
+                self._db.execute("DELETE FROM entries WHERE namespace = ? AND key = ?", (namespace, key))
+                self._size -= size
+                self.evictions += 1
+
+    def stats(self):
+        with self._lock:
+            entries, size = self._db.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries").fetchone()
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "stale": self.stale,
+                "revalidated": self.revalidated,
+                "evictions": self.evictions,
+                "entries": entries,
+                "bytes": size,
+            }
+
+    def clear(self):
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM entries")
+            self._size = 0
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+
+_shared_cache = None
+_shared_lock = threading.Lock()
+
+
+def get_shared_cache():
+    """Varsayılan konumdaki, süreç genelinde paylaşılan önbelleği döndürür."""
+    global _shared_cache
+    with _shared_lock:
+        if _shared_cache is None:
+            _shared_cache = SearchCache()
+        return _shared_cache
@@ -0,0 +1,546 @@
+# Gerekli kütüphaneler: requests (aiohttp ve pdfminer.six opsiyonel)
+# Kurulum: pip install requests aiohttp pdfminer.six
+#
+# enhanced_pdf_searcher.py için asyncio tabanlı arama hattı. Arama motoru sorguları, sonuç ayrıştırma,
+# URL doğrulama ve önizleme çıkarma, sınırlı kuyruklarla birbirine bağlanmış ve üst üste çalışan aşamalardır;
+# her sonuç doğrulanır doğrulanmaz bildirilir. Bu modül Qt içe aktarmaz.
+
+import asyncio
+import hashlib
+import io
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+import content_dedup
+import http_pool
+import pdf_range
+import search_cache
+import url_normalize
+
+# aiohttp kuruluysa yüzlerce istek tek iş parçacığında aynı anda yürütülür;
+# kurulu değilse requests oturumu bir iş parçacığı havuzunda çalıştırılır
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+try:
+    from pdfminer.high_level import extract_text
+    PDF_PREVIEW_AVAILABLE = True
+except ImportError:
+    PDF_PREVIEW_AVAILABLE = False
+
+PROBE_SIZE = 1024              # PDF imzası için okunan bayt sayısı
+PREVIEW_SIZE = 100 * 1024      # Önizleme için indirilen en fazla bayt sayısı
+PREVIEW_CHARS = 500            # Önizleme metninin en fazla uzunluğu
+DEFAULT_CONCURRENCY = 128      # Aynı anda doğrulanan en fazla URL sayısı
+DEFAULT_QUEUE_SIZE = 256       # Aşamalar arasındaki kuyrukların kapasitesi
+THREADED_MAX_WORKERS = 32      # aiohttp yokken istekleri yürüten iş parçacığı sayısı
+PREVIEW_WORKERS = 32           # Önizleme iş parçacıkları; çoğu zaman Range yanıtı beklediklerinden çekirdek sayısını aşabilir
+SEARCH_TIMEOUT = 20
+VERIFY_TIMEOUT = 10
+PREVIEW_TIMEOUT = 20
+ENGINE_TIMEOUT = 10            # Birden fazla motor sorgulanırken her motora tanınan süre (sorgu + ayrıştırma)
+RRF_K = 60                     # Reciprocal rank fusion sabiti; büyüdükçe alt sıralar görece daha çok ağırlık alır
+
+
+class FetchResponse(namedtuple("FetchResponse", "status headers content url")):
+    """Bir HTTP yanıtının hat için gereken kısmı. Başlık adları küçük harflidir."""
+    __slots__ = ()
+
+    @property
+    def text(self):
+        charset = "utf-8"
+        content_type = self.headers.get("content-type", "")
+        if "charset=" in content_type:
+            charset = content_type.split("charset=")[-1].split(";")[0].strip() or charset
+        try:
+            return self.content.decode(charset, errors="replace")
+        except LookupError:
+            return self.content.decode("utf-8", errors="replace")
+
+
+class AiohttpFetcher:
+    """aiohttp üzerinde, toplam ve sunucu başına bağlantı sayısı sınırlı istemci."""
+
+    def __init__(self, limit=DEFAULT_CONCURRENCY, limit_per_host=http_pool.DEFAULT_PER_HOST):
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self._session = None
+
+    async def __aenter__(self):
+        connector = aiohttp.TCPConnector(limit=self.limit, limit_per_host=self.limit_per_host)
+        self._session = aiohttp.ClientSession(connector=connector)
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self._session.close()
+
+    async def fetch(self, method, url, headers=None, params=None, timeout=VERIFY_TIMEOUT, limit=None):
+        """İsteği yapar; limit verilirse gövdenin yalnızca ilk limit baytı okunur."""
+        async with self._session.request(
+            method, url, headers=headers, params=params,
+            timeout=aiohttp.ClientTimeout(total=timeout), allow_redirects=True
+        ) as response:
+            content = b""
+            if method != "HEAD":
+                if limit is None:
+                    content = await response.read()
+                else:
+                    chunks, size = [], 0
+                    async for chunk in response.content.iter_chunked(8192):
+                        chunks.append(chunk)
+                        size += len(chunk)
+                        if size >= limit:
+                            break
+                    content = b"".join(chunks)[:limit]
+            headers = {key.lower(): value for key, value in response.headers.items()}
+            return FetchResponse(response.status, headers, content, str(response.url))
+
+    async def fetch_sha256(self, url, headers=None, timeout=content_dedup.FULL_HASH_TIMEOUT,
+                           max_size=content_dedup.MAX_FULL_HASH):
+        """Gövdeyi bellekte tutmadan SHA-256 özetini hesaplar (content_dedup.full_hash karşılığı); max_size aşılırsa None."""
+        async with self._session.get(
+            url, headers=headers, timeout=aiohttp.ClientTimeout(total=timeout), allow_redirects=True
+        ) as response:
+            if response.status >= 400:
+                raise RuntimeError(f"HTTP {response.status}")
+            digest, size = hashlib.sha256(), 0
+            async for chunk in response.content.iter_chunked(64 * 1024):
+                size += len(chunk)
+                if size > max_size:
+                    return None
+                digest.update(chunk)
+            return digest.hexdigest()
+
+
+class ThreadedFetcher:
+    """aiohttp kurulu değilken requests oturumunu iş parçacığı havuzunda çalıştıran istemci."""
+
+    def __init__(self, session=None, max_workers=THREADED_MAX_WORKERS):
+        self.session = session or http_pool.get_shared_session()
+        self.max_workers = max_workers
+        self._executor = None
+
+    async def __aenter__(self):
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    async def fetch(self, method, url, headers=None, params=None, timeout=VERIFY_TIMEOUT, limit=None):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, self._fetch, method, url, headers, params, timeout, limit
+        )
+
+    def _fetch(self, method, url, headers, params, timeout, limit):
+        response = self.session.request(
+            method, url, headers=headers, params=params, timeout=timeout, stream=True, allow_redirects=True
+        )
+        try:
+            content = b""
+            if method != "HEAD":
+                if limit is None:
+                    content = response.content
+                else:
+                    chunks, size = [], 0
+                    for chunk in response.iter_content(chunk_size=8192):
+                        chunks.append(chunk)
+                        size += len(chunk)
+                        if size >= limit:
+                            break
+                    content = b"".join(chunks)[:limit]
+        finally:
+            response.close()
+        headers = {key.lower(): value for key, value in response.headers.items()}
+        return FetchResponse(response.status_code, headers, content, response.url)
+
+    async def fetch_sha256(self, url, headers=None, timeout=content_dedup.FULL_HASH_TIMEOUT,
+                           max_size=content_dedup.MAX_FULL_HASH):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, content_dedup.full_hash, self.session, url, headers, timeout, max_size
+        )
+
+
+def create_fetcher(session=None, concurrency=DEFAULT_CONCURRENCY):
+    """aiohttp kuruluysa AiohttpFetcher, değilse verilen (veya ortak) oturumla ThreadedFetcher döndürür."""
+    if AIOHTTP_AVAILABLE:
+        return AiohttpFetcher(limit=concurrency)
+    return ThreadedFetcher(session, max_workers=min(concurrency, THREADED_MAX_WORKERS))
+
+
+def fuse_rankings(rankings, k=RRF_K):
+    """
+    Motorların sıralamalarını reciprocal rank fusion ile birleştirir.
+    rankings: {motor adı: [url, ...]}; her URL'nin puanı, göründüğü her listede 1 / (k + sıra) toplamıdır.
+    URL'leri puana göre azalan sırada döndürür; eşitlikte ilk bulunma sırası korunur.
+    """
+    scores = {}
+    for urls in rankings.values():
+        for rank, url in enumerate(urls, start=1):
+            scores[url] = scores.get(url, 0.0) + 1.0 / (k + rank)
+    return sorted(scores, key=scores.get, reverse=True)
+
+
+def preview_text(source):
+    """
+    PDF baytlarından veya dosya nesnesinden (ör. pdf_range.RangeFile) ilk sayfanın metnini çıkarır,
+    boşlukları sadeleştirir ve kısaltır.
+    """
+    pdf_file = io.BytesIO(source) if isinstance(source, (bytes, bytearray)) else source
+    text = extract_text(pdf_file, page_numbers=[0], maxpages=1)
+    text = ' '.join(text.split())
+    if len(text) > PREVIEW_CHARS:
+        text = text[:PREVIEW_CHARS] + "..."
+    return text if text.strip() else "PDF'te çıkarılabilir metin bulunamadı."
+
+
+class SearchPipeline:
+    """
+    Arama motoru sorgularını, doğrulamayı ve önizlemeyi asyncio üzerinde eşzamanlı yürütür.
+
+    engines: [(motor adı, base_url, params), ...] listesi; tüm motorlar aynı anda sorgulanır ve
+    her birine en fazla engine_timeout saniye tanınır. Sonuçlar url_normalize anahtarıyla eşlenir ve birden fazla
+    motorun bulduğu sonuç bir kez doğrulanır; son liste reciprocal rank fusion ile sıralanır. Anahtar yalnızca
+    karşılaştırma içindir: istekler ve sonuçlar yönlendirmesi açılmış özgün URL'yi (imzalı, sıraya duyarlı
+    sorgusuyla birlikte) kullanır.
+    parse(motor adı, html): [(başlık, url, açıklama), ...] döndürür; iş parçacığında çağrılır.
+    on_result(sonuç) her sonuç hazır olur olmaz, on_progress(mesaj, yüzde) ve on_error(mesaj)
+    ise hat ilerledikçe çağrılır. should_continue() False dönerse hat durdurulur.
+    cache (search_cache.SearchCache) verilirse motor sonuçları, doğrulama kararları ve önizlemeler oradan okunur;
+    süresi dolmuş doğrulamalar koşullu GET ile yenilenir.
+    dedup=True ise doğrulanan PDF'lerin içerik parmak izi (content_dedup) alınır; farklı URL'lerdeki aynı dosya
+    önizlemeden önce elenir ve sıralamaya asıl URL'nin payı olarak katılır. duplicates ile ortak bir
+    content_dedup.DuplicateIndex verilebilir.
+    """
+
+    def __init__(self, engines, parse, on_result=None, on_progress=None, on_error=None,
+                 should_continue=None, verify=True, num_results=20,
+                 concurrency=DEFAULT_CONCURRENCY, queue_size=DEFAULT_QUEUE_SIZE,
+                 search_headers=None, fetch_headers=None, fetcher=None, session=None,
+                 engine_timeout=SEARCH_TIMEOUT, cache=None, dedup=True, duplicates=None):
+        self.engines = list(engines)
+        self.parse = parse
+        self.on_result = on_result
+        self.on_progress = on_progress
+        self.on_error = on_error
+        self.should_continue = should_continue
+        self.verify = verify
+        self.num_results = num_results
+        self.concurrency = max(1, concurrency)
+        self.queue_size = queue_size
+        self.search_headers = search_headers or dict
+        self.fetch_headers = fetch_headers or dict
+        self.fetcher = fetcher or create_fetcher(session, self.concurrency)
+        self.engine_timeout = engine_timeout
+        self.cache = cache
+        self.dedup = dedup
+        self.duplicates = duplicates or content_dedup.DuplicateIndex()
+        self.results = []
+        self.rankings = {}  # motor adı -> normalleştirilmiş URL'lerin o motordaki sırası
+        self._ready = {}    # normalleştirilmiş URL -> hazır sonuç
+        self._keys = {}     # istek yapılan URL -> normalleştirilmiş URL
+        self._fingerprints = {}  # istek yapılan URL -> content_dedup.Fingerprint
+        self._found = 0
+        self._checked = 0
+
+    async def run(self):
+        """Hattı çalıştırır ve hazırlanan sonuçları birleşik sıralamaya göre döndürür."""
+        self.results = []
+        self.rankings = {name: [] for name, _, _ in self.engines}
+        self._ready = {}
+        self._keys = {}
+        self._fingerprints = {}
+        self._found = 0
+        self._checked = 0
+        async with self.fetcher:
+            self._preview_executor = ThreadPoolExecutor(max_workers=min(self.concurrency, PREVIEW_WORKERS))
+            stages = asyncio.create_task(self._run_stages())
+            watcher = asyncio.create_task(self._watch(stages))
+            try:
+                await stages
+            except asyncio.CancelledError:
+                if not watcher.done():
+                    raise
+            finally:
+                watcher.cancel()
+                self._preview_executor.shutdown(wait=False, cancel_futures=True)
+        # Sonuçlar hazır oldukça bildirildi; döndürülen liste motorların ortak sıralamasını izler
+        # Yinelenen URL'lerin sıraları asıl URL'ye aktarılır
+        urls = {key: url for url, key in self._keys.items()}
+        rankings = {
+            name: list(dict.fromkeys(self._canonical_key(key, urls.get(key)) for key in keys))
+            for name, keys in self.rankings.items()
+        }
+        self.results = [self._ready[url] for url in fuse_rankings(rankings) if url in self._ready]
+        return self.results
+
+    def _canonical_key(self, key, url):
+        if url is None:
+            return key
+        canonical = self.duplicates.canonical(url)
+        return self._keys.get(canonical) or url_normalize.normalize_url(canonical)
+
+    async def _watch(self, stages):
+        # Durdurma isteği gelirse tüm aşamaları iptal et
+        while self.should_continue is not None:
+            if not self.should_continue():
+                stages.cancel()
+                return
+            await asyncio.sleep(0.1)
+
+    async def _run_stages(self):
+        candidates = asyncio.Queue(self.queue_size)
+        verified = asyncio.Queue(self.queue_size)
+        seen = set()
+
+        searchers = [
+            asyncio.create_task(self._search(name, base_url, params, candidates, seen))
+            for name, base_url, params in self.engines
+        ]
+        verifiers = [asyncio.create_task(self._verify(candidates, verified)) for _ in range(self.concurrency)]
+        previewers = [asyncio.create_task(self._preview(verified)) for _ in range(self.concurrency)]
+        try:
+            await asyncio.gather(*searchers)
+            for _ in verifiers:
+                await candidates.put(None)
+            await asyncio.gather(*verifiers)
+            for _ in previewers:
+                await verified.put(None)
+            await asyncio.gather(*previewers)
+        finally:
+            for task in searchers + verifiers + previewers:
+                task.cancel()
+
+    async def _search(self, name, base_url, params, candidates, seen):
+        try:
+            results = await asyncio.wait_for(self._query(name, base_url, params), self.engine_timeout)
+        except asyncio.TimeoutError:
+            self._error(f"{name} {self.engine_timeout} saniye içinde yanıt vermedi, sonuçları atlandı.")
+            return
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self._error(f"{name} sorgulanırken hata: {str(e)}")
+            return
+
+        ranking = self.rankings[name]
+        for title, url, description in results:
+            if len(ranking) >= self.num_results:
+                break
+            try:
+                key = url_normalize.normalize_url(url)
+            except ValueError:
+                continue  # Geçersiz port, bozuk IPv6 adresi vb.: yalnızca bu sonuç atlanır
+            if key in ranking:
+                continue
+            ranking.append(key)
+            if key in seen:
+                continue  # Başka bir motor zaten buldu; sıralamaya katkı verir ama bir kez doğrulanır
+            seen.add(key)
+            # İstekler özgün URL'yle yapılır; normalleştirme sorguyu yeniden kodlayıp sıraladığından imzalı
+            # bağlantıları bozabilir
+            url = url_normalize.unwrap_redirect(url.strip())
+            self._keys[url] = key
+            self._found += 1
+            await candidates.put((title, url, description))
+
+    async def _query(self, name, base_url, params):
+        key = search_cache.engine_key(name, params)
+        if self.cache is not None:
+            entry = self.cache.get(search_cache.ENGINE, key)
+            if entry is not None and entry.fresh:
+                return [tuple(result) for result in entry.value]
+
+        response = await self.fetcher.fetch(
+            "GET", base_url, headers=self.search_headers(), params=params, timeout=SEARCH_TIMEOUT
+        )
+        if response.status >= 400:
+            raise RuntimeError(f"HTTP {response.status}")
+        loop = asyncio.get_running_loop()
+        results = await loop.run_in_executor(None, self.parse, name, response.text)
+        if self.cache is not None and results:
+            self.cache.put(search_cache.ENGINE, key, results)
+        return results
+
+    async def _verify(self, candidates, verified):
+        while True:
+            result = await candidates.get()
+            if result is None:
+                return
+            is_pdf, message, probe = True, None, b""
+            if self.verify:
+                try:
+                    is_pdf, message, probe = await self._probe(result[1])
+                except asyncio.CancelledError:
+                    raise
+                except Exception:
+                    is_pdf = False
+            if is_pdf and self.dedup:
+                is_pdf = await self._deduplicate(result[1], probe) is None
+            self._checked += 1
+            self._progress(f"PDF URL'leri doğrulanıyor... ({self._checked}/{self._found})",
+                           10 + 80 * self._checked // max(self._found, 1))
+            if is_pdf:
+                await verified.put((result, message, probe))
+
+    async def _probe(self, url):
+        """(PDF mi, önbellekteki önizleme metni veya None, indirilen ilk baytlar) döndürür."""
+        headers = self.fetch_headers()
+        if self.cache is not None:
+            entry = self.cache.get(search_cache.VALIDATION, url)
+            if entry is not None and entry.value.get("fingerprint"):
+                self._fingerprints[url] = content_dedup.Fingerprint(*entry.value["fingerprint"])
+            if entry is not None and entry.fresh:
+                return entry.value["is_pdf"], entry.value["message"], b""
+            if entry is not None and entry.revalidatable:
+                # Süresi dolmuş kararı koşullu GET ile yenile; 304 gelirse gövde indirilmez
+                response = await self.fetcher.fetch(
+                    "GET", url, headers=dict(headers, **entry.conditional_headers()),
+                    timeout=VERIFY_TIMEOUT, limit=PROBE_SIZE
+                )
+                if response.status == 304:
+                    self.cache.touch(search_cache.VALIDATION, url)
+                    return entry.value["is_pdf"], entry.value["message"], b""
+                return self._store_verdict(url, response, response.content.startswith(b'%PDF-')), None, response.content
+
+        # HEAD isteğiyle dosya tipini kontrol et (ancak bazı sunucular HEAD'i desteklemez)
+        try:
+            response = await self.fetcher.fetch("HEAD", url, headers=headers, timeout=VERIFY_TIMEOUT)
+            if 'application/pdf' in response.headers.get('content-type', '').lower():
+                return self._store_verdict(url, response, True), None, b""
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            pass
+        # PDF sihirli numarası ile kontrol
+        response = await self.fetcher.fetch("GET", url, headers=headers, timeout=VERIFY_TIMEOUT, limit=PROBE_SIZE)
+        return self._store_verdict(url, response, response.content.startswith(b'%PDF-')), None, response.content
+
+    def _store_verdict(self, url, response, is_pdf, message=None):
+        if self.cache is not None and response.status < 400:
+            value = {"is_pdf": is_pdf, "message": message}
+            if url in self._fingerprints:
+                value["fingerprint"] = list(self._fingerprints[url])
+            self.cache.put(search_cache.VALIDATION, url, value, **search_cache.response_validators(response.headers))
+        return is_pdf
+
+    async def _deduplicate(self, url, head):
+        """URL daha önce doğrulanan bir sonucun içerik kopyasıysa asıl URL'yi, değilse None döndürür."""
+        fingerprint = self._fingerprints.get(url)
+        if fingerprint is None:
+            try:
+                fingerprint = await self._fingerprint(url, head)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                return None  # Range desteklenmiyor veya istek başarısız: sonuç olduğu gibi kalır
+            self._fingerprints[url] = fingerprint
+        for other in self.duplicates.register(url, fingerprint):
+            if content_dedup.same_content(await self._full_hash(other), await self._full_hash(url)):
+                self.duplicates.mark_duplicate(url, other)
+                return self.duplicates.canonical(url)
+        return None
+
+    async def _fingerprint(self, url, head):
+        async def request(start, length):
+            headers = self.fetch_headers()
+            headers["Range"] = pdf_range.range_header(start, length)
+            headers["Accept-Encoding"] = "identity"
+            response = await self.fetcher.fetch("GET", url, headers=headers, timeout=VERIFY_TIMEOUT, limit=length)
+            if response.status != 206:
+                raise pdf_range.RangeNotSupported(f"HTTP {response.status}")
+            return response.content, response.headers.get("content-range")
+
+        # content_dedup.fingerprint_request'in asyncio karşılığı
+        tail, content_range = await request(None, content_dedup.FINGERPRINT_SIZE)
+        _, _, size = pdf_range.parse_content_range(content_range)
+        if len(head) < min(content_dedup.FINGERPRINT_SIZE, size):
+            head, _ = await request(0, min(content_dedup.FINGERPRINT_SIZE, size))
+        return content_dedup.make_fingerprint(size, head, tail)
+
+    async def _full_hash(self, url):
+        known, digest = self.duplicates.known_full_hash(url)
+        if known:
+            return digest
+        fingerprint = self._fingerprints.get(url)
+        try:
+            if fingerprint is not None and fingerprint.size > content_dedup.MAX_FULL_HASH:
+                digest = None  # Boyut parmak izinden biliniyor; indirmeye gerek yok
+            else:
+                digest = await self.fetcher.fetch_sha256(url, headers=self.fetch_headers())
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            digest = f"error:{url}"  # Karşılaştırılamayan dosya hiçbir şeyle eşleşmez
+        self.duplicates.store_full_hash(url, digest)
+        return digest
+
+    async def _preview(self, verified):
+        loop = asyncio.get_running_loop()
+        while True:
+            item = await verified.get()
+            if item is None:
+                return
+            (title, url, description), message, probe = item
+            if message is not None:
+                description = message  # Önbellekten gelen önizleme
+            elif self.verify:
+                if PDF_PREVIEW_AVAILABLE:
+                    try:
+                        description, response = await loop.run_in_executor(
+                            self._preview_executor, self._remote_preview, url, probe, loop
+                        )
+                        self._store_verdict(url, response, True, description)
+                    except asyncio.CancelledError:
+                        raise
+                    except Exception as e:
+                        description = f"Önizleme alınamadı: {str(e)}"
+                else:
+                    description = "PDF doğrulandı, önizleme kullanılamıyor"
+            result = (title, url, description)
+            self._ready[self._keys[url]] = result
+            if self.on_result is not None:
+                self.on_result(result)
+
+    def _remote_preview(self, url, probe, loop):
+        """
+        İş parçacığında çalışır: önizlemeyi Range istekleriyle (pdf_range) çıkarır, istekler olay döngüsündeki
+        fetcher üzerinden yapılır. Sunucu Range desteklemiyorsa dosyanın ilk PREVIEW_SIZE baytı kullanılır.
+        (önizleme metni, son yanıt) döndürür.
+        """
+        responses = []
+
+        def fetch(headers, limit):
+            response = asyncio.run_coroutine_threadsafe(
+                self.fetcher.fetch("GET", url, headers=headers, timeout=PREVIEW_TIMEOUT, limit=limit), loop
+            ).result()
+            responses.append(response)
+            return response
+
+        def request(start, length):
+            headers = self.fetch_headers()
+            headers["Range"] = pdf_range.range_header(start, length)
+            headers["Accept-Encoding"] = "identity"
+            response = fetch(headers, length)
+            if response.status != 206:
+                raise pdf_range.RangeNotSupported(f"HTTP {response.status}")
+            return response.content, response.headers.get("content-range")
+
+        try:
+            pdf_file = pdf_range.open_remote(request, probe=probe)
+        except pdf_range.RangeNotSupported:
+            pdf_file = fetch(self.fetch_headers(), PREVIEW_SIZE).content
+        return preview_text(pdf_file), responses[-1]
+
+    def _progress(self, message, percent):
+        if self.on_progress is not None:
+            self.on_progress(message, min(int(percent), 90))
+
+    def _error(self, message):
+        if self.on_error is not None:
+            self.on_error(message)
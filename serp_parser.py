@@ -0,0 +1,183 @@
+# Gerekli kütüphaneler: lxml
+# Kurulum: pip install lxml
+#
+# Arama motoru sonuç sayfalarını (SERP) tek geçişte ayrıştırır. Belge ağacı bir kez dolaşılır:
+# bu sırada hangi sonuç kapsayıcısı türlerinin sayfada bulunduğu işaretlenir ve PDF bağlantıları toplanır.
+# Kapsayıcı, başlık ve açıklama yalnızca PDF bağlantıları için, bağlantıdan yukarı doğru yürünerek bulunur.
+# Kapsayıcı bulunamazsa kullanılan "tüm bağlantılar" yedeği için ikinci bir geçiş gerekmez.
+
+from collections import namedtuple
+from urllib.parse import urlsplit
+
+import lxml.html
+from lxml import etree
+
+import url_normalize
+
+NO_TITLE = "Başlıksız PDF"
+NO_DESCRIPTION = "Açıklama yok"
+MAX_DESCRIPTION = 300
+
+# Kapsayıcı türleri öncelik sırasıyla (etiket veya None, sınıf adı veya "@öznitelik").
+# title: başlığın kapsayıcıdan mı bağlantıdan mı alınacağı.
+# description: açıklamayı taşıyan öğenin sınıfları (ve varsa içindeki etiket).
+# fallback_when_empty: kapsayıcılardan sonuç çıkmazsa sayfadaki tüm PDF bağlantılarının kullanılıp kullanılmayacağı.
+ENGINE_SPECS = {
+    "Google": {
+        "containers": [("div", "g"), ("div", "MjjYud"), ("div", "Gx5Zad"), ("div", "tF2Cxc"), ("div", "@data-hveid")],
+        "title": "container",
+        "description": (("VwiC3b", "IsZvec", "aCOpRe", "st"), None),
+        "fallback_when_empty": False,
+        "fallback_description": "near_link",
+    },
+    "Bing": {
+        "containers": [("li", "b_algo"), ("div", "b_title"), (None, "b_algo")],
+        "title": "link",
+        "description": (("b_caption",), "p"),
+        "fallback_when_empty": True,
+        "fallback_description": None,
+    },
+    "DuckDuckGo": {
+        "containers": [(None, "result"), (None, "links_main"), (None, "result__body")],
+        "title": "link",
+        "description": (("result__snippet",), None),
+        "fallback_when_empty": True,
+        "fallback_description": None,
+    },
+    "Yandex": {
+        "containers": [(None, "serp-item"), (None, "organic"), (None, "search-result")],
+        "title": "link",
+        "description": (("organic__snippet",), None),
+        "fallback_when_empty": True,
+        "fallback_description": None,
+    },
+}
+
+SerpPage = namedtuple("SerpPage", "results links")  # [(başlık, url, açıklama), ...], sayfadaki tüm href'ler
+
+
+def _text(element):
+    return " ".join(element.text_content().split())
+
+
+def _matches(element, kind, classes):
+    tag, token = kind
+    if tag is not None and element.tag != tag:
+        return False
+    if token.startswith("@"):
+        return element.get(token[1:]) is not None
+    return token in classes
+
+
+def link_title(link):
+    """Bağlantının başlığı: içindeki h3, yoksa bağlantı metni, yoksa title özniteliği."""
+    heading = next(link.iter("h3"), None)
+    title = _text(heading if heading is not None else link) or (link.get("title") or "").strip()
+    return title or None
+
+
+def container_title(container):
+    heading = next(container.iter("h3"), None)
+    if heading is not None and _text(heading):
+        return _text(heading)
+    link = next(container.iter("a"), None)
+    return link_title(link) if link is not None else None
+
+
+def container_description(container, description_spec):
+    classes, tag = description_spec
+    for element in container.iter(etree.Element):
+        if set((element.get("class") or "").split()) & set(classes):
+            if tag is not None:
+                element = next(element.iter(tag), None)
+                if element is None:
+                    continue
+            return _text(element) or None
+    return None
+
+
+def description_near_link(link):
+    """Bağlantının en fazla üç üst öğesinde, bağlantı metninden belirgin biçimde uzun bir metin arar."""
+    title = _text(link)
+    element = link.getparent()
+    for _ in range(3):
+        if element is None:
+            break
+        text = _text(element)
+        if len(text) > len(title) + 20:
+            return text.replace(title, "", 1).strip()[:MAX_DESCRIPTION]
+        element = element.getparent()
+    return None
+
+
+def _pdf_target(href):
+    # Yönlendirme sarmalayıcısını aç; yalnızca mutlak http(s) PDF bağlantılarını kabul et
+    target = url_normalize.unwrap_redirect(href)
+    if urlsplit(target).scheme not in ("http", "https"):
+        return None
+    return target if url_normalize.is_pdf_url(target) else None
+
+
+def parse(engine, html):
+    """
+    Sonuç sayfasını tek geçişte ayrıştırır ve SerpPage döndürür.
+    Bilinmeyen motor adları için Google kuralları kullanılır.
+    """
+    spec = ENGINE_SPECS.get(engine, ENGINE_SPECS["Google"])
+    kinds = spec["containers"]
+    try:
+        document = lxml.html.document_fromstring(html)
+    except (etree.ParserError, ValueError):
+        return SerpPage([], [])
+
+    present = [False] * len(kinds)
+    pdf_links = []  # (bağlantı öğesi, asıl URL), belge sırasıyla
+    links = []
+    for element in document.iter(etree.Element):
+        classes = element.get("class")
+        if classes or element.tag == "div":
+            classes = classes.split() if classes else ()
+            for index, kind in enumerate(kinds):
+                if not present[index] and _matches(element, kind, classes):
+                    present[index] = True
+        if element.tag == "a":
+            href = element.get("href")
+            if href:
+                links.append(href)
+                target = _pdf_target(href)
+                if target:
+                    pdf_links.append((element, target))
+
+    results = []
+    processed_urls = set()
+    kind = next((kinds[index] for index, found in enumerate(present) if found), None)
+    if kind is not None:
+        for link, target in pdf_links:
+            if target in processed_urls:
+                continue
+            # Belge sırasında ilk gelen (en dıştaki) kapsayıcı özgün seçici davranışıyla aynıdır
+            container = None
+            ancestor = link.getparent()
+            while ancestor is not None:
+                if _matches(ancestor, kind, (ancestor.get("class") or "").split()):
+                    container = ancestor
+                ancestor = ancestor.getparent()
+            if container is None:
+                continue
+            if spec["title"] == "container":
+                title = container_title(container)
+            else:
+                title = link_title(link)
+            description = container_description(container, spec["description"])
+            results.append((title or NO_TITLE, target, description or NO_DESCRIPTION))
+            processed_urls.add(target)
+
+    if kind is None or (not results and spec["fallback_when_empty"]):
+        for link, target in pdf_links:
+            if target in processed_urls:
+                continue
+            description = description_near_link(link) if spec["fallback_description"] == "near_link" else None
+            results.append((link_title(link) or NO_TITLE, target, description or NO_DESCRIPTION))
+            processed_urls.add(target)
+
+    return SerpPage(results, links)
@@ -0,0 +1,82 @@
+# Testler için ortak yardımcılar: depo kökünü içe aktarma yoluna ekler ve küçük PDF'ler üreten fixture'lar sağlar.
+
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+def write_pdf(path, objects, pages, catalog=b"", xref_stream=False):
+    """
+    objects ({numara: gövde}) nesnelerini ve pages listesindeki sayfa numaralarından oluşan düz bir sayfa ağacını
+    path'e yazar. 1 ve 2 numaralar katalog ve sayfa ağacı köküne ayrılmıştır; kök düğüm sayfalara /MediaBox ve
+    Helvetica /F1 fontunu devreder. objects 2 numarayı içeriyorsa kök olarak o kullanılır (çok seviyeli ağaçlar için).
+    catalog kataloğa eklenecek ek girdilerdir (örn. b"/AcroForm << /Fields [ 6 0 R ] >>").
+    xref_stream=True ise klasik xref tablosu yerine xref akışı (PDF 1.5) yazılır.
+    """
+    objects = dict(objects)
+    objects[1] = b"<< /Type /Catalog /Pages 2 0 R %s >>" % catalog
+    objects.setdefault(2, (b"<< /Type /Pages /Kids [ %s ] /Count %d /MediaBox [ 0 0 612 792 ]"
+                           b" /Resources << /Font << /F1 << /Type /Font /Subtype /Type1 /BaseFont /Helvetica >> >> >> >>")
+                       % (b" ".join(b"%d 0 R" % page for page in pages), len(pages)))
+    offsets = {}
+    with open(path, "wb") as output:
+        output.write(b"%PDF-1.7\n%\xe2\xe3\xcf\xd3\n")
+        for number in sorted(objects):
+            offsets[number] = output.tell()
+            output.write(b"%d 0 obj\n" % number + objects[number] + b"\nendobj\n")
+        xref_offset = output.tell()
+        if xref_stream:
+            number = max(offsets) + 1
+            offsets[number] = xref_offset
+            size = number + 1
+            data = b"\x00\x00\x00\x00\x00\xff\xff" + b"".join(
+                b"\x01" + offsets[n].to_bytes(4, "big") + b"\x00\x00" if n in offsets else b"\x00" * 7
+                for n in range(1, size))
+            output.write(b"%d 0 obj\n<< /Type /XRef /W [ 1 4 2 ] /Size %d /Root 1 0 R /Length %d >>\nstream\n"
+                         % (number, size, len(data)) + data + b"\nendstream\nendobj\n")
+        else:
+            size = max(offsets) + 1
+            output.write(b"xref\n0 %d\n0000000000 65535 f\r\n" % size)
+            for number in range(1, size):
+                offset = offsets.get(number)
+                output.write(b"0000000000 00000 f\r\n" if offset is None else b"%010d 00000 n\r\n" % offset)
+            output.write(b"trailer\n<< /Size %d /Root 1 0 R >>\n" % size)
+        output.write(b"startxref\n%d\n%%%%EOF\n" % xref_offset)
+    return path
+
+
+def text_page(text, parent=2):
+    """/Contents'i text numaralı içerik akışına işaret eden bir sayfa gövdesi döndürür."""
+    return b"<< /Type /Page /Parent %d 0 R /Contents %d 0 R >>" % (parent, text)
+
+
+def stream(data, entries=b""):
+    return b"<< %s /Length %d >>\nstream\n" % (entries, len(data)) + data + b"\nendstream"
+
+
+def pages_objects(count, first=3, parent=2):
+    """count sayfalık, her sayfasında "Page N" yazan sayfa ve içerik nesnelerini ({numara: gövde}, [sayfalar]) döndürür."""
+    objects, pages = {}, []
+    for index in range(count):
+        page, content = first + 2 * index, first + 1 + 2 * index
+        objects[content] = stream(b"BT /F1 12 Tf 72 740 Td (Page %d) Tj ET" % (index + 1))
+        objects[page] = text_page(content, parent)
+        pages.append(page)
+    return objects, pages
+
+
+def page_texts(reader):
+    return [page.extract_text().strip() for page in reader.pages]
+
+
+@pytest.fixture
+def make_pages_pdf(tmp_path):
+    """Her sayfasında "Page N" yazan count sayfalık bir PDF üretir ve yolunu döndürür."""
+    def make(count, name="pages.pdf", xref_stream=False):
+        objects, pages = pages_objects(count)
+        return write_pdf(str(tmp_path / name), objects, pages, xref_stream=xref_stream)
+    return make
@@ -0,0 +1,114 @@
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+import crawl_scheduler
+from crawl_scheduler import CrawlScheduler, TokenBucket
+
+
+@pytest.fixture
+def hung_server():
+    """Bağlantıları kabul eden ama hiç yanıt vermeyen sunucu; adresi döndürür."""
+    listener = socket.socket()
+    listener.bind(("127.0.0.1", 0))
+    listener.listen(16)
+    connections, stop = [], threading.Event()
+
+    def accept():
+        listener.settimeout(0.05)
+        while not stop.is_set():
+            try:
+                connections.append(listener.accept()[0])
+            except socket.timeout:
+                pass
+
+    thread = threading.Thread(target=accept, daemon=True)
+    thread.start()
+    yield "http://127.0.0.1:%d" % listener.getsockname()[1]
+    stop.set()
+    thread.join()
+    for connection in connections + [listener]:
+        connection.close()
+
+
+class _SiteHandler(BaseHTTPRequestHandler):
+    """Bir PDF bağlantısı, kendine yönlenen bir sayfa ve gövdesi yarıda kesilen bir sayfa sunar."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        if self.path == "/":
+            body = b'<a href="/loop">loop</a> <a href="/broken">broken</a> <a href="/a.pdf">A</a>'
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        elif self.path == "/loop":
+            self.send_response(302)
+            self.send_header("Location", "/loop")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+        elif self.path == "/broken":
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html")
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            self.wfile.write(b"10\r\n<a href")  # Parça eksik gelir ve bağlantı kapanır
+            self.close_connection = True
+        else:
+            self.send_error(404)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def site():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _SiteHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True).start()
+    yield "http://127.0.0.1:%d" % server.server_address[1]
+    server.shutdown()
+    server.server_close()
+
+
+def test_request_errors_skip_only_the_failing_page(site):
+    with requests.Session() as session:
+        scheduler = CrawlScheduler(session, "test", max_depth=2, rate=100, burst=10, max_retries=1,
+                                   respect_robots=False, seed=1)
+        scheduler.add(site + "/")
+        results = scheduler.run()
+    assert [url for _, url, _ in results] == [site + "/a.pdf"]
+    assert scheduler.retries == 1  # Kesilen gövde geçici hata sayılır, yönlendirme döngüsü sayılmaz
+
+
+@pytest.mark.parametrize("respect_robots", [False, True])
+def test_run_stops_at_time_budget(hung_server, respect_robots):
+    with requests.Session() as session:
+        scheduler = CrawlScheduler(session, "test", respect_robots=respect_robots, timeout=30, time_budget=1.0)
+        for index in range(4):
+            scheduler.add(f"{hung_server}/page{index}")
+        started = time.monotonic()
+        assert scheduler.run() == []
+        assert time.monotonic() - started < 2.5
+
+
+def test_token_bucket_is_thread_safe():
+    bucket = TokenBucket(rate=1.0, burst=50, clock=lambda: 0.0)
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        granted = sum(executor.map(lambda _: bucket.try_acquire(), range(400)))
+    assert granted == 50
+    assert bucket.wait_time() == pytest.approx(1.0)
+
+
+def test_crawl_delay_only_lowers_rate():
+    bucket = TokenBucket(rate=2.0, burst=1, clock=lambda: 0.0)
+    bucket.limit_rate(0.5)
+    bucket.limit_rate(crawl_scheduler.DEFAULT_RATE)
+    assert bucket.rate == 0.5
@@ -0,0 +1,128 @@
+import hashlib
+import os
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from download_manager import DownloadManager
+
+
+class _RangeServer(ThreadingHTTPServer):
+    """files {yol: içerik} sunan, Range isteklerini destekleyen ve isteklerin başlama anlarını kaydeden yerel sunucu."""
+
+    daemon_threads = True
+
+    def __init__(self, files, delay=0.0):
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.files = files
+        self.delay = delay  # Her 64 KB'lık blok arasında beklenen süre
+        self.started = []  # İsteklerin başlama anları
+        self.lock = threading.Lock()
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = self.server.files.get(self.path)
+        if body is None:
+            self.send_error(404)
+            return
+        with self.server.lock:
+            self.server.started.append(time.monotonic())
+        try:
+            match = re.match(r"bytes=(\d+)-(\d*)", self.headers.get("Range", ""))
+            start, end = 0, len(body)
+            if match:
+                start = int(match.group(1))
+                end = int(match.group(2)) + 1 if match.group(2) else len(body)
+                self.send_response(206)
+                self.send_header("Content-Range", f"bytes {start}-{end - 1}/{len(body)}")
+            else:
+                self.send_response(200)
+            self.send_header("Content-Type", "application/pdf")
+            self.send_header("Content-Length", str(end - start))
+            self.end_headers()
+            for offset in range(start, end, 64 * 1024):
+                self.wfile.write(body[offset:min(offset + 64 * 1024, end)])
+                time.sleep(self.server.delay)
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def serve():
+    started = []
+
+    def start(files, delay=0.0):
+        server = _RangeServer(files, delay)
+        threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True).start()
+        started.append(server)
+        return server
+
+    yield start
+    for server in started:
+        server.shutdown()
+        server.server_close()
+
+
+def _download(dest, url, expected_sha256=None, **options):
+    with requests.Session() as session, DownloadManager(str(dest), session=session, **options) as manager:
+        return manager.submit(url, expected_sha256).result()
+
+
+def _read(path):
+    with open(path, "rb") as file:
+        return file.read()
+
+
+def test_segments_download_while_first_segment_streams(serve, tmp_path):
+    body = os.urandom(1024 * 1024)
+    server = serve({"/big.pdf": body}, delay=0.05)  # Parça başına 8 blok: yaklaşık 0.4 saniye
+    result = _download(tmp_path, server.url + "/big.pdf", per_host=2,
+                       split_threshold=256 * 1024, min_segment=256 * 1024)
+
+    assert result.error is None and _read(result.path) == body
+    assert len(server.started) == 2
+    assert server.started[1] - server.started[0] < 0.2
+
+
+def test_same_name_from_other_url_is_not_reused(serve, tmp_path):
+    server = serve({"/a/report.pdf": b"%PDF-1.4 first", "/b/report.pdf": b"%PDF-1.4 second"})
+    first = _download(tmp_path, server.url + "/a/report.pdf")
+    second = _download(tmp_path, server.url + "/b/report.pdf")
+
+    assert first.path != second.path
+    assert _read(first.path) == b"%PDF-1.4 first" and _read(second.path) == b"%PDF-1.4 second"
+
+    again = _download(tmp_path, server.url + "/a/report.pdf")
+    assert again.path == first.path and again.sha256 == first.sha256
+
+
+def test_unknown_or_changed_files_are_not_reused(serve, tmp_path):
+    server = serve({"/report.pdf": b"%PDF-1.4 server"})
+    with open(tmp_path / "report.pdf", "wb") as file:
+        file.write(b"%PDF-1.4 local")  # İndirici dışında konmuş dosya korunur
+    result = _download(tmp_path, server.url + "/report.pdf")
+    assert result.path != str(tmp_path / "report.pdf") and _read(result.path) == b"%PDF-1.4 server"
+    assert _read(tmp_path / "report.pdf") == b"%PDF-1.4 local"
+
+    wrong = _download(tmp_path, server.url + "/report.pdf", expected_sha256="0" * 64)
+    assert wrong.error is not None
+
+    expected = hashlib.sha256(b"%PDF-1.4 server").hexdigest()
+    with open(result.path, "wb") as file:
+        file.write(b"%PDF-1.4 edited")
+    fixed = _download(tmp_path, server.url + "/report.pdf", expected_sha256=expected)
+    assert fixed.error is None and _read(fixed.path) == b"%PDF-1.4 server"
@@ -0,0 +1,113 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import http_pool
+
+
+class _CountingServer(ThreadingHTTPServer):
+    """Açılan bağlantıları ve aynı anda işlenen istek sayısının en yüksek değerini sayan yerel sunucu."""
+
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.connections = 0
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive: bağlantılar istekler arasında açık kalır
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def do_GET(self):
+        with self.server.lock:
+            self.server.active += 1
+            self.server.max_active = max(self.server.max_active, self.server.active)
+        try:
+            if self.path.startswith("/slow"):
+                time.sleep(0.2)
+            body = b"%PDF-1.4 ok"
+            self.send_response(200)
+            self.send_header("Content-Type", "application/pdf")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        finally:
+            with self.server.lock:
+                self.server.active -= 1
+
+    def log_message(self, format, *args):
+        pass
+
+
+def _start():
+    server = _CountingServer()
+    threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True).start()
+    return server
+
+
+@pytest.fixture
+def servers():
+    started = []
+
+    def start():
+        started.append(_start())
+        return started[-1]
+
+    yield start
+    for server in started:
+        server.shutdown()
+        server.server_close()
+
+
+def test_sequential_requests_reuse_one_connection(servers):
+    server = servers()
+    session = http_pool.create_session()
+    for _ in range(20):
+        assert session.get(server.url + "/fast", timeout=5).content == b"%PDF-1.4 ok"
+    assert server.connections == 1
+
+
+def test_per_host_limit_blocks_extra_requests(servers):
+    server = servers()
+    session = http_pool.create_session(per_host=2)
+    with ThreadPoolExecutor(max_workers=6) as executor:
+        statuses = list(executor.map(lambda i: session.get(f"{server.url}/slow/{i}", timeout=5).status_code,
+                                     range(6)))
+
+    # Fazla istekler hata vermez, boş bağlantıyı bekler; sunucuya hiçbir zaman 2'den fazla bağlantı açılmaz
+    assert statuses == [200] * 6
+    assert server.max_active == 2
+    assert server.connections == 2
+
+
+def test_max_hosts_evicts_least_recently_used_host(servers):
+    first, second, third = servers(), servers(), servers()
+    session = http_pool.create_session(max_hosts=2)
+    for server in (first, second, first, third):
+        session.get(server.url + "/fast", timeout=5)
+    assert first.connections == 1  # ikinci istek açık bağlantıyı kullandı
+
+    # Üçüncü sunucu havuza girince en uzun süredir kullanılmayan ikinci sunucunun bağlantısı kapatıldı
+    session.get(second.url + "/fast", timeout=5)
+    assert second.connections == 2
+    session.get(third.url + "/fast", timeout=5)
+    assert third.connections == 1
+
+
+def test_shared_session_is_created_once():
+    assert http_pool.get_shared_session() is http_pool.get_shared_session()
@@ -0,0 +1,55 @@
+import json
+
+import pytest
+from PIL import Image
+
+import pdf_batch
+
+
+def _manifest(tmp_path, jobs):
+    path = tmp_path / "jobs.json"
+    path.write_text(json.dumps(jobs), encoding="utf-8")
+    return str(path)
+
+
+@pytest.mark.parametrize("job", [
+    {"type": "split", "input": "a.pdf", "start": 1, "output": None},
+    {"type": "split", "input": 3, "ranges": "1-2"},
+    {"type": "merge", "inputs": ["a.pdf", 2], "output": "out.pdf"},
+    {"type": "merge", "inputs": {"a": "a.pdf"}, "output": "out.pdf"},
+    {"type": "split", "input": "a.pdf", "start": "first", "output": "out.pdf"},
+    {"type": "split", "input": "a.pdf", "start": 1.5, "output": "out.pdf"},
+    {"type": "split", "input": "a.pdf", "ranges": "1-2", "workers": True},
+    {"type": "merge", "inputs": ["a.pdf"], "output": "out.pdf", "dedup": "false"},
+    {"type": "merge", "inputs": ["a.pdf"], "output": "out.pdf", "dedup": 1},
+    {"type": "images", "inputs": ["a.jpg"], "output": "out.pdf", "page_size": "A4"},
+    {"type": "images", "inputs": ["a.jpg"], "output": "out.pdf", "page_size": [612]},
+    {"type": "images", "inputs": ["a.jpg"], "output": "out.pdf", "page_size": [0, 792]},
+    {"type": "images", "inputs": ["a.jpg"], "output": "out.pdf", "page_size": [True, 792]},
+    {"type": "images", "inputs": ["a.jpg"], "output": "out.pdf", "passthrough": "false"},
+    {"type": "images", "inputs": ["a.jpg"], "output": "out.pdf", "passthrough": 1},
+])
+def test_wrongly_typed_fields_are_manifest_errors(tmp_path, capsys, job):
+    assert pdf_batch.main([_manifest(tmp_path, [job])]) == pdf_batch.EXIT_BAD_MANIFEST
+    assert capsys.readouterr().err.startswith("pdf_batch: Job 1: ")
+
+
+def test_valid_fields_are_resolved(tmp_path):
+    jobs, _ = pdf_batch.load_manifest(_manifest(tmp_path, {
+        "defaults": {"workers": "2"},
+        "jobs": [{"type": "split", "input": "a.pdf", "start": "3", "output": "out/a.pdf"},
+                 {"type": "merge", "inputs": "a.pdf", "output": "b.pdf"}],
+    }))
+    assert jobs[0]["output"] == str(tmp_path / "out" / "a.pdf") and jobs[0]["workers"] == "2"
+    assert jobs[1]["inputs"] == [str(tmp_path / "a.pdf")]
+
+
+def test_image_options_reach_the_converter(tmp_path):
+    Image.new("RGB", (40, 20), "red").save(tmp_path / "a.jpg")
+    jobs, _ = pdf_batch.load_manifest(_manifest(tmp_path, [
+        {"type": "images", "inputs": ["a.jpg"], "output": "out.pdf", "page_size": [595.3, 841.9], "passthrough": True},
+        {"type": "merge", "inputs": ["out.pdf", "out.pdf"], "output": "merged.pdf", "dedup": False},
+    ]))
+    lines = [pdf_batch.run_job(job) for job in jobs]
+    assert [line["status"] for line in lines] == ["ok", "ok"]
+    assert lines[0]["result"]["passthrough"] == 1
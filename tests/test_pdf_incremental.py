@@ -0,0 +1,80 @@
+import os
+
+import pytest
+from PyPDF2 import PdfReader
+
+import pdf_incremental
+import pdf_lazy
+from conftest import page_texts, stream, write_pdf
+
+
+def _original(path):
+    with open(path, "rb") as pdf_file:
+        return pdf_file.read()
+
+
+@pytest.mark.parametrize("xref_stream", [False, True])
+def test_update_metadata_appends_to_original(make_pages_pdf, xref_stream):
+    path = make_pages_pdf(3, xref_stream=xref_stream)
+    original = _original(path)
+
+    stats = pdf_incremental.update_metadata(path, {"Title": "Rapor", "Author": "PDF-Works"})
+    assert _original(path).startswith(original)
+    assert os.path.getsize(path) == len(original) + stats["bytes_written"]
+
+    # İkinci güncelleme ilkine /Prev ile bağlanır
+    pdf_incremental.update_metadata(path, {"/Title": "Rapor v2", "Author": None})
+    for reader in (PdfReader(path, strict=True), pdf_lazy.LazyPdfReader(path)):
+        assert reader.metadata.get("/Title") == "Rapor v2"
+        assert "/Author" not in reader.metadata
+        assert page_texts(reader) == ["Page 1", "Page 2", "Page 3"]
+
+
+@pytest.mark.parametrize("xref_stream", [False, True])
+def test_remove_and_insert_pages(make_pages_pdf, xref_stream):
+    path = make_pages_pdf(5, xref_stream=xref_stream)
+    pdf_incremental.remove_pages(path, [2, 4])
+    assert page_texts(PdfReader(path, strict=True)) == ["Page 1", "Page 3", "Page 5"]
+
+    source = make_pages_pdf(2, name="insert.pdf")
+    stats = pdf_incremental.insert_pages(path, source, pages=[2], at=2)
+    assert stats["pages"] == 4
+    assert page_texts(PdfReader(path, strict=True)) == ["Page 1", "Page 2", "Page 3", "Page 5"]
+
+    pdf_incremental.insert_pages(path, source)
+    assert page_texts(PdfReader(path, strict=True))[-2:] == ["Page 1", "Page 2"]
+
+
+def test_inserted_form_keeps_field_links(make_pages_pdf, tmp_path):
+    form = write_pdf(str(tmp_path / "form.pdf"), {
+        3: b"<< /Type /Page /Parent 2 0 R /Contents 7 0 R /Annots [ 4 0 R 5 0 R ] >>",
+        4: b"<< /Type /Annot /Subtype /Widget /Rect [ 0 0 10 10 ] /Parent 6 0 R >>",
+        5: b"<< /Type /Annot /Subtype /Widget /Rect [ 20 0 30 10 ] /Parent 6 0 R >>",
+        6: b"<< /FT /Btn /T (group) /Kids [ 4 0 R 5 0 R ] >>",
+        7: stream(b"BT /F1 12 Tf 72 740 Td (Form) Tj ET"),
+    }, [3])
+    path = make_pages_pdf(2)
+    pdf_incremental.insert_pages(path, form, at=1)
+
+    page = PdfReader(path, strict=True).pages[0]
+    assert [annot.get_object()["/Parent"].get_object()["/T"] for annot in page["/Annots"]] == ["group", "group"]
+
+
+def test_output_leaves_source_untouched(make_pages_pdf, tmp_path):
+    path = make_pages_pdf(3)
+    original = _original(path)
+    output = str(tmp_path / "edited.pdf")
+    pdf_incremental.remove_pages(path, [1], output=output)
+
+    assert _original(path) == original
+    assert page_texts(PdfReader(output, strict=True)) == ["Page 2", "Page 3"]
+
+
+def test_failed_edit_restores_original_size(make_pages_pdf):
+    path = make_pages_pdf(2)
+    original = _original(path)
+    with pytest.raises(ValueError):
+        pdf_incremental.remove_pages(path, [1, 2])
+    with pytest.raises(ValueError):
+        pdf_incremental.remove_pages(path, [3])
+    assert _original(path) == original
@@ -0,0 +1,40 @@
+import threading
+
+from PIL import Image
+from PyPDF2 import PdfReader
+
+import pdf_jobs
+from conftest import page_texts
+
+
+def _run_in_thread(job):
+    """İşi GUI'deki gibi ana iş parçacığı dışında çalıştırır ve sonucunu döndürür."""
+    outcome = {}
+    thread = threading.Thread(target=lambda: outcome.update(result=job(lambda message, percent: None)))
+    thread.start()
+    thread.join(60)
+    assert not thread.is_alive()
+    return outcome["result"]
+
+
+def test_process_pools_use_spawn():
+    assert pdf_jobs.PROCESS_CONTEXT.get_start_method() == "spawn"
+
+
+def test_merge_job_with_workers(make_pages_pdf, tmp_path):
+    output = str(tmp_path / "merged.pdf")
+    job = pdf_jobs.merge_job([make_pages_pdf(2, "a.pdf"), make_pages_pdf(1, "b.pdf")], output, workers=2)
+
+    assert _run_in_thread(job) == {"pages": 3}
+    assert page_texts(PdfReader(output)) == ["Page 1", "Page 2", "Page 1"]
+
+
+def test_images_to_pdf_job(tmp_path):
+    paths = []
+    for index, color in enumerate(["red", "blue"]):
+        paths.append(str(tmp_path / f"{index}.png"))
+        Image.new("RGB", (40, 20), color).save(paths[-1])
+    output = str(tmp_path / "images.pdf")
+
+    assert _run_in_thread(pdf_jobs.images_to_pdf_job(paths, output, 72, "auto"))["images"] == 2
+    assert len(PdfReader(output).pages) == 2
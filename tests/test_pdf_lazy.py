@@ -0,0 +1,98 @@
+import pytest
+from PyPDF2 import PdfReader
+
+import pdf_jobs
+import pdf_lazy
+from pdf_stream import StreamingPdfWriter
+from conftest import page_texts, pages_objects, stream, text_page, write_pdf
+
+
+def _nested_pdf(path, counts, wrong_count=False):
+    """
+    Kökün altında her biri counts[i] sayfa taşıyan ara /Pages düğümleri olan bir PDF yazar.
+    wrong_count=True ise ilk ara düğümün /Count değeri bozulur.
+    """
+    objects, kids = {}, []
+    number, total = 100, 0
+    for count in counts:
+        node = number
+        page_objects, pages = pages_objects(count, first=node + 1, parent=node)
+        for index, page in enumerate(pages):
+            # Sayfa metinleri belge genelinde sıralı olsun
+            content = page + 1
+            page_objects[content] = page_objects[content].replace(b"(Page %d)" % (index + 1),
+                                                                   b"(Page %d)" % (total + index + 1))
+        objects.update(page_objects)
+        declared = count + 5 if wrong_count and not kids else count
+        objects[node] = b"<< /Type /Pages /Parent 2 0 R /Kids [ %s ] /Count %d >>" % (
+            b" ".join(b"%d 0 R" % page for page in pages), declared)
+        kids.append(node)
+        number += 2 * count + 1
+        total += count
+    objects[2] = (b"<< /Type /Pages /Kids [ %s ] /Count %d /MediaBox [ 0 0 612 792 ]"
+                  b" /Resources << /Font << /F1 << /Type /Font /Subtype /Type1 /BaseFont /Helvetica >> >> >> >>"
+                  % (b" ".join(b"%d 0 R" % kid for kid in kids), total))
+    return write_pdf(path, objects, [])
+
+
+def test_extract_pages_from_nested_tree(tmp_path):
+    source = _nested_pdf(str(tmp_path / "nested.pdf"), [4, 3, 5])
+    output = str(tmp_path / "part.pdf")
+    stats = pdf_lazy.extract_pages(source, 3, 9, output)
+
+    reader = PdfReader(output, strict=True)
+    assert stats["pages"] == 7
+    assert page_texts(reader) == [f"Page {number}" for number in range(3, 10)]
+    # Ara düğümlerden devralınan öznitelikler sayfalara taşınır
+    assert [float(value) for value in reader.pages[0].mediabox] == [0, 0, 612, 792]
+
+
+@pytest.mark.parametrize("split", ["lazy", "job"])
+def test_extracted_form_keeps_parent_kids_cycle(tmp_path, split):
+    source = write_pdf(str(tmp_path / "form.pdf"), {
+        3: text_page(4), 4: stream(b"BT /F1 12 Tf 72 740 Td (First) Tj ET"),
+        5: b"<< /Type /Page /Parent 2 0 R /Contents 9 0 R /Annots [ 6 0 R 7 0 R ] >>",
+        6: b"<< /Type /Annot /Subtype /Widget /Rect [ 0 0 10 10 ] /Parent 8 0 R /P 5 0 R >>",
+        7: b"<< /Type /Annot /Subtype /Widget /Rect [ 20 0 30 10 ] /Parent 8 0 R /P 5 0 R >>",
+        8: b"<< /FT /Btn /T (group) /Kids [ 6 0 R 7 0 R ] >>",
+        9: stream(b"BT /F1 12 Tf 72 740 Td (Form) Tj ET"),
+    }, [3, 5], catalog=b"/AcroForm << /Fields [ 8 0 R ] >>")
+    output = str(tmp_path / "part.pdf")
+    if split == "lazy":
+        pdf_lazy.extract_pages(source, 2, 2, output)
+    else:
+        pdf_jobs.split_job(source, 2, 2, output)(lambda *args: None)
+
+    page = PdfReader(output, strict=True).pages[0]
+    annots = [annot.get_object() for annot in page["/Annots"]]
+    field = annots[0]["/Parent"].get_object()
+    assert field["/T"] == "group" and annots[1]["/Parent"].get_object() is field
+    assert [kid.get_object() for kid in field["/Kids"]] == annots
+
+
+def test_find_pages_falls_back_when_counts_are_wrong(tmp_path):
+    source = _nested_pdf(str(tmp_path / "broken.pdf"), [2, 2], wrong_count=True)
+    with pdf_lazy.open_mapped(source) as reader:
+        pages = pdf_lazy.find_pages(reader, [2, 3])
+        texts = [page.extract_text().strip() for page in pages]
+    assert texts == ["Page 3", "Page 4"]
+
+
+def test_extract_pages_rejects_out_of_range(make_pages_pdf, tmp_path):
+    with pytest.raises(ValueError):
+        pdf_lazy.extract_pages(make_pages_pdf(3), 2, 4, str(tmp_path / "out.pdf"))
+
+
+@pytest.mark.parametrize("xref_stream", [False, True])
+def test_lazy_reader_matches_pypdf2(make_pages_pdf, xref_stream):
+    serialize = StreamingPdfWriter.serialize
+    source = make_pages_pdf(5, xref_stream=xref_stream)
+    eager = PdfReader(source, strict=True)
+    with pdf_lazy.open_mapped(source) as lazy:
+        assert pdf_lazy.page_count(lazy) == 5
+        for number in range(1, 13):
+            expected = eager.get_object(number)
+            actual = lazy.get_object(number)
+            assert type(actual) is type(expected)
+            assert serialize(actual) == serialize(expected)
+        assert page_texts(lazy) == page_texts(eager)
@@ -0,0 +1,149 @@
+import http.client
+import io
+import re
+import socket
+import threading
+import time
+import zipfile
+
+import pytest
+from PyPDF2 import PdfReader
+
+import pdf_service
+from conftest import page_texts
+
+
+@pytest.fixture(scope="module")
+def service():
+    """Tek işçili ve bekleme kuyruğu olmayan (aynı anda bir iş) yerel servis."""
+    server = pdf_service.PdfService(("127.0.0.1", 0), workers=1, queue_size=0)
+    threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True).start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _request(server, method, path, body=None, headers=None, wait_idle=True):
+    if wait_idle:
+        # Kuyruk hakkı yanıt gönderildikten sonra bırakılır; tek haklı serviste önceki istek bitmiş olmalı
+        _wait_idle(server)
+    connection = http.client.HTTPConnection(*server.server_address, timeout=30)
+    try:
+        connection.request(method, path, body=body, headers=headers or {},
+                           encode_chunked=(headers or {}).get("Transfer-Encoding") == "chunked")
+        response = connection.getresponse()
+        return response.status, dict(response.getheaders()), response.read()
+    finally:
+        connection.close()
+
+
+def _read(path):
+    with open(path, "rb") as pdf_file:
+        return pdf_file.read()
+
+
+def _metrics(server):
+    _, _, body = _request(server, "GET", "/metrics", wait_idle=False)
+    return dict(re.findall(r"^(\w+(?:\{[^}]*\})?) (\S+)$", body.decode(), re.MULTILINE))
+
+
+def _wait_idle(server):
+    deadline = time.monotonic() + 5
+    while server.metrics.active and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert server.metrics.active == 0
+
+
+def test_chunked_upload_is_split(service, make_pages_pdf):
+    data = _read(make_pages_pdf(4))
+    chunks = (data[offset:offset + 1000] for offset in range(0, len(data), 1000))
+    status, headers, body = _request(service, "POST", "/split?start=2&end=3", chunks,
+                                     {"Transfer-Encoding": "chunked", "Content-Type": "application/pdf"})
+
+    assert status == 200 and headers["Content-Type"] == "application/pdf"
+    assert page_texts(PdfReader(io.BytesIO(body))) == ["Page 2", "Page 3"]
+
+
+def test_split_ranges_returns_zip(service, make_pages_pdf):
+    status, headers, body = _request(service, "POST", "/split?ranges=1-2,3-", _read(make_pages_pdf(3)))
+
+    assert status == 200 and headers["Transfer-Encoding"] == "chunked"
+    with zipfile.ZipFile(io.BytesIO(body)) as archive:
+        parts = [PdfReader(io.BytesIO(archive.read(name))) for name in sorted(archive.namelist())]
+    assert [page_texts(part) for part in parts] == [["Page 1", "Page 2"], ["Page 3"]]
+
+
+def test_multipart_upload_is_merged(service, make_pages_pdf):
+    boundary = "pdfworks-test-boundary"
+    body = b""
+    for index, path in enumerate([make_pages_pdf(2, "a.pdf"), make_pages_pdf(1, "b.pdf")]):
+        body += (f'--{boundary}\r\nContent-Disposition: form-data; name="f"; filename="{index}.pdf"\r\n'
+                 f"Content-Type: application/pdf\r\n\r\n").encode() + _read(path) + b"\r\n"
+    body += f'--{boundary}\r\nContent-Disposition: form-data; name="note"\r\n\r\nnot a file\r\n'.encode()
+    body += f"--{boundary}--\r\n".encode()
+    status, _, merged = _request(service, "POST", "/merge", body,
+                                 {"Content-Type": f"multipart/form-data; boundary={boundary}"})
+
+    assert status == 200
+    assert page_texts(PdfReader(io.BytesIO(merged))) == ["Page 1", "Page 2", "Page 1"]
+
+
+def test_bad_range_is_unprocessable(service, make_pages_pdf):
+    status, _, body = _request(service, "POST", "/split?start=5&end=6", _read(make_pages_pdf(3)))
+    assert status == 422 and b"error" in body
+
+    status, _, _ = _request(service, "POST", "/split?start=first", _read(make_pages_pdf(3)))
+    assert status == 400
+
+
+def test_full_queue_returns_503_with_retry_after(service, make_pages_pdf):
+    _wait_idle(service)
+    rejected = service.metrics.rejected
+    # Gövdesi bitmeyen bir yükleme tek kuyruk hakkını tutar
+    uploader = socket.create_connection(service.server_address)
+    try:
+        uploader.sendall(b"POST /split HTTP/1.1\r\nHost: test\r\nTransfer-Encoding: chunked\r\n\r\n5\r\n%PDF-")
+        deadline = time.monotonic() + 5
+        while not service.metrics.active and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        status, headers, _ = _request(service, "POST", "/split", _read(make_pages_pdf(1)), wait_idle=False)
+        assert status == 503 and headers["Retry-After"] == str(pdf_service.RETRY_AFTER)
+        assert service.metrics.rejected == rejected + 1
+    finally:
+        uploader.close()
+    status, _, _ = _request(service, "POST", "/split", _read(make_pages_pdf(1)))
+    assert status == 200
+
+
+def test_metrics_count_requests_and_bytes(service, make_pages_pdf):
+    _wait_idle(service)
+    before = _metrics(service)
+    data = _read(make_pages_pdf(2))
+    _request(service, "POST", "/split?start=1", data)
+    _request(service, "POST", "/split?start=9", data)
+
+    def delta(name):
+        return float(after.get(name, 0)) - float(before.get(name, 0))
+
+    _wait_idle(service)  # Sayaçlar yanıt gönderildikten sonra güncellenir
+    after = _metrics(service)
+
+    assert delta('pdfworks_requests_total{endpoint="/split",code="200"}') == 1
+    assert delta('pdfworks_requests_total{endpoint="/split",code="422"}') == 1
+    assert delta('pdfworks_request_duration_seconds_count{endpoint="/split"}') == 2
+    assert delta("pdfworks_upload_bytes_total") == 2 * len(data)
+    assert delta("pdfworks_download_bytes_total") > 0
+    assert after["pdfworks_requests_active"] == "0" and after["pdfworks_jobs_in_flight"] == "0"
+    assert after["pdfworks_queue_capacity"] == "1" and after["pdfworks_workers"] == "1"
+
+
+@pytest.mark.parametrize("method, expected", [("GET", 404), ("HEAD", 501)])
+def test_expect_continue_on_other_methods_takes_no_slot(service, make_pages_pdf, method, expected):
+    for _ in range(3):
+        status, _, _ = _request(service, method, "/split", headers={"Expect": "100-continue"})
+        assert status == expected
+    assert service.metrics.active == 0
+
+    status, _, _ = _request(service, "POST", "/split", _read(make_pages_pdf(1)), {"Expect": "100-continue"})
+    assert status == 200
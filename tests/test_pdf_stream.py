@@ -0,0 +1,78 @@
+from PyPDF2 import PdfReader
+
+import pdf_stream
+from conftest import page_texts, pages_objects, stream, text_page, write_pdf
+
+
+def _radio_group_pdf(path):
+    # 6 numaralı alan iki pencere öğesinin (4 ve 5) /Parent'ıdır; öğeler de alanın /Kids'idir (döngü)
+    objects = {
+        3: b"<< /Type /Page /Parent 2 0 R /Contents 7 0 R /Annots [ 4 0 R 5 0 R ] >>",
+        4: b"<< /Type /Annot /Subtype /Widget /Rect [ 0 0 10 10 ] /Parent 6 0 R /AS /Off >>",
+        5: b"<< /Type /Annot /Subtype /Widget /Rect [ 20 0 30 10 ] /Parent 6 0 R /AS /Off >>",
+        6: b"<< /FT /Btn /T (group) /Ff 49152 /Kids [ 4 0 R 5 0 R ] >>",
+        7: stream(b"BT /F1 12 Tf 72 740 Td (Form) Tj ET"),
+    }
+    return write_pdf(path, objects, [3], catalog=b"/AcroForm << /Fields [ 6 0 R ] >>")
+
+
+def test_merge_keeps_pages_and_text(make_pages_pdf, tmp_path):
+    output = str(tmp_path / "merged.pdf")
+    stats = pdf_stream.stream_merge_pdfs([make_pages_pdf(3, "a.pdf"), make_pages_pdf(2, "b.pdf")], output)
+
+    reader = PdfReader(output, strict=True)
+    assert stats["pages"] == len(reader.pages) == 5
+    assert [page.extract_text().strip() for page in reader.pages] == [
+        "Page 1", "Page 2", "Page 3", "Page 1", "Page 2"]
+
+
+def test_cycle_back_references_are_kept(tmp_path):
+    output = str(tmp_path / "form.pdf")
+    pdf_stream.stream_merge_pdfs([_radio_group_pdf(str(tmp_path / "radio.pdf"))], output)
+
+    annots = PdfReader(output, strict=True).pages[0]["/Annots"]
+    widgets = [annot.get_object() for annot in annots]
+    parents = [widget["/Parent"].get_object() for widget in widgets]
+    for widget, parent in zip(widgets, parents):
+        assert parent["/T"] == "group"
+        assert widget.indirect_reference in [kid for kid in parent["/Kids"]]
+    assert parents[0].indirect_reference == parents[1].indirect_reference
+
+
+def test_self_reference_is_kept(tmp_path):
+    source = write_pdf(str(tmp_path / "self.pdf"), {
+        3: text_page(4).replace(b">>", b" /PieceInfo 5 0 R >>"),
+        4: stream(b"BT /F1 12 Tf 72 740 Td (Self) Tj ET"),
+        5: b"<< /Self 5 0 R /Name (loop) >>",
+    }, [3])
+    output = str(tmp_path / "out.pdf")
+    pdf_stream.stream_merge_pdfs([source], output)
+
+    info = PdfReader(output, strict=True).pages[0]["/PieceInfo"]
+    assert info["/Self"].get_object()["/Name"] == "loop"
+
+
+def test_dedup_writes_shared_objects_once(make_pages_pdf, tmp_path):
+    source = make_pages_pdf(4)
+    plain, deduped = str(tmp_path / "plain.pdf"), str(tmp_path / "dedup.pdf")
+    pdf_stream.stream_merge_pdfs([source, source], plain)
+    stats = pdf_stream.stream_merge_pdfs([source, source], deduped, dedup=True)
+
+    assert stats["duplicates"] > 0
+    assert len(PdfReader(deduped).pages) == 8
+    assert stats["bytes_written"] < len(open(plain, "rb").read())
+
+
+def test_page_listed_twice_in_kids_is_copied_twice(tmp_path):
+    objects, pages = pages_objects(2)
+    source = write_pdf(str(tmp_path / "repeated.pdf"), objects, [pages[0], pages[1], pages[0]])
+    output = str(tmp_path / "merged.pdf")
+    stats = pdf_stream.stream_merge_pdfs([source], output)
+
+    reader = PdfReader(output, strict=True)
+    assert stats["pages"] == 3
+    assert page_texts(reader) == ["Page 1", "Page 2", "Page 1"]
+    # Sayfalar ayrı nesnelerdir ama aynı içerik akışını paylaşır
+    first, third = reader.pages[0], reader.pages[2]
+    assert first.indirect_reference.idnum != third.indirect_reference.idnum
+    assert first.raw_get("/Contents").idnum == third.raw_get("/Contents").idnum
@@ -0,0 +1,51 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import search_cache
+from search_cache import ENGINE, VALIDATION, SearchCache
+
+
+def test_get_put_and_conditional_validators(tmp_path):
+    cache = SearchCache(str(tmp_path / "cache.sqlite3"))
+    assert cache.get(VALIDATION, "https://example.com/a.pdf") is None
+    cache.put(VALIDATION, "https://example.com/a.pdf", {"is_pdf": True, "message": None},
+              **search_cache.response_validators({"etag": '"v1"'}))
+
+    entry = cache.get(VALIDATION, "https://example.com/a.pdf")
+    assert entry.value == {"is_pdf": True, "message": None} and entry.fresh
+    assert entry.conditional_headers() == {"If-None-Match": '"v1"'}
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 1
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    cache = SearchCache(str(tmp_path / "cache.sqlite3"), max_bytes=500)
+    for index in range(10):
+        cache.put(ENGINE, f"query {index}", ["x" * 80])
+        cache.get(ENGINE, "query 0")  # İlk kayıt sürekli kullanılır, silinmemeli
+
+    stats = cache.stats()
+    assert stats["bytes"] <= 500 and stats["evictions"] > 0
+    assert cache.get(ENGINE, "query 0") is not None
+    assert cache.get(ENGINE, "query 1") is None
+
+
+def test_running_size_follows_replacements_and_reopen(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    cache = SearchCache(path, max_bytes=10000)
+    cache.put(ENGINE, "q", ["x" * 500])
+    cache.put(ENGINE, "q", ["x" * 100])  # Aynı anahtar: eski boyut toplamdan düşülür
+    assert cache._size == cache.stats()["bytes"]
+    cache.close()
+
+    reopened = SearchCache(path, max_bytes=10000)
+    assert reopened._size == reopened.stats()["bytes"]
+    reopened.clear()
+    assert reopened._size == 0
+
+
+def test_counters_are_exact_under_concurrency(tmp_path):
+    cache = SearchCache(str(tmp_path / "cache.sqlite3"))
+    cache.put(ENGINE, "hit", [])
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda index: cache.get(ENGINE, "hit" if index % 2 else "miss"), range(2000)))
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"]) == (1000, 1000)
@@ -0,0 +1,124 @@
+import asyncio
+import hashlib
+import re
+
+import content_dedup
+from search_pipeline import FetchResponse, SearchPipeline
+
+
+class FakeFetcher:
+    """
+    Ağa çıkmadan yanıt veren fetcher: pages {url: (durum, başlıklar, içerik)}; istekleri requests'e kaydeder.
+    200 yanıtlı sayfalarda Range istekleri 206 ile yanıtlanır.
+    """
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.requests = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        pass
+
+    async def fetch(self, method, url, headers=None, params=None, timeout=None, limit=None):
+        self.requests.append((method, url))
+        status, response_headers, content = self.pages.get(url, (404, {}, b""))
+        match = re.match(r"bytes=(\d*)-(\d*)", (headers or {}).get("Range", ""))
+        if match and status == 200:
+            size = len(content)
+            if match.group(1):
+                start, end = int(match.group(1)), min(int(match.group(2)) + 1, size)
+            else:
+                start, end = max(size - int(match.group(2)), 0), size
+            status, content = 206, content[start:end]
+            response_headers = dict(response_headers, **{"content-range": f"bytes {start}-{end - 1}/{size}"})
+        if limit is not None:
+            content = content[:limit]
+        return FetchResponse(status, response_headers, content if method != "HEAD" else b"", url)
+
+    async def fetch_sha256(self, url, headers=None, timeout=None, max_size=content_dedup.MAX_FULL_HASH):
+        self.requests.append(("SHA256", url))
+        status, _, content = self.pages.get(url, (404, {}, b""))
+        if status >= 400:
+            raise RuntimeError(f"HTTP {status}")
+        return None if len(content) > max_size else hashlib.sha256(content).hexdigest()
+
+
+def _engine_results(results):
+    """Her motor için sabit sonuç listesi döndüren parse ve motor tanımları."""
+    engines = [(name, f"https://{name}.example/search", {"q": "test"}) for name in results]
+    pages = {base_url: (200, {"content-type": "text/html"}, name.encode()) for name, base_url, _ in engines}
+    return engines, pages, lambda name, html: results[name]
+
+
+def _run(engines, parse, fetcher, **options):
+    errors = []
+    pipeline = SearchPipeline(engines, parse, fetcher=fetcher, on_error=errors.append, **options)
+    return asyncio.run(pipeline.run()), errors
+
+
+def test_malformed_result_url_is_skipped():
+    engines, pages, parse = _engine_results({
+        "a": [("Bad port", "http://example.com:99999/a.pdf", ""),
+              ("Bad IPv6", "http://[::1/b.pdf", ""),
+              ("Good", "https://example.com/c.pdf", "")],
+        "b": [("Other", "https://example.org/d.pdf", "")],
+    })
+    results, errors = _run(engines, parse, FakeFetcher(pages), verify=False, dedup=False)
+
+    assert sorted(url for _, url, _ in results) == ["https://example.com/c.pdf", "https://example.org/d.pdf"]
+    assert errors == []
+
+
+def test_requests_use_original_url_and_normalized_key_for_dedup():
+    signed = "https://cdn.example.com/Report.pdf?X-Amz-Expires=60&X-Amz-Signature=abc%2Fd&utm_source=x"
+    reordered = "https://CDN.example.com/Report.pdf?utm_source=y&X-Amz-Signature=abc%2Fd&X-Amz-Expires=60"
+    wrapped = "https://www.google.com/url?q=" + "https%3A%2F%2Fexample.org%2Fpaper.pdf%3Fb%3D2%26a%3D1"
+    engines, pages, parse = _engine_results({
+        "a": [("Signed", signed, ""), ("Wrapped", wrapped, "")],
+        "b": [("Same file", reordered, "")],
+    })
+    pdf = (200, {"content-type": "application/pdf"}, b"%PDF-1.4")
+    pages[signed] = pages["https://example.org/paper.pdf?b=2&a=1"] = pdf
+    fetcher = FakeFetcher(pages)
+    results, _ = _run(engines, parse, fetcher, dedup=False)
+
+    assert [url for _, url, _ in results] == [signed, "https://example.org/paper.pdf?b=2&a=1"]
+    checked = [url for method, url in fetcher.requests if method == "HEAD"]
+    assert sorted(checked) == sorted([signed, "https://example.org/paper.pdf?b=2&a=1"])
+
+
+def _mirrors():
+    """a ve b aynı dosya; c'nin boyutu, başı ve sonu aynı ama ortası farklı (parmak izi çakışması)."""
+    head, tail = b"%PDF-1.4 " + b"h" * 2048, b"t" * 2048 + b"%%EOF"
+    engines, pages, parse = _engine_results({
+        "a": [("A", "https://a.example/doc.pdf", ""), ("C", "https://c.example/doc.pdf", "")],
+        "b": [("B", "https://b.example/doc.pdf", "")],
+    })
+    pdf = {"content-type": "application/pdf"}
+    pages["https://a.example/doc.pdf"] = pages["https://b.example/doc.pdf"] = (200, pdf, head + b"same" + tail)
+    pages["https://c.example/doc.pdf"] = (200, pdf, head + b"diff" + tail)
+    return engines, pages, parse
+
+
+def test_fingerprint_collisions_are_resolved_with_streamed_hashes():
+    engines, pages, parse = _mirrors()
+    fetcher = FakeFetcher(pages)
+    results, _ = _run(engines, parse, fetcher)
+
+    assert sorted(url for _, url, _ in results) == ["https://a.example/doc.pdf", "https://c.example/doc.pdf"]
+    hashed = {url for method, url in fetcher.requests if method == "SHA256"}
+    assert hashed == {"https://a.example/doc.pdf", "https://b.example/doc.pdf", "https://c.example/doc.pdf"}
+
+
+def test_files_over_hash_limit_are_not_downloaded(monkeypatch):
+    monkeypatch.setattr(content_dedup, "MAX_FULL_HASH", 1024)
+    engines, pages, parse = _mirrors()
+    fetcher = FakeFetcher(pages)
+    results, _ = _run(engines, parse, fetcher)
+
+    # Boyut parmak izinden bilinir: tam özet istenmez, eşleşen parmak izi yinelenme sayılır
+    assert len(results) == 1
+    assert not [url for method, url in fetcher.requests if method == "SHA256"]
@@ -0,0 +1,96 @@
+# Gerekli kütüphaneler: yok (yalnızca standart kütüphane)
+#
+# Arama sonuçlarındaki URL'leri karşılaştırılabilir tek bir biçime getirir: arama motorlarının
+# yönlendirme sarmalayıcılarını (Google /url, Bing /ck/a, DuckDuckGo /l/, Yandex /r.xml) açar,
+# izleme parametrelerini atar ve şema/sunucu yazımını sadeleştirir. Aynı dosyayı gösteren iki
+# sonucun aynı anahtara düşmesi bu modüle bağlıdır.
+
+import base64
+import binascii
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# (sunucu adı parçası, yol öneki, hedef URL'yi taşıyan parametreler)
+# Sunucu adı boş olan (göreceli) bağlantılar sonuç sayfasının kendi sunucusuna aittir.
+REDIRECT_WRAPPERS = [
+    ("google.", "/url", ("q", "url")),
+    ("bing.com", "/ck/a", ("u",)),
+    ("duckduckgo.com", "/l/", ("uddg", "kh")),
+    ("yandex.", "/r.xml", ("u",)),
+    ("yandex.", "/clck/jsredir", ("url",)),
+]
+
+TRACKING_PARAMS = {
+    "gclid", "dclid", "gbraid", "wbraid", "fbclid", "msclkid", "yclid", "ysclid",
+    "mc_cid", "mc_eid", "_ga", "_gl", "igshid", "ref_src", "spm",
+}
+TRACKING_PREFIXES = ("utm_",)
+
+DEFAULT_PORTS = {"http": 80, "https": 443}
+MAX_UNWRAP_DEPTH = 4  # İç içe yönlendirmeler için üst sınır
+
+
+def _wrapper_params(parts):
+    host = parts.netloc.lower()
+    for host_part, path_prefix, params in REDIRECT_WRAPPERS:
+        if parts.path.startswith(path_prefix) and (not host or host_part in host):
+            return params
+    return None
+
+
+def _decode_bing_target(value):
+    # Bing hedefi "a1" önekli, dolgusuz URL-güvenli base64 olarak taşır
+    if value.startswith("a1"):
+        encoded = value[2:]
+        try:
+            return base64.urlsafe_b64decode(encoded + "=" * (-len(encoded) % 4)).decode("utf-8")
+        except (binascii.Error, ValueError):
+            return None
+    return value
+
+
+def unwrap_redirect(url):
+    """Arama motoru yönlendirme bağlantısından asıl hedef URL'yi çıkarır; sarmalayıcı değilse URL'yi aynen döndürür."""
+    for _ in range(MAX_UNWRAP_DEPTH):
+        parts = urlsplit(url)
+        params = _wrapper_params(parts)
+        if params is None:
+            return url
+        query = dict(parse_qsl(parts.query))
+        target = next((query[name] for name in params if query.get(name)), None)
+        if target and "bing.com" in parts.netloc.lower():
+            target = _decode_bing_target(target)
+        if not target or not urlsplit(target).scheme:
+            return url
+        url = target
+    return url
+
+
+def _is_tracking_param(name):
+    name = name.lower()
+    return name in TRACKING_PARAMS or name.startswith(TRACKING_PREFIXES)
+
+
+def normalize_url(url):
+    """
+    Yönlendirmeyi açar, izleme parametrelerini ve parça (#...) kısmını atar, şema ile sunucu adını
+    küçük harfe çevirir, varsayılan portu kaldırır ve kalan sorgu parametrelerini sıralar.
+    """
+    url = unwrap_redirect(url.strip())
+    parts = urlsplit(url)
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    if ":" in host:
+        host = f"[{host}]"  # IPv6 adresi
+    if parts.port and parts.port != DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{parts.port}"
+    query = sorted((name, value) for name, value in parse_qsl(parts.query, keep_blank_values=True)
+                   if not _is_tracking_param(name))
+    return urlunsplit((scheme, host, parts.path or "/", urlencode(query), ""))
+
+
+def is_pdf_url(url):
+    """Bağlantının (yönlendirme açıldıktan sonra) bir PDF dosyasını gösterip göstermediğini tahmin eder."""
+    if not url:
+        return False
+    parts = urlsplit(unwrap_redirect(url))
+    return parts.path.lower().endswith(".pdf")